@@ -5,7 +5,8 @@ parses .mat output into UnifiedResult.
 
 Pipeline:
 1. Generate MRST .m script (via mrst_script_generator)
-2. Run `octave --no-gui script.m` subprocess
+2. Run `octave --no-gui script.m` subprocess — or, with
+   MRST_PERSISTENT_OCTAVE=1, feed it to one long-lived Octave session
 3. Parse results.mat via scipy.io.loadmat
 4. Return UnifiedResult
 
@@ -15,7 +16,9 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Optional
@@ -52,6 +55,9 @@ class MRSTBackend(SimulatorBackend):
         timeout_seconds: Maximum simulation runtime (default: 900).
         use_docker: Run via Docker instead of local binary.
         docker_image: Docker image name when use_docker=True.
+        persistent: Keep one Octave session alive and run scripts in it,
+            paying Octave startup and MRST path setup once. Defaults to
+            the MRST_PERSISTENT_OCTAVE env var. Ignored with use_docker.
     """
 
     adapter_type: str = "simulator"
@@ -63,6 +69,7 @@ class MRSTBackend(SimulatorBackend):
         timeout_seconds: int = 900,
         use_docker: bool = False,
         docker_image: str = "mrst-octave:latest",
+        persistent: Optional[bool] = None,
     ) -> None:
         self._octave_binary = octave_binary
         self._mrst_dir = mrst_dir or os.environ.get("MRST_DIR", "")
@@ -70,6 +77,13 @@ class MRSTBackend(SimulatorBackend):
         self._use_docker = use_docker
         self._docker_image = docker_image
         self._octave_available: Optional[bool] = None
+        if persistent is None:
+            persistent = (
+                os.environ.get("MRST_PERSISTENT_OCTAVE", "").lower() in ("1", "true", "yes")
+            )
+        self._session: Optional[_OctaveSession] = None
+        if persistent and not use_docker:
+            self._session = _OctaveSession(octave_binary)
 
     @property
     def name(self) -> str:
@@ -204,37 +218,20 @@ class MRSTBackend(SimulatorBackend):
         if self._mrst_dir:
             env["MRST_DIR"] = self._mrst_dir
 
-        if self._use_docker:
-            cmd = self._docker_command(work_path, script_name)
-        else:
-            cmd = [
-                self._octave_binary,
-                "--no-gui",
-                "--no-window-system",
-                "--silent",
-                script_path,
-            ]
-
-        logger.info(f"Running: {' '.join(cmd)}")
         t_start = time.time()
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-                cwd=work_dir,
-                env=env,
-            )
-        except subprocess.TimeoutExpired:
-            raise RuntimeError(
-                f"MRST/Octave timeout after {self._timeout}s"
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                f"GNU Octave not found: {self._octave_binary}. "
-                "Install via: apt install octave"
+        session = self._session
+        if session is not None and session.lock.acquire(blocking=False):
+            # Concurrent jobs fall through to a one-shot process below
+            logger.info(f"Running in persistent Octave session: {script_path}")
+            try:
+                returncode, stdout, stderr = session.run_script(
+                    script_path, work_dir, env, self._timeout,
+                )
+            finally:
+                session.lock.release()
+        else:
+            returncode, stdout, stderr = self._run_oneshot(
+                work_path, script_name, script_path, env,
             )
 
         wall_time = time.time() - t_start
@@ -251,30 +248,30 @@ class MRSTBackend(SimulatorBackend):
 
         # Check for errors
         errors = []
-        if result.returncode != 0:
-            errors.append(f"octave exit code: {result.returncode}")
-            if result.stderr:
+        if returncode != 0:
+            errors.append(f"octave exit code: {returncode}")
+            if stderr:
                 errors.extend(
                     line.strip()
-                    for line in result.stderr.splitlines()[:10]
+                    for line in stderr.splitlines()[:10]
                     if line.strip()
                 )
 
         if on_progress:
             on_progress(90)
 
-        converged = result.returncode == 0 and "mat" in output_files
+        converged = returncode == 0 and "mat" in output_files
 
         return {
             "script_name": script_name,
             "work_dir": work_dir,
             "output_files": output_files,
             "wall_time_seconds": wall_time,
-            "exit_code": result.returncode,
+            "exit_code": returncode,
             "converged": converged,
             "errors": errors[:10],
-            "stdout": result.stdout[-2000:] if result.stdout else "",
-            "stderr": result.stderr[-2000:] if result.stderr else "",
+            "stdout": stdout[-2000:] if stdout else "",
+            "stderr": stderr[-2000:] if stderr else "",
         }
 
     def parse_result(
@@ -470,8 +467,53 @@ class MRSTBackend(SimulatorBackend):
             ),
         )
 
+    def close(self) -> None:
+        """Shut down the persistent Octave session, if any."""
+        if self._session is not None:
+            self._session.close()
+
     # ─── Helpers ──────────────────────────────────────────────────────
 
+    def _run_oneshot(
+        self,
+        work_path: Path,
+        script_name: str,
+        script_path: str,
+        env: dict[str, str],
+    ) -> tuple[int, str, str]:
+        """Run the script in a fresh Octave (or Docker) process."""
+        if self._use_docker:
+            cmd = self._docker_command(work_path, script_name)
+        else:
+            cmd = [
+                self._octave_binary,
+                "--no-gui",
+                "--no-window-system",
+                "--silent",
+                script_path,
+            ]
+
+        logger.info(f"Running: {' '.join(cmd)}")
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._timeout,
+                cwd=str(work_path),
+                env=env,
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(
+                f"MRST/Octave timeout after {self._timeout}s"
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"GNU Octave not found: {self._octave_binary}. "
+                "Install via: apt install octave"
+            )
+        return result.returncode, result.stdout, result.stderr
+
     def _docker_command(self, work_path: Path, script_name: str) -> list[str]:
         """Build Docker run command."""
         return [
@@ -484,6 +526,149 @@ class MRSTBackend(SimulatorBackend):
         ]
 
 
+class _OctaveSession:
+    """A long-lived Octave process that runs scripts sent over stdin.
+
+    Each script runs inside try/catch and is followed by a sentinel line
+    carrying its status, so the session survives script errors. Octave's
+    stderr is merged into stdout; a caught error is echoed as ``error: …``.
+    The process is (re)started on demand and killed on timeout. Environment
+    changes between jobs are applied with setenv/unsetenv before each script.
+    """
+
+    _SENTINEL = "__CLARISSA_DONE__"
+
+    def __init__(self, octave_binary: str) -> None:
+        self._octave_binary = octave_binary
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: queue.SimpleQueue = queue.SimpleQueue()
+        self._env: dict[str, str] = {}  # environment the session currently has
+        self.lock = threading.Lock()
+
+    def run_script(
+        self,
+        script_path: str,
+        work_dir: str,
+        env: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, str]:
+        """Run one script in the session; returns (status, stdout, stderr)."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._start(env)
+
+        command = (
+            self._env_commands(env)
+            # Keep mrst_dir: the startup section reuses it once MRST is on the path
+            + "clear -x mrst_dir; "
+            f"cd('{_octave_quote(work_dir)}'); "
+            "try, "
+            f"run('{_octave_quote(script_path)}'); clarissa_status = 0; "
+            "catch clarissa_err, "
+            "fprintf('error: %s\\n', clarissa_err.message); clarissa_status = 1; "
+            "end; "
+            f"fprintf('\\n{self._SENTINEL} %d\\n', clarissa_status); fflush(stdout);\n"
+        )
+        try:
+            self._proc.stdin.write(command)
+            self._proc.stdin.flush()
+        except OSError as e:
+            self._kill()
+            raise RuntimeError(f"Octave session died: {e}")
+
+        output: list[str] = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._kill()
+                raise RuntimeError(f"MRST/Octave timeout after {timeout}s")
+            if line is None:
+                # Octave exited mid-script
+                returncode = self._proc.wait() or 1
+                self._proc = None
+                text = "".join(output)
+                return returncode, text, text
+            if line.startswith(self._SENTINEL):
+                status = int(line.split()[1])
+                text = "".join(output)
+                return status, text, (text if status else "")
+            output.append(line)
+
+    def _env_commands(self, env: dict[str, str]) -> str:
+        """Octave setenv/unsetenv calls turning the session's environment into ``env``."""
+        parts = [
+            f"setenv('{_octave_quote(key)}', '{_octave_quote(value)}'); "
+            for key, value in env.items()
+            if self._env.get(key) != value
+        ]
+        parts.extend(
+            f"unsetenv('{_octave_quote(key)}'); " for key in self._env.keys() - env.keys()
+        )
+        self._env = dict(env)
+        return "".join(parts)
+
+    def close(self) -> None:
+        """End the session; Octave exits on stdin EOF."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc = None
+
+    def _start(self, env: dict[str, str]) -> None:
+        cmd = [
+            self._octave_binary,
+            "--no-gui",
+            "--no-window-system",
+            "--silent",
+            "--no-line-editing",
+        ]
+        logger.info(f"Starting persistent Octave session: {' '.join(cmd)}")
+        try:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                env=env,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"GNU Octave not found: {self._octave_binary}. "
+                "Install via: apt install octave"
+            )
+        self._lines = queue.SimpleQueue()
+        self._env = dict(env)
+        threading.Thread(
+            target=self._pump,
+            args=(self._proc, self._lines),
+            name="clarissa-octave-session",
+            daemon=True,
+        ).start()
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc = None
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, lines: queue.SimpleQueue) -> None:
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+
+def _octave_quote(text: str) -> str:
+    """Escape text for a single-quoted Octave string."""
+    return text.replace("'", "''")
+
+
 # ─── Auto-register on import ─────────────────────────────────────────────
 
 def _auto_register() -> None:
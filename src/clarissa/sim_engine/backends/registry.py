@@ -17,6 +17,13 @@ logger = logging.getLogger(__name__)
 
 _registry: Optional[AdapterRegistry] = None
 
+# Backend names cached per (registry, size). Adapters are never removed,
+# so a size change is the only way the name set can change — including
+# registrations that go to the registry directly (e.g. SimEngine.register).
+_names_key: tuple[Optional[AdapterRegistry], int] = (None, -1)
+_names_ordered: tuple[str, ...] = ()
+_names_set: frozenset[str] = frozenset()
+
 
 def get_registry() -> AdapterRegistry:
     """Get or create the simulator backend registry."""
@@ -48,4 +55,20 @@ def get_backend(name: str) -> SimulatorBackend:
 
 def list_backends() -> list[str]:
     """List registered backend names."""
-    return get_registry().list_names("simulator")
+    return list(_backend_names()[0])
+
+
+def backend_names_set() -> frozenset[str]:
+    """Registered backend names as a frozenset, for O(1) membership checks."""
+    return _backend_names()[1]
+
+
+def _backend_names() -> tuple[tuple[str, ...], frozenset[str]]:
+    global _names_key, _names_ordered, _names_set
+    registry = get_registry()
+    key = (registry, len(registry))
+    if key != _names_key:
+        _names_ordered = tuple(registry.list_names("simulator"))
+        _names_set = frozenset(_names_ordered)
+        _names_key = key
+    return _names_ordered, _names_set
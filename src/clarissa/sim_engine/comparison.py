@@ -382,47 +382,120 @@ def _compare_arrays(
     b: list[float],
     field_name: str,
 ) -> FieldMetrics:
-    """Compare two float arrays element-wise."""
+    """Compare two float arrays element-wise.
+
+    Uses numpy when available so the per-cell work runs in C; falls back
+    to a pure-Python pass otherwise. Cells where either value is NaN or
+    infinite (e.g. NaN-filled pressure rows) are skipped, so ``count`` is
+    the number of cells compared; ``max_error_index`` indexes the inputs.
+    """
     n = min(len(a), len(b))
     if n == 0:
         return FieldMetrics(field_name=field_name, count=0)
 
+    try:
+        import numpy as np
+    except ImportError:
+        return _compare_arrays_py(a, b, field_name, n)
+
+    va = np.asarray(a[:n], dtype=np.float64)
+    vb = np.asarray(b[:n], dtype=np.float64)
+    cells = None
+    finite = np.isfinite(va) & np.isfinite(vb)
+    if not finite.all():
+        cells = np.flatnonzero(finite)
+        if cells.size == 0:
+            return FieldMetrics(field_name=field_name, count=0)
+        va, vb = va[cells], vb[cells]
+    diff = va - vb
+    abs_diff = np.abs(diff)
+    max_pos = int(np.argmax(abs_diff))
+    mean_a = float(va.mean())
+    centered = va - mean_a
+
+    return _field_metrics(
+        field_name,
+        va.size,
+        sum_sq_diff=float(diff @ diff),
+        sum_abs_diff=float(abs_diff.sum()),
+        max_diff=float(abs_diff[max_pos]),
+        max_idx=max_pos if cells is None else int(cells[max_pos]),
+        mean_a=mean_a,
+        mean_b=float(vb.mean()),
+        data_range=float(va.max() - va.min()),
+        ss_tot=float(centered @ centered),
+    )
+
+
+def _compare_arrays_py(
+    a: list[float],
+    b: list[float],
+    field_name: str,
+    n: int,
+) -> FieldMetrics:
+    """Pure-Python fallback for _compare_arrays."""
+    cells = [i for i in range(n) if math.isfinite(a[i]) and math.isfinite(b[i])]
+    if not cells:
+        return FieldMetrics(field_name=field_name, count=0)
+    count = len(cells)
+    values_a = [a[i] for i in cells]
+
     sum_sq_diff = 0.0
     sum_abs_diff = 0.0
     max_diff = 0.0
-    max_idx = 0
+    max_idx = cells[0]
     sum_a = 0.0
     sum_b = 0.0
-    sum_sq_a = 0.0
-    mean_b_accum = 0.0
 
-    for i in range(n):
+    for i in cells:
         diff = a[i] - b[i]
         abs_diff = abs(diff)
         sum_sq_diff += diff * diff
         sum_abs_diff += abs_diff
         sum_a += a[i]
         sum_b += b[i]
-        sum_sq_a += a[i] * a[i]
 
         if abs_diff > max_diff:
             max_diff = abs_diff
             max_idx = i
 
-    mean_a = sum_a / n
-    mean_b = sum_b / n
-    mse = sum_sq_diff / n
-    rmse = math.sqrt(mse)
+    mean_a = sum_a / count
+
+    return _field_metrics(
+        field_name,
+        count,
+        sum_sq_diff=sum_sq_diff,
+        sum_abs_diff=sum_abs_diff,
+        max_diff=max_diff,
+        max_idx=max_idx,
+        mean_a=mean_a,
+        mean_b=sum_b / count,
+        data_range=max(values_a) - min(values_a),
+        ss_tot=sum((v - mean_a) ** 2 for v in values_a),
+    )
+
+
+def _field_metrics(
+    field_name: str,
+    n: int,
+    *,
+    sum_sq_diff: float,
+    sum_abs_diff: float,
+    max_diff: float,
+    max_idx: int,
+    mean_a: float,
+    mean_b: float,
+    data_range: float,
+    ss_tot: float,
+) -> FieldMetrics:
+    """Derive NRMSE / MAE / R² from the accumulated sums."""
+    rmse = math.sqrt(sum_sq_diff / n)
 
     # NRMSE: normalize by range of reference values
-    a_min = min(a[:n])
-    a_max = max(a[:n])
-    data_range = a_max - a_min
     nrmse = rmse / data_range if data_range > 1e-10 else (0.0 if rmse < 1e-10 else 1.0)
 
     # R²: coefficient of determination
     ss_res = sum_sq_diff
-    ss_tot = sum((a[i] - mean_a) ** 2 for i in range(n))
     r_squared = 1.0 - (ss_res / ss_tot) if ss_tot > 1e-10 else (1.0 if ss_res < 1e-10 else 0.0)
 
     return FieldMetrics(
@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import logging
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import numpy as np
 
@@ -66,23 +68,19 @@ def read_summary(smspec_path: str) -> dict[str, Any]:
     Returns:
         {
             "wells": ["PROD", "INJ", ...],
-            "days": [30.0, 60.0, ...],
+            "days": np.array([30.0, 60.0, ...]),
             "dates": [datetime, ...],
-            "keys": ["FOPR", "WBHP:PROD", ...],
-            "vectors": {"FOPR": np.array, "WBHP:PROD": np.array, ...},
+            "keys": ("FOPR", "WBHP:PROD", ...),
+            "matrix": np.array of shape (n_keys, n_steps), rows in key order,
+            "vectors": {"FOPR": row view, "WBHP:PROD": row view, ...},
             "unit_system": "FIELD" | "METRIC" | "LAB",
         }
     """
     from resdata.summary import Summary
 
     s = Summary(smspec_path)
-
-    vectors = {}
-    for key in s.keys():
-        try:
-            vectors[key] = s.numpy_vector(key)
-        except Exception as e:
-            logger.warning(f"Failed to read summary key {key}: {e}")
+    keys, matrix = _summary_matrix(s)
+    vectors = {key: matrix[row] for row, key in enumerate(keys)}
 
     # Detect unit system
     unit_system = "FIELD"  # default
@@ -99,15 +97,47 @@ def read_summary(smspec_path: str) -> dict[str, Any]:
 
     return {
         "wells": list(s.wells()),
-        "days": list(s.days),
-        "dates": list(s.dates),
-        "keys": list(s.keys()),
+        "days": np.asarray(s.days, dtype=np.float64),
+        "dates": s.dates,
+        "keys": keys,
+        "matrix": matrix,
         "vectors": vectors,
         "unit_system": unit_system,
         "length": len(s),
     }
 
 
+def _summary_matrix(s: Any) -> tuple[tuple[str, ...], np.ndarray]:
+    """Fetch all summary vectors as one (n_keys, n_steps) float64 matrix.
+
+    Uses resdata's bulk frame fill (a single native call for every key);
+    falls back to one numpy_vector() call per key if that is unavailable.
+    Keys that fail to load are dropped.
+    """
+    try:
+        frame = s.pandas_frame()
+        return (
+            tuple(frame.columns),
+            np.ascontiguousarray(frame.to_numpy(dtype=np.float64).T),
+        )
+    except Exception as e:
+        logger.debug(f"Bulk summary fetch unavailable, reading per key: {e}")
+
+    keys = []
+    rows = []
+    for key in s.keys():
+        try:
+            rows.append(s.numpy_vector(key))
+            keys.append(key)
+        except Exception as e:
+            logger.warning(f"Failed to read summary key {key}: {e}")
+
+    matrix = np.empty((len(rows), len(s)), dtype=np.float64)
+    for row, vector in enumerate(rows):
+        matrix[row] = vector
+    return tuple(keys), matrix
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Restart Reader (.UNRST)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -175,8 +205,9 @@ def read_eclipse_output(
         base = base.with_suffix("")
 
     # Find output files
-    smspec = _find_file(base, [".SMSPEC"])
-    unrst = _find_file(base, [".UNRST"])
+    scan = _scan_case(base)
+    smspec = scan.get(".SMSPEC")
+    unrst = scan.get(".UNRST")
 
     if not smspec and not unrst:
         return _error_result(
@@ -207,7 +238,9 @@ def read_eclipse_output(
             logger.error(f"Failed to read restart: {e}")
 
     # Build timestep results
-    timesteps = _build_timesteps(summary, restart_steps, is_field, request)
+    timesteps, pressure_matrix = _build_timesteps(
+        summary, restart_steps, is_field, request
+    )
 
     if not timesteps:
         return _error_result("No timesteps extracted from output", request)
@@ -225,6 +258,7 @@ def read_eclipse_output(
         status=SimStatus.COMPLETED,
         request=request or _minimal_request(n_cells),
         timesteps=timesteps,
+        pressure_matrix=pressure_matrix,
         metadata=SimMetadata(
             backend="opm",
             backend_version="resdata-reader",
@@ -246,89 +280,54 @@ def _build_timesteps(
     restart_steps: list[dict],
     is_field: bool,
     request: Optional[SimRequest],
-) -> list[TimestepResult]:
-    """Build TimestepResult list from summary + restart data."""
+) -> tuple[list[TimestepResult], Optional[np.ndarray]]:
+    """Build TimestepResult list from summary + restart data.
+
+    Returns the timesteps together with the (n_steps, n_cells) pressure
+    matrix in bar; each step's ``cells.pressure`` is taken from its row.
+    Steps are independent, so they are built on a thread pool; ``map``
+    keeps them in report order.
+    """
     conv_p = _psi_to_bar if is_field else (lambda x: x)
-    conv_oil = _stbd_to_m3d if is_field else (lambda x: x)
-    conv_gas = _mscfd_to_m3d if is_field else (lambda x: x)
-    conv_water = _stbd_to_m3d if is_field else (lambda x: x)
 
     timesteps = []
+    pressure_matrix = None
 
     if summary:
         days = summary["days"]
-        vectors = summary["vectors"]
-        wells = summary.get("wells", [])
-
-        for step_idx in range(len(days)):
-            time_days = days[step_idx]
 
-            # Cell data from restart (if matching step exists)
-            cells = CellData()
-            if step_idx < len(restart_steps):
-                rst = restart_steps[step_idx]
-                if "PRESSURE" in rst:
-                    p = rst["PRESSURE"].astype(float)
-                    cells.pressure = [conv_p(v) for v in p]
-                if "SWAT" in rst:
-                    cells.saturation_water = rst["SWAT"].astype(float).tolist()
-                if "SGAS" in rst:
-                    cells.saturation_gas = rst["SGAS"].astype(float).tolist()
-                if cells.saturation_water:
-                    sg = cells.saturation_gas or [0.0] * len(cells.saturation_water)
-                    cells.saturation_oil = [
-                        max(0.0, 1.0 - sw - sgas)
-                        for sw, sgas in zip(cells.saturation_water, sg)
-                    ]
-
-            # Well data from summary
-            well_data = []
-            for wname in wells:
-                wd = WellData(well_name=wname)
-
-                # BHP
-                bhp_key = f"WBHP:{wname}"
-                if bhp_key in vectors:
-                    wd.bhp_bar = conv_p(float(vectors[bhp_key][step_idx]))
-
-                # Oil rate
-                opr_key = f"WOPR:{wname}"
-                if opr_key in vectors:
-                    wd.oil_rate_m3_day = conv_oil(float(vectors[opr_key][step_idx]))
-
-                # Water rate (production or injection)
-                wpr_key = f"WWPR:{wname}"
-                wir_key = f"WWIR:{wname}"
-                if wpr_key in vectors:
-                    wd.water_rate_m3_day = conv_water(float(vectors[wpr_key][step_idx]))
-                elif wir_key in vectors:
-                    wd.water_rate_m3_day = conv_water(float(vectors[wir_key][step_idx]))
-
-                # Gas rate
-                gpr_key = f"WGPR:{wname}"
-                gir_key = f"WGIR:{wname}"
-                if gpr_key in vectors:
-                    wd.gas_rate_m3_day = conv_gas(float(vectors[gpr_key][step_idx]))
-                elif gir_key in vectors:
-                    wd.gas_rate_m3_day = conv_gas(float(vectors[gir_key][step_idx]))
-
-                well_data.append(wd)
+        pressure_matrix = _pressure_matrix(
+            restart_steps[:len(days)], conv_p(1.0)
+        )
 
-            timesteps.append(TimestepResult(
-                time_days=time_days,
-                cells=cells,
-                wells=well_data,
-            ))
+        process_step = _make_step_processor(
+            days=days,
+            vectors=summary["vectors"],
+            well_keys=_well_keys(summary.get("wells", [])),
+            restart_steps=restart_steps,
+            pressure_matrix=pressure_matrix,
+            is_field=is_field,
+        )
+        n_steps = len(days)
+        if n_steps > 1:
+            workers = min(os.cpu_count() or 1, n_steps)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                timesteps = list(ex.map(process_step, range(n_steps)))
+        else:
+            timesteps = [process_step(step_idx) for step_idx in range(n_steps)]
 
     elif restart_steps:
         # Restart only, no summary — limited data
+        pressure_matrix = _pressure_matrix(restart_steps, conv_p(1.0))
+
         for step_idx, rst in enumerate(restart_steps):
             cells = CellData()
             if "PRESSURE" in rst:
-                p = rst["PRESSURE"].astype(float)
-                cells.pressure = [_psi_to_bar(v) if is_field else v for v in p]
+                cells.pressure = pressure_matrix[step_idx].tolist()
             if "SWAT" in rst:
-                cells.saturation_water = rst["SWAT"].astype(float).tolist()
+                cells.saturation_water = (
+                    rst["SWAT"].astype(np.float32, copy=False).tolist()
+                )
 
             timesteps.append(TimestepResult(
                 time_days=float(step_idx + 1) * 30.0,  # Estimate
@@ -336,16 +335,145 @@ def _build_timesteps(
                 wells=[],
             ))
 
-    return timesteps
+    return timesteps, pressure_matrix
+
+
+def _make_step_processor(
+    *,
+    days: np.ndarray,
+    vectors: dict[str, np.ndarray],
+    well_keys: list[dict[str, str]],
+    restart_steps: list[dict],
+    pressure_matrix: Optional[np.ndarray],
+    is_field: bool,
+) -> Callable[[int], TimestepResult]:
+    """Specialize the per-step builder for this case's schema.
+
+    Which summary vector feeds each well quantity (e.g. WWPR vs. WWIR)
+    and the unit conversion are fixed for the whole run, so they are
+    resolved once here: every well gets four SI series, with missing
+    quantities backed by zeros. The returned closure then only indexes.
+    """
+    n_steps = len(days)
+    zeros = np.zeros(n_steps)
+    p_scale = _psi_to_bar(1.0) if is_field else 1.0
+    liquid_scale = _stbd_to_m3d(1.0) if is_field else 1.0
+    gas_scale = _mscfd_to_m3d(1.0) if is_field else 1.0
+
+    def series(candidates: tuple[str, ...], scale: float) -> np.ndarray:
+        for key in candidates:
+            if key in vectors:
+                return np.asarray(vectors[key], dtype=np.float64) * scale
+        return zeros
+
+    well_series = [
+        (
+            keys["name"],
+            series((keys["bhp"],), p_scale),
+            series((keys["opr"],), liquid_scale),
+            series((keys["wpr"], keys["wir"]), liquid_scale),
+            series((keys["gpr"], keys["gir"]), gas_scale),
+        )
+        for keys in well_keys
+    ]
+    n_restart = len(restart_steps)
+
+    def process_step(step_idx: int) -> TimestepResult:
+        # Cell data from restart (if matching step exists)
+        cells = CellData()
+        if step_idx < n_restart:
+            rst = restart_steps[step_idx]
+            if "PRESSURE" in rst:
+                cells.pressure = pressure_matrix[step_idx].tolist()
+            swat = sgas = None
+            if "SWAT" in rst:
+                swat = rst["SWAT"].astype(np.float32, copy=False)
+                cells.saturation_water = swat.tolist()
+            if "SGAS" in rst:
+                sgas = rst["SGAS"].astype(np.float32, copy=False)
+                cells.saturation_gas = sgas.tolist()
+            if swat is not None and swat.size:
+                soil = 1.0 - swat if sgas is None else 1.0 - swat - sgas
+                cells.saturation_oil = np.maximum(soil, 0.0).tolist()
+
+        # Well data from summary
+        well_data = [
+            WellData(
+                well_name=name,
+                bhp_bar=float(bhp[step_idx]),
+                oil_rate_m3_day=float(oil[step_idx]),
+                water_rate_m3_day=float(water[step_idx]),
+                gas_rate_m3_day=float(gas[step_idx]),
+            )
+            for name, bhp, oil, water, gas in well_series
+        ]
+
+        return TimestepResult(
+            time_days=float(days[step_idx]),
+            cells=cells,
+            wells=well_data,
+        )
+
+    return process_step
 
 
-def _find_file(base: Path, extensions: list[str]) -> Optional[Path]:
-    """Find Eclipse output file by trying extensions."""
-    for ext in extensions:
-        path = base.with_suffix(ext)
-        if path.exists():
-            return path
-    return None
+def _well_keys(wells: list[str]) -> list[dict[str, str]]:
+    """Pre-build the summary vector keys for each well, once per read."""
+    return [
+        {
+            "name": w,
+            "bhp": f"WBHP:{w}",
+            "opr": f"WOPR:{w}",
+            "wpr": f"WWPR:{w}",
+            "wir": f"WWIR:{w}",
+            "gpr": f"WGPR:{w}",
+            "gir": f"WGIR:{w}",
+        }
+        for w in wells
+    ]
+
+
+def _pressure_matrix(
+    restart_steps: list[dict],
+    scale: float,
+) -> Optional[np.ndarray]:
+    """Stack per-step PRESSURE arrays into one (n_steps, n_cells) matrix.
+
+    The matrix is allocated once and filled row by row, with the unit
+    conversion applied as a single in-place multiply. Steps without a
+    PRESSURE record are left as NaN rows. Returns None only when no step
+    has a PRESSURE record; empty records give an (n_steps, 0) matrix.
+    """
+    first = next((rst["PRESSURE"] for rst in restart_steps if "PRESSURE" in rst), None)
+    if first is None:
+        return None
+    n_cells = len(first)
+
+    matrix = np.full((len(restart_steps), n_cells), np.nan, dtype=np.float32)
+    for step_idx, rst in enumerate(restart_steps):
+        if "PRESSURE" in rst:
+            matrix[step_idx] = rst["PRESSURE"]
+    if scale != 1.0:
+        matrix *= scale
+    return matrix
+
+
+def _scan_case(base: Path) -> dict[str, Path]:
+    """Map output suffixes (upper-cased) to files for a case base name.
+
+    One directory listing replaces a stat() per candidate extension.
+    """
+    found: dict[str, Path] = {}
+    prefix = base.name + "."
+    try:
+        with os.scandir(base.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and "." not in name[len(prefix):]:
+                    found[name[len(base.name):].upper()] = Path(entry.path)
+    except OSError:
+        pass
+    return found
 
 
 def _error_result(msg: str, request: Optional[SimRequest]) -> UnifiedResult:
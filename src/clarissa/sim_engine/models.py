@@ -178,12 +178,43 @@ class UnifiedResult(BaseModel):
     timesteps: list[TimestepResult] = Field(default_factory=list)
     metadata: SimMetadata
     created_at: str = Field(default="", description="ISO 8601 timestamp")
+    pressure_matrix: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description=(
+            "Pressure [bar] as one (n_rows, n_cells) array, one row per restart step; "
+            "with summary data n_rows = min(restart steps, summary steps)"
+        ),
+    )
+
+    def __eq__(self, other: Any) -> bool:
+        """Field-wise equality, leaving out ``pressure_matrix``.
+
+        The matrix is a bulk copy of the per-step ``cells.pressure`` already
+        compared via ``timesteps``, and ndarray ``==`` has no single truth value.
+        """
+        if not isinstance(other, UnifiedResult):
+            return NotImplemented
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name)
+            for name in type(self).model_fields
+            if name != "pressure_matrix"
+        )
 
     @property
     def last_timestep(self) -> Optional[TimestepResult]:
         """Get the final timestep result."""
         return self.timesteps[-1] if self.timesteps else None
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes.
+
+        Goes straight through pydantic-core's native serializer, skipping
+        the intermediate ``str`` that ``model_dump_json()`` returns.
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
     def summary(self) -> dict[str, Any]:
         """Quick summary for logging and health checks."""
         last = self.last_timestep
@@ -20,9 +20,11 @@ Issue #166 | Epic #161 | ADR-040
 """
 from __future__ import annotations
 
-import textwrap
+import hashlib
+import io
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Final, Iterator, Optional
 
 from clarissa.sim_engine.models import (
     FluidProperties,
@@ -51,36 +53,23 @@ def generate_mrst_script(
     Returns:
         Complete MATLAB/Octave script as string.
     """
-    has_gas = any(Phase.GAS in w.phases for w in request.wells)
+    return "".join(iter_mrst_script(request, output_mat, deck_file=deck_file))
 
-    if deck_file:
-        sections = [
-            _header(request),
-            _mrst_startup(),
-            _grid_section(request.grid),
-            _rock_section(request.grid),
-            _well_section(request.wells, request.grid),
-            _deck_fluid_and_schedule(deck_file, has_gas),  # defines fluid + model
-            _deck_solver_only(),                            # solver only (model already set)
-            _run_section(),
-            _export_section(output_mat, request),
-        ]
-    else:
-        # Legacy: simplified fluid model (no DISGAS support)
-        sections = [
-            _header(request),
-            _mrst_startup(),
-            _grid_section(request.grid),
-            _rock_section(request.grid),
-            _fluid_section(request.fluid, request),
-            _well_section(request.wells, request.grid),
-            _initial_state(request.grid, request.fluid, has_gas),
-            _schedule_section(request.timesteps_days),
-            _solver_section(has_gas),
-            _run_section(),
-            _export_section(output_mat, request),
-        ]
-    return "\n".join(sections)
+
+def iter_mrst_script(
+    request: SimRequest,
+    output_mat: str = "results.mat",
+    deck_file: Optional[str] = None,
+) -> Iterator[str]:
+    """Yield the MRST .m script piece by piece (sections and separators).
+
+    Same arguments and output as generate_mrst_script(), without holding
+    the whole script in one string.
+    """
+    for idx, section in enumerate(_iter_sections(request, output_mat, deck_file)):
+        if idx:
+            yield "\n"
+        yield section
 
 
 def write_mrst_script(
@@ -89,95 +78,165 @@ def write_mrst_script(
     output_mat: str = "results.mat",
     deck_file: Optional[str] = None,
 ) -> str:
-    """Write MRST script to file.
+    """Write MRST script to file, streaming sections as they are generated.
 
     Returns:
         Path to written script.
     """
-    script = generate_mrst_script(request, output_mat, deck_file=deck_file)
-    with open(script_path, "w") as f:
-        f.write(script)
+    with open(script_path, "w", buffering=1 << 20) as f:
+        f.writelines(iter_mrst_script(request, output_mat, deck_file=deck_file))
     return script_path
 
 
+def _iter_sections(
+    request: SimRequest,
+    output_mat: str,
+    deck_file: Optional[str],
+) -> Iterator[str]:
+    """Yield script sections in order."""
+    has_gas = any(Phase.GAS in w.phases for w in request.wells)
+    signature = _assembly_signature(request, has_gas, deck_fluid=bool(deck_file))
+
+    yield _header(request)
+    yield _mrst_startup()
+    yield _grid_section(request.grid)
+    yield _rock_section(request.grid)
+    if deck_file:
+        yield _well_section(request.wells, request.grid)
+        yield _deck_fluid_and_schedule(deck_file, has_gas, signature)  # fluid + model
+        yield _deck_solver_only()                            # solver only (model already set)
+    else:
+        # Legacy: simplified fluid model (no DISGAS support)
+        yield _fluid_section(request.fluid, request)
+        yield _well_section(request.wells, request.grid)
+        yield _initial_state(request.grid, request.fluid, has_gas)
+        yield _schedule_section(request.timesteps_days)
+        yield _solver_section(has_gas, signature)
+    yield _run_section()
+    yield _export_section(output_mat, request)
+
+
+# ─── Static Sections ──────────────────────────────────────────────────────
+# Sections without per-request values are built once at import time;
+# their generators return the prepared text.
+
+_MRST_STARTUP: Final = (
+    "%% ─── MRST Startup ───────────────────────────────────────────\n"
+    "% Add MRST to path from environment or common locations\n"
+    "if exist('mrstPath', 'file') == 0\n"
+    "    mrst_dir = getenv('MRST_DIR');\n"
+    "    if isempty(mrst_dir)\n"
+    "        % Try common install locations\n"
+    "        for d = {'/opt/mrst', '/usr/local/mrst', '/home/simuser/mrst'}\n"
+    "            if exist(d{1}, 'dir')\n"
+    "                mrst_dir = d{1};\n"
+    "                break;\n"
+    "            end\n"
+    "        end\n"
+    "    end\n"
+    "    if ~isempty(mrst_dir) && exist(mrst_dir, 'dir')\n"
+    "        fprintf('Adding MRST from: %s\\n', mrst_dir);\n"
+    "        addpath(genpath(mrst_dir));\n"
+    "    else\n"
+    "        error('MRST not found. Set MRST_DIR or add to Octave path.');\n"
+    "    end\n"
+    "end\n"
+    "mrstModule add ad-blackoil ad-core ad-props mrst-autodiff deckformat\n"
+    "% Octave compat: remove MRST's built-in overrides that shadow Octave core\n"
+    "% functions (properties, ls, isprop, maxNumCompThreads).\n"
+    "% These cause 'matrix cannot be indexed with .' in AD OOP code.\n"
+    "problematic = fullfile(mrst_dir, 'utils', 'octave_only', 'builtin');\n"
+    "if exist(problematic, 'dir')\n"
+    "    rmpath(problematic);\n"
+    "end\n"
+)
+
+_DECK_SOLVER_ONLY: Final = (
+    "%% ─── Solver ─────────────────────────────────────────────────\n"
+    "solver = NonLinearSolver('maxIterations', 15, 'maxTimestepCuts', 4);\n"
+)
+
+_RUN_SECTION: Final = (
+    "%% ─── Run ────────────────────────────────────────────────────\n"
+    "% Octave compat: explicit wellSol init avoids struct-indexing error\n"
+    "% in checkDependencies (MRST 2021a, Octave 8.x)\n"
+    "state0.wellSol = initWellSolAD(W, model, state0);\n"
+    "fprintf('Starting simulation...\\n');\n"
+    "tic;\n"
+    "[wellSols, states, report] = simulateScheduleAD(state0, model, schedule, ...\n"
+    "    'NonLinearSolver', solver);\n"
+    "wall_time = toc;\n"
+    "fprintf('Simulation completed in %.2f seconds\\n', wall_time);\n"
+    "converged = report.Converged;\n"
+)
+
+
 # ─── Section Generators ───────────────────────────────────────────────────
+# Sections that depend only on grid/fluid/schedule values delegate to
+# lru_cached _format_* helpers keyed by those scalars, so parameter sweeps
+# that share a grid or fluid reuse the rendered text.
 
 
 def _header(request: SimRequest) -> str:
     """Script header with metadata."""
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     grid = request.grid
-    return textwrap.dedent(f"""\
-        %% CLARISSA Simulation — MRST Backend
-        %% Generated: {now}
-        %% Title: {request.title}
-        %% Grid: {grid.nx}×{grid.ny}×{grid.nz} = {grid.total_cells} cells
-        %% Wells: {len(request.wells)}
-        %% Backend: mrst
-        %% Issue #166 | Epic #161 | ADR-040
-        %%
-    """)
+    return (
+        "%% CLARISSA Simulation — MRST Backend\n"
+        f"%% Generated: {now}\n"
+        f"%% Title: {request.title}\n"
+        f"%% Grid: {grid.nx}×{grid.ny}×{grid.nz} = {grid.total_cells} cells\n"
+        f"%% Wells: {len(request.wells)}\n"
+        "%% Backend: mrst\n"
+        "%% Issue #166 | Epic #161 | ADR-040\n"
+        "%%\n"
+    )
 
 
 def _mrst_startup() -> str:
     """MRST module loading."""
-    return textwrap.dedent("""\
-        %% ─── MRST Startup ───────────────────────────────────────────
-        % Add MRST to path from environment or common locations
-        if exist('mrstPath', 'file') == 0
-            mrst_dir = getenv('MRST_DIR');
-            if isempty(mrst_dir)
-                % Try common install locations
-                for d = {'/opt/mrst', '/usr/local/mrst', '/home/simuser/mrst'}
-                    if exist(d{1}, 'dir')
-                        mrst_dir = d{1};
-                        break;
-                    end
-                end
-            end
-            if ~isempty(mrst_dir) && exist(mrst_dir, 'dir')
-                fprintf('Adding MRST from: %s\\n', mrst_dir);
-                addpath(genpath(mrst_dir));
-            else
-                error('MRST not found. Set MRST_DIR or add to Octave path.');
-            end
-        end
-        mrstModule add ad-blackoil ad-core ad-props mrst-autodiff deckformat
-        % Octave compat: remove MRST's built-in overrides that shadow Octave core
-        % functions (properties, ls, isprop, maxNumCompThreads).
-        % These cause 'matrix cannot be indexed with .' in AD OOP code.
-        problematic = fullfile(mrst_dir, 'utils', 'octave_only', 'builtin');
-        if exist(problematic, 'dir')
-            rmpath(problematic);
-        end
-    """)
+    return _MRST_STARTUP
 
 
 def _grid_section(grid: GridParams) -> str:
     """Cartesian grid definition."""
-    return textwrap.dedent(f"""\
-        %% ─── Grid ───────────────────────────────────────────────────
-        G = cartGrid([{grid.nx}, {grid.ny}, {grid.nz}], ...
-                     [{grid.nx * grid.dx}, {grid.ny * grid.dy}, {grid.nz * grid.dz}]);
-        G = computeGeometry(G);
-        fprintf('Grid: %d cells\\n', G.cells.num);
-    """)
+    return _format_grid(grid.nx, grid.ny, grid.nz, grid.dx, grid.dy, grid.dz)
+
+
+@lru_cache(maxsize=64)
+def _format_grid(nx: int, ny: int, nz: int, dx: float, dy: float, dz: float) -> str:
+    return (
+        "%% ─── Grid ───────────────────────────────────────────────────\n"
+        f"G = cartGrid([{nx}, {ny}, {nz}], ...\n"
+        f"             [{nx * dx}, {ny * dy}, {nz * dz}]);\n"
+        "G = computeGeometry(G);\n"
+        "fprintf('Grid: %d cells\\n', G.cells.num);\n"
+    )
+
+
+# MRST uses SI: permeability in m², we convert from mD
+_MD_TO_M2: Final = 9.869233e-16  # 1 mD in m²
 
 
 def _rock_section(grid: GridParams) -> str:
     """Rock properties (porosity, permeability)."""
-    # MRST uses SI: permeability in m², we convert from mD
-    # 1 mD = 9.869233e-16 m²
-    perm_x = grid.permeability_x * 9.869233e-16
-    perm_y = grid.permeability_y * 9.869233e-16
-    perm_z = grid.permeability_z * 9.869233e-16
-    return textwrap.dedent(f"""\
-        %% ─── Rock Properties ────────────────────────────────────────
-        rock = makeRock(G, [{perm_x:.6e}, {perm_y:.6e}, {perm_z:.6e}], {grid.porosity});
-    """)
-
-
-def _deck_fluid_and_schedule(deck_file: str, has_gas: bool) -> str:
+    return _format_rock(
+        grid.permeability_x, grid.permeability_y, grid.permeability_z, grid.porosity
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_rock(perm_x_md: float, perm_y_md: float, perm_z_md: float, porosity: float) -> str:
+    perm_x = perm_x_md * _MD_TO_M2
+    perm_y = perm_y_md * _MD_TO_M2
+    perm_z = perm_z_md * _MD_TO_M2
+    return (
+        "%% ─── Rock Properties ────────────────────────────────────────\n"
+        f"rock = makeRock(G, [{perm_x:.6e}, {perm_y:.6e}, {perm_z:.6e}], {porosity});\n"
+    )
+
+
+def _deck_fluid_and_schedule(deck_file: str, has_gas: bool, signature: str) -> str:
     """Deck-based fluid, initial state and schedule — correct for DISGAS.
 
     Reads PVTO/PVTG/PVTW/EQUIL/TSTEP from the Eclipse .DATA deck generated
@@ -193,242 +252,303 @@ def _deck_fluid_and_schedule(deck_file: str, has_gas: bool) -> str:
         if has_gas else
         "model = TwoPhaseOilWaterModel(G, rock, fluid);"
     )
-    return textwrap.dedent(f"""        %% ─── Fluid, Initial State & Schedule (deck-based) ──────────────
-        deck = readEclipseDeck('{deck_file}');
-        deck = convertDeckUnits(deck);
-
-        %% Fluid from deck PVT tables
-        fluid = initDeckADIFluid(deck);
-
-        %% Model must be defined before initEclipseState / convertDeckSchedule
-        {model_line}
-        model.useCNVConvergence = false;
-
-        %% Initial state from EQUIL (MRST 2021a compatible — no initEclipseState)
-        gravity reset on;
-        p_init  = deck.SOLUTION.EQUIL(1,1) * barsa;
-        sw_init = deck.SOLUTION.EQUIL(1,9);
-        s0      = repmat([sw_init, 1 - sw_init, 0], G.cells.num, 1);
-        state0  = initState(G, W, p_init, s0);
-
-        %% Schedule from deck TSTEP + well controls (2021a: scheduleFromDeck)
-        schedule = scheduleFromDeck(deck);
-        schedule.control(1).W = W;
-        fprintf('Deck loaded: %d timesteps\\n', numel(schedule.step.val));
-    """)
+    return (
+        "%% ─── Fluid, Initial State & Schedule (deck-based) ──────────────\n"
+        f"deck = readEclipseDeck('{deck_file}');\n"
+        "deck = convertDeckUnits(deck);\n"
+        "\n"
+        "%% Fluid from deck PVT tables\n"
+        "fluid = initDeckADIFluid(deck);\n"
+        "\n"
+        "%% Model must be defined before initEclipseState / convertDeckSchedule\n"
+        f"{_model_block(model_line, signature)}"
+        "\n"
+        "%% Initial state from EQUIL (MRST 2021a compatible — no initEclipseState)\n"
+        "gravity reset on;\n"
+        "p_init  = deck.SOLUTION.EQUIL(1,1) * barsa;\n"
+        "sw_init = deck.SOLUTION.EQUIL(1,9);\n"
+        "s0      = repmat([sw_init, 1 - sw_init, 0], G.cells.num, 1);\n"
+        "state0  = initState(G, W, p_init, s0);\n"
+        "\n"
+        "%% Schedule from deck TSTEP + well controls (2021a: scheduleFromDeck)\n"
+        "schedule = scheduleFromDeck(deck);\n"
+        "schedule.control(1).W = W;\n"
+        "fprintf('Deck loaded: %d timesteps\\n', numel(schedule.step.val));\n"
+    )
 
 
 def _fluid_section(fluid: FluidProperties, request: SimRequest) -> str:
     """Fluid model definition."""
     has_gas = any(Phase.GAS in w.phases for w in request.wells)
+    return _format_fluid(
+        has_gas,
+        fluid.water_viscosity_cp,
+        fluid.oil_viscosity_cp,
+        fluid.water_density_kg_m3,
+        fluid.oil_density_kg_m3,
+    )
+
 
+@lru_cache(maxsize=64)
+def _format_fluid(
+    has_gas: bool, mu_water: float, mu_oil: float, rho_water: float, rho_oil: float,
+) -> str:
     if has_gas:
-        return textwrap.dedent(f"""\
-            %% ─── Fluid (Three-Phase Black Oil) ─────────────────────────
-            fluid = initSimpleADIFluid('phases', 'WOG', ...
-                'mu',  [{fluid.water_viscosity_cp}*centi*poise, ...
-                        {fluid.oil_viscosity_cp}*centi*poise, ...
-                        0.02*centi*poise], ...
-                'rho', [{fluid.water_density_kg_m3}, ...
-                        {fluid.oil_density_kg_m3}, ...
-                        100], ...
-                'n',   [2, 2, 2]);
-        """)
+        return (
+            "%% ─── Fluid (Three-Phase Black Oil) ─────────────────────────\n"
+            "fluid = initSimpleADIFluid('phases', 'WOG', ...\n"
+            f"    'mu',  [{mu_water}*centi*poise, ...\n"
+            f"            {mu_oil}*centi*poise, ...\n"
+            "            0.02*centi*poise], ...\n"
+            f"    'rho', [{rho_water}, ...\n"
+            f"            {rho_oil}, ...\n"
+            "            100], ...\n"
+            "    'n',   [2, 2, 2]);\n"
+        )
     else:
-        return textwrap.dedent(f"""\
-            %% ─── Fluid (Two-Phase Oil-Water) ───────────────────────────
-            fluid = initSimpleADIFluid('phases', 'WO', ...
-                'mu',  [{fluid.water_viscosity_cp}*centi*poise, ...
-                        {fluid.oil_viscosity_cp}*centi*poise], ...
-                'rho', [{fluid.water_density_kg_m3}, ...
-                        {fluid.oil_density_kg_m3}], ...
-                'n',   [2, 2]);
-        """)
+        return (
+            "%% ─── Fluid (Two-Phase Oil-Water) ───────────────────────────\n"
+            "fluid = initSimpleADIFluid('phases', 'WO', ...\n"
+            f"    'mu',  [{mu_water}*centi*poise, ...\n"
+            f"            {mu_oil}*centi*poise], ...\n"
+            f"    'rho', [{rho_water}, ...\n"
+            f"            {rho_oil}], ...\n"
+            "    'n',   [2, 2]);\n"
+        )
 
 
 def _well_section(wells: list[WellConfig], grid: GridParams) -> str:
     """Well definitions."""
-    lines = [
+    per_well = [_well_block(w) for w in wells]
+    return "\n".join([
         "%% ─── Wells ──────────────────────────────────────────────────",
         "W = [];",
-    ]
-    for w in wells:
-        # MRST uses 1-based indexing
-        i1 = w.i + 1
-        j1 = w.j + 1
-        k_top1 = w.k_top + 1
-        k_bot1 = w.k_bottom + 1
-
-        if w.well_type == WellType.INJECTOR:
-            well_type_str = "'InjectWell'"
-            if w.rate_m3_day is not None:
-                control = f"'rate', {w.rate_m3_day / 86400:.6e}, 'type', 'rate'"
-            elif w.bhp_bar is not None:
-                control = f"'val', {w.bhp_bar * 1e5}, 'type', 'bhp'"
-            else:
-                control = f"'rate', {100.0 / 86400:.6e}, 'type', 'rate'"
+        *per_well,
+    ]) + "\n"
+
+
+def _well_block(w: WellConfig) -> str:
+    """addWell block for a single well (comment, perforated cells, addWell)."""
+    # MRST uses 1-based indexing
+    i1 = w.i + 1
+    j1 = w.j + 1
+    k_top1 = w.k_top + 1
+    k_bot1 = w.k_bottom + 1
+    n_perf = k_bot1 - k_top1 + 1
+
+    if w.well_type == WellType.INJECTOR:
+        if w.rate_m3_day is not None:
+            control = f"'rate', {w.rate_m3_day / 86400:.6e}, 'type', 'rate'"
+        elif w.bhp_bar is not None:
+            control = f"'val', {w.bhp_bar * 1e5}, 'type', 'bhp'"
         else:
-            well_type_str = "'ProducerWell'"
-            if w.bhp_bar is not None:
-                control = f"'val', {w.bhp_bar * 1e5}, 'type', 'bhp'"
-            elif w.rate_m3_day is not None:
-                control = f"'rate', {w.rate_m3_day / 86400:.6e}, 'type', 'rate'"
-            else:
-                control = f"'val', {100.0 * 1e5}, 'type', 'bhp'"
-
-        # MRST addWell: cell indices for perforated layers
-        lines.append(f"% Well: {w.name} ({w.well_type.value})")
-        lines.append(
-            f"cells_{w.name.replace('-','_').replace(' ','_')} = sub2ind(G.cartDims, "
-            f"{i1}*ones({k_bot1 - k_top1 + 1},1), "
-            f"{j1}*ones({k_bot1 - k_top1 + 1},1), "
-            f"({k_top1}:{k_bot1})');"
-        )
-        lines.append(
-            f"W = addWell(W, G, rock, cells_{w.name.replace('-','_').replace(' ','_')}, "
-            f"'Name', '{w.name}', {control}, "
-            f"'Comp_i', [{_comp_injection(w)}]);"
-        )
+            control = f"'rate', {100.0 / 86400:.6e}, 'type', 'rate'"
+    else:
+        if w.bhp_bar is not None:
+            control = f"'val', {w.bhp_bar * 1e5}, 'type', 'bhp'"
+        elif w.rate_m3_day is not None:
+            control = f"'rate', {w.rate_m3_day / 86400:.6e}, 'type', 'rate'"
+        else:
+            control = f"'val', {100.0 * 1e5}, 'type', 'bhp'"
+
+    # MRST addWell: cell indices for perforated layers
+    var = f"cells_{w.name.replace('-','_').replace(' ','_')}"
+    return (
+        f"% Well: {w.name} ({w.well_type.value})\n"
+        f"{var} = sub2ind(G.cartDims, "
+        f"{i1}*ones({n_perf},1), {j1}*ones({n_perf},1), ({k_top1}:{k_bot1})');\n"
+        f"W = addWell(W, G, rock, {var}, "
+        f"'Name', '{w.name}', {control}, "
+        f"'Comp_i', [{_comp_injection(w)}]);"
+    )
+
 
-    return "\n".join(lines) + "\n"
+# (is_injector, has_water, has_gas) → composition vector
+_COMP_TABLE: Final[dict[tuple[bool, bool, bool], str]] = {
+    (True, True, True): "1, 0, 0",
+    (True, True, False): "1, 0",
+    (True, False, True): "0, 0, 1",
+    (True, False, False): "0, 1",
+    # Producer — use default
+    (False, True, True): "0, 1, 0",
+    (False, False, True): "0, 1, 0",
+    (False, True, False): "0, 1",
+    (False, False, False): "0, 1",
+}
 
 
 def _comp_injection(well: WellConfig) -> str:
     """Composition vector for well injection (water fraction, oil fraction, ...)."""
-    has_gas = Phase.GAS in well.phases
-    if well.well_type == WellType.INJECTOR:
-        if Phase.WATER in well.phases:
-            return "1, 0, 0" if has_gas else "1, 0"
-        elif Phase.GAS in well.phases:
-            return "0, 0, 1"
-        else:
-            return "0, 1, 0" if has_gas else "0, 1"
-    else:
-        # Producer — use default
-        return "0, 1, 0" if has_gas else "0, 1"
+    phases = well.phases
+    return _COMP_TABLE[
+        well.well_type == WellType.INJECTOR, Phase.WATER in phases, Phase.GAS in phases
+    ]
 
 
 def _initial_state(grid: GridParams, fluid: FluidProperties, has_gas: bool) -> str:
     """Initial reservoir state."""
-    p_init_pa = fluid.initial_pressure_bar * 1e5
+    return _format_initial_state(fluid.initial_pressure_bar, has_gas)
+
+
+@lru_cache(maxsize=64)
+def _format_initial_state(initial_pressure_bar: float, has_gas: bool) -> str:
+    p_init_pa = initial_pressure_bar * 1e5
     if has_gas:
         sat_vec = "[0.0, 1.0, 0.0]"
         sat_comment = "[Sw, So, Sg]"
     else:
         sat_vec = "[0.0, 1.0]"
         sat_comment = "[Sw, So]"
-    return textwrap.dedent(f"""\
-        %% ─── Initial State ──────────────────────────────────────────
-        state0 = initResSol(G, {p_init_pa}, {sat_vec});
-        %% state0.pressure = initial pressure in Pa
-        %% state0.s = {sat_comment} initial saturations (fully oil-saturated)
-    """)
+    return (
+        "%% ─── Initial State ──────────────────────────────────────────\n"
+        f"state0 = initResSol(G, {p_init_pa}, {sat_vec});\n"
+        "%% state0.pressure = initial pressure in Pa\n"
+        f"%% state0.s = {sat_comment} initial saturations (fully oil-saturated)\n"
+    )
 
 
 def _schedule_section(timesteps_days: list[float]) -> str:
     """Time stepping schedule."""
+    return _format_schedule(tuple(timesteps_days))
+
+
+@lru_cache(maxsize=64)
+def _format_schedule(timesteps_days: tuple[float, ...]) -> str:
     # Convert cumulative days to incremental steps in seconds
-    steps = []
-    prev = 0.0
-    for t in sorted(timesteps_days):
-        dt = t - prev
-        if dt > 0:
-            steps.append(dt * 86400.0)  # days → seconds
-        prev = t
-
-    steps_str = "; ".join(f"{s:.1f}" for s in steps)
-    return textwrap.dedent(f"""\
-        %% ─── Schedule ────────────────────────────────────────────────
-        dt = [{steps_str}];
-        schedule = simpleSchedule(dt, 'W', W);
-        fprintf('Timesteps: %d, total %.1f days\\n', numel(dt), sum(dt)/86400);
-    """)
-
-
-def _solver_section(has_gas: bool) -> str:
+    steps_str = "; ".join(f"{s:.1f}" for s in _step_seconds(timesteps_days))
+    return (
+        "%% ─── Schedule ────────────────────────────────────────────────\n"
+        f"dt = [{steps_str}];\n"
+        "schedule = simpleSchedule(dt, 'W', W);\n"
+        "fprintf('Timesteps: %d, total %.1f days\\n', numel(dt), sum(dt)/86400);\n"
+    )
+
+
+def _step_seconds(timesteps_days: tuple[float, ...]) -> list[float]:
+    """Positive increments between sorted report times, days → seconds."""
+    times = sorted(timesteps_days)
+    return [
+        (t - prev) * 86400.0
+        for prev, t in zip([0.0, *times], times)
+        if t - prev > 0
+    ]
+
+
+def _solver_section(has_gas: bool, signature: str) -> str:
     """Solver / model setup — Octave-compatible."""
     if has_gas:
         model_line = "model = ThreePhaseBlackOilModel(G, rock, fluid);"
     else:
         model_line = "model = TwoPhaseOilWaterModel(G, rock, fluid);"
-    return textwrap.dedent(f"""\
-        %% ─── Model & Solver ─────────────────────────────────────────
-        {model_line}
-        model.useCNVConvergence = false;
-        solver = NonLinearSolver('maxIterations', 15, 'maxTimestepCuts', 4);
-    """)
+    return (
+        "%% ─── Model & Solver ─────────────────────────────────────────\n"
+        f"{_model_block(model_line, signature)}"
+        "solver = NonLinearSolver('maxIterations', 15, 'maxTimestepCuts', 4);\n"
+    )
+
+
+def _assembly_signature(request: SimRequest, has_gas: bool, deck_fluid: bool) -> str:
+    """Fingerprint of everything the assembled MRST model depends on.
+
+    Grid, rock and fluid parameters, the phase set and the fluid mode
+    (initDeckADIFluid from the deck vs initSimpleADIFluid); wells and
+    schedule are excluded since they do not enter model construction.
+    """
+    grid, fluid = request.grid, request.fluid
+    key = (
+        grid.nx, grid.ny, grid.nz, grid.dx, grid.dy, grid.dz, grid.depth_top,
+        grid.porosity, grid.permeability_x, grid.permeability_y, grid.permeability_z,
+        fluid.oil_density_kg_m3, fluid.water_density_kg_m3,
+        fluid.oil_viscosity_cp, fluid.water_viscosity_cp,
+        fluid.initial_pressure_bar, fluid.bubble_point_bar,
+        has_gas, deck_fluid,
+    )
+    return hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+
+
+def _model_block(model_line: str, signature: str) -> str:
+    """Model construction, reusing a cached assembly when MRST_MODEL_CACHE is set.
+
+    The cache is opt-in: without the env var the model is always built.
+    A failed save (e.g. classdef objects under older Octave) is reported
+    and ignored.
+    """
+    return (
+        "model_cache = '';\n"
+        "model_cache_dir = getenv('MRST_MODEL_CACHE');\n"
+        "if ~isempty(model_cache_dir)\n"
+        f"    model_cache = fullfile(model_cache_dir, 'model_{signature}.mat');\n"
+        "end\n"
+        "if ~isempty(model_cache) && exist(model_cache, 'file')\n"
+        "    load(model_cache, 'model');\n"
+        "    fprintf('Model loaded from cache: %s\\n', model_cache);\n"
+        "else\n"
+        f"    {model_line}\n"
+        "    model.useCNVConvergence = false;\n"
+        "    if ~isempty(model_cache)\n"
+        "        try\n"
+        "            save(model_cache, 'model', '-v7');\n"
+        "        catch err\n"
+        "            fprintf('Model cache not written: %s\\n', err.message);\n"
+        "        end\n"
+        "    end\n"
+        "end\n"
+    )
+
 
 def _deck_solver_only() -> str:
     """Solver setup for deck mode — model already defined in _deck_fluid_and_schedule."""
-    return textwrap.dedent("""        %% ─── Solver ─────────────────────────────────────────────────
-        solver = NonLinearSolver('maxIterations', 15, 'maxTimestepCuts', 4);
-    """)
+    return _DECK_SOLVER_ONLY
 
 
 def _run_section() -> str:
     """Execute simulation."""
-    return textwrap.dedent("""\
-        %% ─── Run ────────────────────────────────────────────────────
-        % Octave compat: explicit wellSol init avoids struct-indexing error
-        % in checkDependencies (MRST 2021a, Octave 8.x)
-        state0.wellSol = initWellSolAD(W, model, state0);
-        fprintf('Starting simulation...\\n');
-        tic;
-        [wellSols, states, report] = simulateScheduleAD(state0, model, schedule, ...
-            'NonLinearSolver', solver);
-        wall_time = toc;
-        fprintf('Simulation completed in %.2f seconds\\n', wall_time);
-        converged = report.Converged;
-    """)
+    return _RUN_SECTION
 
 
 def _export_section(output_mat: str, request: SimRequest) -> str:
     """Export results to .mat file."""
-    well_names = [w.name for w in request.wells]
-    well_names_str = "{" + ", ".join(f"'{n}'" for n in well_names) + "}"
-
-    return textwrap.dedent(f"""\
-        %% ─── Export Results ──────────────────────────────────────────
-        n_steps = numel(states);
-        n_cells = G.cells.num;
-        n_wells = numel(W);
-
-        % Pre-allocate result arrays
-        time_days = zeros(n_steps, 1);
-        pressure = zeros(n_steps, n_cells);
-        s_water = zeros(n_steps, n_cells);
-        s_oil = zeros(n_steps, n_cells);
-
-        % Well data: [n_steps × n_wells] for each quantity
-        well_bhp = zeros(n_steps, n_wells);
-        well_qOs = zeros(n_steps, n_wells);
-        well_qWs = zeros(n_steps, n_wells);
-
-        cumulative_time = 0;
-        for i = 1:n_steps
-            cumulative_time = cumulative_time + schedule.step.val(i);
-            time_days(i) = cumulative_time / 86400;
-
-            pressure(i, :) = states{{i}}.pressure / 1e5;  % Pa → bar
-            s_water(i, :) = states{{i}}.s(:, 1)';
-            if size(states{{i}}.s, 2) >= 2
-                s_oil(i, :) = states{{i}}.s(:, 2)';
-            end
-
-            for w = 1:n_wells
-                well_bhp(i, w) = wellSols{{i}}(w).bhp / 1e5;  % Pa → bar
-                well_qOs(i, w) = wellSols{{i}}(w).qOs * 86400; % m³/s → m³/day
-                well_qWs(i, w) = wellSols{{i}}(w).qWs * 86400; % m³/s → m³/day
-            end
-        end
-
-        well_names = {well_names_str};
-        grid_dims = [{request.grid.nx}, {request.grid.ny}, {request.grid.nz}];
-
-        save('{output_mat}', 'time_days', 'pressure', 's_water', 's_oil', ...
-             'well_bhp', 'well_qOs', 'well_qWs', 'well_names', 'grid_dims', ...
-             'wall_time', 'converged', '-v7');
-
-        fprintf('Results exported to {output_mat}\\n');
-        fprintf('Steps: %d, Cells: %d, Wells: %d\\n', n_steps, n_cells, n_wells);
-    """)
+    buf = io.StringIO()
+    buf.write("{")
+    for idx, w in enumerate(request.wells):
+        if idx:
+            buf.write(", ")
+        buf.write(f"'{w.name}'")
+    buf.write("}")
+    well_names_str = buf.getvalue()
+
+    return (
+        "%% ─── Export Results ──────────────────────────────────────────\n"
+        "n_steps = numel(states);\n"
+        "n_cells = G.cells.num;\n"
+        "n_wells = numel(W);\n"
+        "\n"
+        "% Stack per-step results in one call each instead of an interpreted loop\n"
+        "time_days = cumsum(schedule.step.val(1:n_steps)) / 86400;\n"
+        "time_days = time_days(:);\n"
+        "pressure = cell2mat(cellfun(@(s) s.pressure' / 1e5, states(:), ...\n"
+        "                    'UniformOutput', false));  % Pa → bar\n"
+        "s_water = cell2mat(cellfun(@(s) s.s(:, 1)', states(:), 'UniformOutput', false));\n"
+        "if size(states{1}.s, 2) >= 2\n"
+        "    s_oil = cell2mat(cellfun(@(s) s.s(:, 2)', states(:), 'UniformOutput', false));\n"
+        "else\n"
+        "    s_oil = zeros(n_steps, n_cells);\n"
+        "end\n"
+        "\n"
+        "% Well data: [n_steps × n_wells] for each quantity\n"
+        "ws = [wellSols{:}];\n"
+        "ws = ws(:);  % step-major, n_wells entries per step\n"
+        "well_bhp = reshape([ws.bhp], n_wells, n_steps)' / 1e5;    % Pa → bar\n"
+        "well_qOs = reshape([ws.qOs], n_wells, n_steps)' * 86400;  % m³/s → m³/day\n"
+        "well_qWs = reshape([ws.qWs], n_wells, n_steps)' * 86400;  % m³/s → m³/day\n"
+        "\n"
+        f"well_names = {well_names_str};\n"
+        f"grid_dims = [{request.grid.nx}, {request.grid.ny}, {request.grid.nz}];\n"
+        "\n"
+        f"save('{output_mat}', 'time_days', 'pressure', 's_water', 's_oil', ...\n"
+        "     'well_bhp', 'well_qOs', 'well_qWs', 'well_names', 'grid_dims', ...\n"
+        "     'wall_time', 'converged', '-v7');\n"
+        "\n"
+        f"fprintf('Results exported to {output_mat}\\n');\n"
+        "fprintf('Steps: %d, Cells: %d, Wells: %d\\n', n_steps, n_cells, n_wells);\n"
+    )
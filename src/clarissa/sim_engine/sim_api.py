@@ -19,14 +19,22 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import queue
+import shutil
 import tempfile
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from itertools import islice
 from typing import Any, Optional
 
 from fastapi import FastAPI, File, HTTPException, BackgroundTasks, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from clarissa.sim_engine.models import (
@@ -35,7 +43,12 @@ from clarissa.sim_engine.models import (
     UnifiedResult,
 )
 from clarissa.sim_engine.backends.base import SimulatorBackend
-from clarissa.sim_engine.backends.registry import get_backend, list_backends, get_registry
+from clarissa.sim_engine.backends.registry import (
+    backend_names_set,
+    get_backend,
+    get_registry,
+    list_backends,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +57,7 @@ from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Register available backends on startup."""
+    """Register available backends on startup; close them on shutdown."""
     from clarissa.sim_engine.backends.registry import register_backend
 
     # OPM Flow
@@ -71,10 +84,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"MRST backend not available: {e}")
 
+    _init_scratch_pool(_MAX_JOBS)
+
     backends = list_backends()
     logger.info(f"Sim-Engine started. Available backends: {backends}")
     yield
 
+    _close_backends()
+    _remove_scratch_root()
+
+
+def _close_backends() -> None:
+    """Release resources held by registered backends (e.g. MRST's Octave session)."""
+    for backend in get_registry().list("simulator"):
+        close = getattr(backend, "close", None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Closing backend {backend.name} failed: {e}")
+
 
 # ─── App Setup ────────────────────────────────────────────────────────────
 
@@ -104,12 +134,126 @@ class JobState(BaseModel):
     error: Optional[str] = None
     logs: Optional[dict[str, Any]] = None  # raw stdout/stderr/errors from backend
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = ""
+    updated_at_ns: int = 0  # time.monotonic_ns() of last update, 0 = never
+
+    @property
+    def updated_at(self) -> str:
+        """ISO 8601 time of the last update, formatted on read."""
+        if not self.updated_at_ns:
+            return ""
+        return _wall_time_iso(self.updated_at_ns)
+
+
+# Wall-clock anchor for monotonic update stamps: progress ticks only read
+# time.monotonic_ns(); the ISO string is produced when a client polls.
+_EPOCH_WALL = datetime.now(timezone.utc)
+_EPOCH_MONO_NS = time.monotonic_ns()
 
 
-# Job store: job_id → JobState
-_jobs: dict[str, JobState] = {}
+def _wall_time_iso(monotonic_ns: int) -> str:
+    """Convert a time.monotonic_ns() stamp to an ISO 8601 UTC string."""
+    offset = timedelta(microseconds=(monotonic_ns - _EPOCH_MONO_NS) // 1000)
+    return (_EPOCH_WALL + offset).isoformat()
+
+
+# Job store: job_id → JobState, kept in creation order. The running-job
+# count is maintained by the worker so capacity/health checks are O(1).
+_jobs: OrderedDict[str, JobState] = OrderedDict()
+_jobs_lock = threading.Lock()
+_running_count = 0
 _MAX_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "5"))
+_MAX_STORED_JOBS = int(os.getenv("MAX_STORED_JOBS", "10000"))
+
+
+def _store_job(job: JobState) -> None:
+    """Add a job to the store, evicting the oldest finished jobs past the cap."""
+    with _jobs_lock:
+        _jobs[job.job_id] = job
+        _jobs.move_to_end(job.job_id)
+        if len(_jobs) <= _MAX_STORED_JOBS:
+            return
+        for old_id in list(_jobs):
+            if len(_jobs) <= _MAX_STORED_JOBS:
+                break
+            if _jobs[old_id].status in (SimStatus.COMPLETED, SimStatus.FAILED):
+                del _jobs[old_id]
+
+
+def _change_running(delta: int) -> None:
+    global _running_count
+    with _jobs_lock:
+        _running_count += delta
+
+
+# ─── Scratch Directories ─────────────────────────────────────────────────
+
+# Job work dirs are lent out of a pool of pre-created slots. Returning a
+# slot renames it aside and recreates it empty; the recursive delete of
+# the old contents runs on a background thread, off the job's path.
+_scratch_root: Optional[str] = None
+_scratch_slots: queue.SimpleQueue[str] = queue.SimpleQueue()
+_scratch_lock = threading.Lock()
+_scratch_seq = 0
+_scratch_cleaner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clarissa-scratch")
+
+
+def _scratch_path(kind: str) -> str:
+    """Reserve a unique path under the scratch root (created lazily)."""
+    global _scratch_root, _scratch_seq
+    with _scratch_lock:
+        if _scratch_root is None:
+            _scratch_root = tempfile.mkdtemp(prefix="clarissa-scratch-")
+        _scratch_seq += 1
+        return os.path.join(_scratch_root, f"{kind}-{_scratch_seq}")
+
+
+def _new_scratch_dir() -> str:
+    path = _scratch_path("slot")
+    os.mkdir(path)
+    return path
+
+
+def _init_scratch_pool(size: int) -> None:
+    """Pre-create ``size`` empty work dirs."""
+    for _ in range(size):
+        _scratch_slots.put(_new_scratch_dir())
+
+
+def _checkout_scratch() -> str:
+    """Borrow an empty work dir; creates one if the pool is drained."""
+    try:
+        return _scratch_slots.get_nowait()
+    except queue.Empty:
+        return _new_scratch_dir()
+
+
+def _release_scratch(slot: str) -> None:
+    """Return a work dir to the pool and wipe its old contents in the background."""
+    trash = _scratch_path("trash")
+    try:
+        os.replace(slot, trash)
+        os.mkdir(slot)
+    except OSError as e:
+        logger.warning(f"Scratch slot {slot} not recycled: {e}")
+        _scratch_cleaner.submit(shutil.rmtree, slot, ignore_errors=True)
+        slot = _new_scratch_dir()
+    _scratch_slots.put(slot)
+    _scratch_cleaner.submit(shutil.rmtree, trash, ignore_errors=True)
+
+
+def _remove_scratch_root() -> None:
+    """Drop the slot pool and delete the scratch root, after pending cleanups."""
+    global _scratch_root
+    _scratch_cleaner.submit(lambda: None).result()
+    with _scratch_lock:
+        root, _scratch_root = _scratch_root, None
+        while True:
+            try:
+                _scratch_slots.get_nowait()
+            except queue.Empty:
+                break
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
 
 
 # ─── API Models ──────────────────────────────────────────────────────────
@@ -155,14 +299,18 @@ def _run_simulation(job_id: str) -> None:
 
     Called via BackgroundTasks — runs in a thread pool.
     """
-    job = _jobs.get(job_id)
-    if not job:
+    try:
+        job = _jobs[job_id]
+    except KeyError:
         logger.error(f"Job {job_id} not found")
         return
 
+    running = False
     try:
         job.status = SimStatus.RUNNING
-        job.updated_at = datetime.now(timezone.utc).isoformat()
+        _change_running(1)
+        running = True
+        job.updated_at_ns = time.monotonic_ns()
 
         # Get backend
         backend_name = job.request.backend
@@ -177,11 +325,16 @@ def _run_simulation(job_id: str) -> None:
             raise ValueError(f"Validation failed: {'; '.join(errors)}")
 
         def on_progress(pct: int) -> None:
+            # Backends may report the same percentage many times; only a
+            # change is worth the model write + timestamp.
+            if pct == job.progress:
+                return
             job.progress = pct
-            job.updated_at = datetime.now(timezone.utc).isoformat()
+            job.updated_at_ns = time.monotonic_ns()
 
-        # Run in temp directory
-        with tempfile.TemporaryDirectory(prefix=f"clarissa-sim-{job_id}-") as work_dir:
+        # Run in a pooled scratch directory
+        work_dir = _checkout_scratch()
+        try:
             raw = backend.run(job.request, work_dir, on_progress=on_progress)
             raw["job_id"] = job_id
 
@@ -212,6 +365,8 @@ def _run_simulation(job_id: str) -> None:
                 if raw.get("stderr"):
                     error_parts.append(raw["stderr"][-500:])
                 job.error = "; ".join(error_parts) if error_parts else "Simulation failed (no output)"
+        finally:
+            _release_scratch(work_dir)
 
     except Exception as e:
         logger.exception(f"Job {job_id} failed: {e}")
@@ -219,7 +374,9 @@ def _run_simulation(job_id: str) -> None:
         job.error = str(e)
 
     finally:
-        job.updated_at = datetime.now(timezone.utc).isoformat()
+        if running:
+            _change_running(-1)
+        job.updated_at_ns = time.monotonic_ns()
 
 
 # ─── Endpoints ────────────────────────────────────────────────────────────
@@ -227,11 +384,8 @@ def _run_simulation(job_id: str) -> None:
 @app.get("/sim/list")
 async def list_jobs(limit: int = 20) -> list[dict[str, Any]]:
     """List recent simulation jobs."""
-    jobs = sorted(
-        _jobs.values(),
-        key=lambda j: j.created_at,
-        reverse=True,
-    )[:limit]
+    with _jobs_lock:
+        jobs = list(islice(reversed(_jobs.values()), max(limit, 0)))
 
     return [
         {
@@ -256,7 +410,7 @@ async def submit_simulation(
     The simulation runs asynchronously. Use GET /sim/{job_id} to poll status.
     """
     # Check capacity
-    active = sum(1 for j in _jobs.values() if j.status == SimStatus.RUNNING)
+    active = _running_count
     if active >= _MAX_JOBS:
         raise HTTPException(
             status_code=429,
@@ -264,17 +418,16 @@ async def submit_simulation(
         )
 
     # Check backend exists
-    available = list_backends()
-    if request.backend not in available:
+    if request.backend not in backend_names_set():
         raise HTTPException(
             status_code=400,
-            detail=f"Backend '{request.backend}' not available. Available: {available}",
+            detail=f"Backend '{request.backend}' not available. Available: {list_backends()}",
         )
 
     # Create job
     job_id = f"sim-{uuid.uuid4().hex[:12]}"
     job = JobState(job_id=job_id, request=request)
-    _jobs[job_id] = job
+    _store_job(job)
 
     # Queue background work
     background_tasks.add_task(_run_simulation, job_id)
@@ -351,7 +504,7 @@ async def upload_deck(
         )
 
     # Check capacity
-    active = sum(1 for j in _jobs.values() if j.status == SimStatus.RUNNING)
+    active = _running_count
     if active >= _MAX_JOBS:
         raise HTTPException(
             status_code=429,
@@ -359,17 +512,16 @@ async def upload_deck(
         )
 
     # Check backend
-    available = list_backends()
-    if simulator not in available:
+    if simulator not in backend_names_set():
         raise HTTPException(
             status_code=400,
-            detail=f"Backend '{simulator}' not available. Available: {available}",
+            detail=f"Backend '{simulator}' not available. Available: {list_backends()}",
         )
 
     # Create job
     job_id = f"sim-{uuid.uuid4().hex[:12]}"
     job = JobState(job_id=job_id, request=sim_request)
-    _jobs[job_id] = job
+    _store_job(job)
 
     # Queue background work
     background_tasks.add_task(_run_simulation, job_id)
@@ -404,8 +556,9 @@ async def upload_deck(
 @app.get("/sim/{job_id}", response_model=SimStatusResponse)
 async def get_status(job_id: str) -> SimStatusResponse:
     """Poll simulation job status and progress."""
-    job = _jobs.get(job_id)
-    if not job:
+    try:
+        job = _jobs[job_id]
+    except KeyError:
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
     return SimStatusResponse(
@@ -419,13 +572,16 @@ async def get_status(job_id: str) -> SimStatusResponse:
 
 
 @app.get("/sim/{job_id}/result")
-async def get_result(job_id: str) -> dict[str, Any]:
+async def get_result(job_id: str) -> Response:
     """Get full simulation result.
 
     Returns the UnifiedResult as JSON. Only available when status=completed.
+    The body is serialized by pydantic-core directly, skipping the
+    model_dump() dict and FastAPI's jsonable_encoder pass over every cell.
     """
-    job = _jobs.get(job_id)
-    if not job:
+    try:
+        job = _jobs[job_id]
+    except KeyError:
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
     if job.status == SimStatus.PENDING or job.status == SimStatus.RUNNING:
@@ -443,7 +599,7 @@ async def get_result(job_id: str) -> dict[str, Any]:
     if not job.result:
         raise HTTPException(status_code=500, detail="Result not available")
 
-    return job.result.model_dump()
+    return Response(content=job.result.to_json_bytes(), media_type="application/json")
 
 
 
@@ -454,8 +610,9 @@ async def get_logs(job_id: str) -> dict[str, Any]:
     Returns stdout, stderr, errors, exit code from OPM Flow.
     Available regardless of job status.
     """
-    job = _jobs.get(job_id)
-    if not job:
+    try:
+        job = _jobs[job_id]
+    except KeyError:
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
     return {
@@ -470,7 +627,7 @@ async def get_logs(job_id: str) -> dict[str, Any]:
 async def health() -> HealthResponse:
     """Engine health check — shows available backends and capacity."""
     backends = list_backends()
-    active = sum(1 for j in _jobs.values() if j.status == SimStatus.RUNNING)
+    active = _running_count
 
     # Get backend versions
     backend_versions = {}
@@ -497,4 +654,12 @@ if __name__ == "__main__":
     import uvicorn
 
     logging.basicConfig(level=logging.INFO)
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8080")))
+    # uvloop/httptools ship with uvicorn[standard] (the "sim" extra); pin
+    # them so a missing wheel fails loudly instead of falling back to asyncio.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8080")),
+        loop="uvloop",
+        http="httptools",
+    )
@@ -19,10 +19,12 @@ class MockSimulator(SimulatorAdapter):
     This allows deterministic testing of the feedback cycle without
     requiring actual reservoir simulation infrastructure.
     """
-    
+
+    _NEEDLE = "RATE 90"
+
     def run(self, case: str) -> SimulatorResult:
         """Execute mock simulation based on simple pattern matching."""
-        stable = "RATE 90" in case
+        stable = self._NEEDLE in case
         
         if stable:
             return SimulatorResult(
@@ -8,15 +8,31 @@ See: https://opm-project.org/
 
 from __future__ import annotations
 
+import re
 import subprocess
 import tempfile
 import os
+import shutil
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from ..base import SimulatorAdapter, SimulatorResult, SimulatorError
 
 
+# Every PRT token _parse_results looks at, matched in one regex pass per line.
+# "error" is case-insensitive here; the caller re-checks the exact spelling.
+_PRT_RE = re.compile(
+    rb"(?P<error>(?i:error))"
+    rb"|(?P<linear>Linear solve did not converge)"
+    rb"|(?P<chop>Timestep chopped)"
+    rb"|(?P<complete>Simulation complete)"
+)
+
+# Output files collected as artifacts, in reporting order.
+_ARTIFACT_SUFFIXES = (".PRT", ".EGRID", ".INIT", ".UNRST", ".SMSPEC", ".UNSMRY")
+
+
 class OPMFlowAdapter(SimulatorAdapter):
     """Adapter for OPM Flow reservoir simulator.
     
@@ -26,15 +42,25 @@ class OPMFlowAdapter(SimulatorAdapter):
     Args:
         image: Docker image name for OPM Flow (default: registry image)
         timeout: Maximum seconds to wait for simulation (default: 3600)
+        persistent: Keep one container running and `docker exec` each case
+            into it instead of `docker run --rm` per case. The container is
+            tied to the deck directory and is replaced when it changes.
+            Call close() to remove it.
     """
     
     def __init__(
         self, 
         image: str = "registry.gitlab.com/wolfram_laube/blauweiss_llc/irena/opm-flow:latest",
         timeout: int = 3600,
+        persistent: bool = False,
     ) -> None:
         self._image = image
         self._timeout = timeout
+        self._persistent = persistent
+        self._container_id: Optional[str] = None
+        self._container_data_dir: Optional[Path] = None
+        self._container_output_root: Optional[Path] = None
+        self._docker_ok_until: float = 0.0
     
     def run(self, case: str) -> SimulatorResult:
         """Execute OPM Flow simulation.
@@ -59,26 +85,44 @@ class OPMFlowAdapter(SimulatorAdapter):
                 "Docker is not available. Ensure Docker is installed and running."
             )
         
-        # Create temporary output directory
-        with tempfile.TemporaryDirectory() as output_dir:
+        output_root = None
+        if self._persistent:
+            try:
+                output_root = self._ensure_worker(case_path)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                self._docker_ok_until = 0.0
+                raise SimulatorError(f"Failed to start OPM Flow container: {e}")
+
+        # Create temporary output directory (inside the worker's mount, if any)
+        with tempfile.TemporaryDirectory(dir=output_root) as output_dir:
             try:
                 result = self._run_container(case_path, Path(output_dir))
                 return self._parse_results(case_path, Path(output_dir), result)
             except subprocess.TimeoutExpired:
+                if self._container_id:
+                    # flow keeps running inside an exec'd container; drop it
+                    self.close()
                 return SimulatorResult(
                     converged=False,
                     errors=[f"Simulation timeout after {self._timeout}s"],
                     metrics={"timeout": True},
                 )
             except subprocess.CalledProcessError as e:
+                self._docker_ok_until = 0.0
                 return SimulatorResult(
                     converged=False,
                     errors=[f"Container execution failed: {e.returncode}"],
                     metrics={"exit_code": e.returncode},
                 )
     
+    # A successful `docker info` probe is trusted for this long
+    _DOCKER_CHECK_TTL_S = 60.0
+
     def _docker_available(self) -> bool:
-        """Check if Docker daemon is running."""
+        """Check if Docker daemon is running (positive result cached briefly)."""
+        now = time.monotonic()
+        if now < self._docker_ok_until:
+            return True
         try:
             subprocess.run(
                 ["docker", "info"],
@@ -86,10 +130,62 @@ class OPMFlowAdapter(SimulatorAdapter):
                 timeout=10,
                 check=True,
             )
-            return True
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            self._docker_ok_until = 0.0
             return False
+        self._docker_ok_until = now + self._DOCKER_CHECK_TTL_S
+        return True
     
+    def _ensure_worker(self, case_path: Path) -> Path:
+        """Start the long-lived container for the case's deck directory.
+
+        Returns the host directory mounted at /simulation/output.
+        """
+        data_dir = case_path.parent.resolve()
+        if self._container_id and self._container_data_dir == data_dir:
+            return self._container_output_root
+        self.close()
+
+        output_root = Path(tempfile.mkdtemp(prefix="clarissa-opm-"))
+        cmd = [
+            "docker", "run", "-d", "--rm",
+            "--name", f"clarissa-opm-{os.getpid()}-{id(self):x}",
+            "--entrypoint", "sleep",
+            "-v", f"{data_dir}:/simulation/data:ro",
+            "-v", f"{output_root}:/simulation/output",
+            "-w", "/simulation",
+            self._image,
+            "infinity",
+        ]
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=120, check=True,
+            )
+        except BaseException:
+            shutil.rmtree(output_root, ignore_errors=True)
+            raise
+        self._container_id = result.stdout.strip()
+        self._container_data_dir = data_dir
+        self._container_output_root = output_root
+        return output_root
+
+    def close(self) -> None:
+        """Remove the persistent container, if one is running."""
+        if self._container_id:
+            try:
+                subprocess.run(
+                    ["docker", "rm", "-f", self._container_id],
+                    capture_output=True,
+                    timeout=30,
+                )
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                pass
+        if self._container_output_root:
+            shutil.rmtree(self._container_output_root, ignore_errors=True)
+        self._container_id = None
+        self._container_data_dir = None
+        self._container_output_root = None
+
     def _run_container(
         self, 
         case_path: Path, 
@@ -98,6 +194,20 @@ class OPMFlowAdapter(SimulatorAdapter):
         """Run OPM Flow container with mounted volumes."""
         data_dir = case_path.parent.resolve()
         case_name = case_path.name
+
+        if self._container_id:
+            cmd = [
+                "docker", "exec", self._container_id,
+                "flow",
+                f"data/{case_name}",
+                f"--output-dir=output/{output_dir.name}/",
+            ]
+            return subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=self._timeout,
+                text=True,
+            )
         
         cmd = [
             "docker", "run", "--rm",
@@ -141,31 +251,37 @@ class OPMFlowAdapter(SimulatorAdapter):
             )
         
         # Parse PRT file for convergence indicators
-        prt_content = prt_file.read_text(errors="replace")
+        prt = self._scan_prt(prt_file)
         
         # Look for common failure patterns
-        if "Error" in prt_content or "ERROR" in prt_content:
-            errors.extend(self._extract_errors(prt_content))
+        if prt["has_error"]:
+            errors.extend(prt["error_lines"])
         
-        if "Linear solve did not converge" in prt_content:
+        if prt["linear_failure"]:
             errors.append("LINEAR_SOLVE_FAILURE")
         
-        if "Timestep chopped" in prt_content:
-            metrics["timestep_chops"] = prt_content.count("Timestep chopped")
+        if prt["timestep_chops"]:
+            metrics["timestep_chops"] = prt["timestep_chops"]
         
         # Check for successful completion
         converged = (
             result.returncode == 0 
             and len(errors) == 0
-            and "Simulation complete" in prt_content
+            and prt["complete"]
         )
         
-        # Collect output artifacts
-        artifacts = {}
-        for suffix in [".PRT", ".EGRID", ".INIT", ".UNRST", ".SMSPEC", ".UNSMRY"]:
-            artifact = output_dir / f"{case_stem}{suffix}"
-            if artifact.exists():
-                artifacts[suffix.lstrip(".")] = str(artifact)
+        # Collect output artifacts from one directory listing
+        found: dict[str, str] = {}
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(case_stem):
+                    found[name[len(case_stem):]] = entry.path
+        artifacts = {
+            suffix.lstrip("."): found[suffix]
+            for suffix in _ARTIFACT_SUFFIXES
+            if suffix in found
+        }
         
         return SimulatorResult(
             converged=converged,
@@ -174,14 +290,49 @@ class OPMFlowAdapter(SimulatorAdapter):
             artifacts=artifacts,
         )
     
-    def _extract_errors(self, prt_content: str) -> list[str]:
-        """Extract error messages from PRT file content."""
-        errors = []
-        for line in prt_content.split("\n"):
-            line_upper = line.upper()
-            if "ERROR" in line_upper and len(line.strip()) < 200:
-                errors.append(line.strip())
-        return errors[:10]  # Limit to first 10 errors
+    @staticmethod
+    def _scan_prt(prt_file: Path) -> dict[str, Any]:
+        """Scan a PRT file once, line by line, for convergence indicators.
+
+        Reads bytes through a 1 MiB buffer so memory stays bounded for
+        large PRT files. Each line is matched once against _PRT_RE; only
+        error lines are decoded.
+        """
+        has_error = False
+        linear_failure = False
+        complete = False
+        timestep_chops = 0
+        error_lines: list[str] = []
+
+        with open(prt_file, "rb", buffering=1 << 20) as f:
+            for raw in f:
+                # Bare CR also ends a line, as with universal newlines
+                for line in raw.split(b"\r") if b"\r" in raw else (raw,):
+                    error_hit = False
+                    for m in _PRT_RE.finditer(line):
+                        kind = m.lastgroup
+                        if kind == "error":
+                            error_hit = True
+                            if m.group() in (b"Error", b"ERROR"):
+                                has_error = True
+                        elif kind == "chop":
+                            timestep_chops += 1
+                        elif kind == "linear":
+                            linear_failure = True
+                        else:
+                            complete = True
+                    if error_hit and len(error_lines) < 10:  # first 10 errors
+                        text = line.decode(errors="replace").strip()
+                        if len(text) < 200:
+                            error_lines.append(text)
+
+        return {
+            "has_error": has_error,
+            "error_lines": error_lines,
+            "linear_failure": linear_failure,
+            "timestep_chops": timestep_chops,
+            "complete": complete,
+        }
     
     @property
     def name(self) -> str:
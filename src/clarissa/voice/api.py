@@ -7,7 +7,6 @@ Open: http://localhost:8000
 
 import os
 import re
-import tempfile
 from pathlib import Path
 from enum import Enum
 from dataclasses import dataclass, field
@@ -15,10 +14,23 @@ from typing import Optional, Dict, Any
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import to_json
 
-app = FastAPI(title="CLARISSA Voice API", version="0.1.0")
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+app = FastAPI(
+    title="CLARISSA Voice API",
+    version="0.1.0",
+    default_response_class=_FastJSONResponse,
+)
 
 # CORS for browser access
 app.add_middleware(
@@ -40,84 +52,110 @@ class IntentType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Intent:
     type: IntentType
     confidence: float
     slots: Dict[str, Any] = field(default_factory=dict)
 
 
+# Every substring trigger and slot number used by parse_intent_rules,
+# found in one scan. The lookahead makes matches zero-width so overlapping
+# triggers ("go back" / "back") are all reported; "water cut" / "oil rate"
+# share a start with "water" / "oil" and are checked directly where needed.
+_KEYWORD_RE = re.compile(
+    r"(?=(?P<kw>show|display|visualize|plot"
+    r"|perm|poro|pore volume|pressure|water|oil|sat|gas|prod"
+    r"|what|how much|tell me|get|help me"
+    r"|go to|go back|navigate|result|model|back)"
+    r"|layer\s*(?P<layer>\d+)"
+    r"|(?:day|time)\s*(?P<time>\d+))"
+)
+
+# Whole-utterance control words and intent triggers, built once.
+_CANCEL_WORDS = frozenset({"cancel", "stop", "abort", "quit"})
+_CONFIRM_WORDS = frozenset({"yes", "yeah", "confirm", "ok", "okay", "do it", "yes run it"})
+_VIZ_TRIGGERS = ("show", "display", "visualize", "plot")
+_QUERY_TRIGGERS = ("what", "how much", "tell me", "get")
+
+
 def parse_intent_rules(text: str) -> Intent:
     """Rule-based intent parsing - works WITHOUT any API key."""
     text_lower = text.lower().strip()
     slots = {}
     
     # Cancel
-    if text_lower in ["cancel", "stop", "abort", "quit"]:
+    if text_lower in _CANCEL_WORDS:
         return Intent(IntentType.CANCEL, 1.0)
     
     # Confirm
-    if text_lower in ["yes", "yeah", "confirm", "ok", "okay", "do it", "yes run it"]:
+    if text_lower in _CONFIRM_WORDS:
         return Intent(IntentType.CONFIRM, 1.0)
     
+    found = set()
+    layer = time_days = None
+    for m in _KEYWORD_RE.finditer(text_lower):
+        kind = m.lastgroup
+        if kind == "kw":
+            found.add(m.group("kw"))
+        elif kind == "layer":
+            if layer is None:
+                layer = int(m.group("layer"))
+        elif time_days is None:
+            time_days = int(m.group("time"))
+
     # Help
-    if text_lower == "help" or "help me" in text_lower:
+    if text_lower == "help" or "help me" in found:
         return Intent(IntentType.HELP, 1.0)
     
     # Visualization patterns
-    viz_triggers = ["show", "display", "visualize", "plot"]
-    if any(t in text_lower for t in viz_triggers):
+    if not found.isdisjoint(_VIZ_TRIGGERS):
         # Property extraction
-        if "perm" in text_lower:
+        if "perm" in found:
             slots["property"] = "permeability"
-        elif "poro" in text_lower:
+        elif "poro" in found:
             slots["property"] = "porosity"
-        elif "water" in text_lower and "sat" in text_lower:
+        elif "water" in found and "sat" in found:
             slots["property"] = "water_saturation"
-        elif "oil" in text_lower and "sat" in text_lower:
+        elif "oil" in found and "sat" in found:
             slots["property"] = "oil_saturation"
-        elif "pressure" in text_lower:
+        elif "pressure" in found:
             slots["property"] = "pressure"
-        elif "sat" in text_lower:
+        elif "sat" in found:
             slots["property"] = "water_saturation"
         
-        # Layer extraction
-        layer_match = re.search(r'layer\s*(\d+)', text_lower)
-        if layer_match:
-            slots["layer"] = int(layer_match.group(1))
-        
-        # Time extraction
-        time_match = re.search(r'(?:day|time)\s*(\d+)', text_lower)
-        if time_match:
-            slots["time_days"] = int(time_match.group(1))
+        # Layer and time slots (first occurrence of each)
+        if layer is not None:
+            slots["layer"] = layer
+        if time_days is not None:
+            slots["time_days"] = time_days
         
         return Intent(IntentType.VISUALIZE_PROPERTY, 0.95, slots)
     
     # Query patterns
-    query_triggers = ["what", "how much", "tell me", "get"]
-    if any(t in text_lower for t in query_triggers):
-        if "water cut" in text_lower:
+    if not found.isdisjoint(_QUERY_TRIGGERS):
+        if "water" in found and "water cut" in text_lower:
             slots["property"] = "water_cut"
-        elif "oil rate" in text_lower:
+        elif "oil" in found and "oil rate" in text_lower:
             slots["property"] = "oil_rate"
-        elif "gas" in text_lower and "oil" in text_lower:
+        elif "gas" in found and "oil" in found:
             slots["property"] = "gor"
-        elif "pressure" in text_lower:
+        elif "pressure" in found:
             slots["property"] = "pressure"
-        elif "oil" in text_lower and "prod" in text_lower:
+        elif "oil" in found and "prod" in found:
             slots["property"] = "oil_production"
-        elif "pore volume" in text_lower:
+        elif "pore volume" in found:
             slots["property"] = "pore_volume"
         
         return Intent(IntentType.QUERY_VALUE, 0.90, slots)
     
     # Navigate
-    if "go to" in text_lower or "navigate" in text_lower or "go back" in text_lower:
-        if "result" in text_lower:
+    if "go to" in found or "navigate" in found or "go back" in found:
+        if "result" in found:
             slots["target"] = "results"
-        elif "model" in text_lower:
+        elif "model" in found:
             slots["target"] = "model"
-        elif "back" in text_lower:
+        elif "back" in found:
             slots["target"] = "back"
         return Intent(IntentType.NAVIGATE, 0.90, slots)
     
@@ -156,12 +194,16 @@ def generate_response(intent: Intent) -> str:
     return responses.get(intent.type, "Processing...")
 
 
-@app.get("/")
+# Voice capture UI, read once at import instead of per request.
+_INDEX_PATH = Path(__file__).parent / "static" / "voice_capture.html"
+_INDEX_HTML = _INDEX_PATH.read_bytes() if _INDEX_PATH.exists() else None
+
+
+@app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve the voice capture UI."""
-    static_path = Path(__file__).parent / "static" / "voice_capture.html"
-    if static_path.exists():
-        return FileResponse(static_path)
+    if _INDEX_HTML is not None:
+        return HTMLResponse(_INDEX_HTML)
     return JSONResponse({"message": "Voice UI not found. Use /api/voice endpoint directly."})
 
 
@@ -178,56 +220,92 @@ async def health():
     }
 
 
+# Uploads larger than this are rejected. Starlette has already spooled the
+# multipart body by the time the handler runs; the cap bounds what is read
+# into memory here.
+_MAX_AUDIO_BYTES = int(os.getenv("MAX_AUDIO_MB", "5")) * 1024 * 1024
+_READ_CHUNK = 64 * 1024
+
+# Containers Whisper decodes natively; uploads are forwarded as-is under
+# a filename whose extension tells Whisper the format. Anything else is
+# sent as webm, the browser recorder's default.
+_WHISPER_FILENAMES = {
+    "audio/webm": "audio.webm",
+    "audio/ogg": "audio.ogg",
+    "audio/wav": "audio.wav",
+}
+
+# Shared Whisper client; created on first use so openai stays optional.
+_openai_client = None
+
+
+def _get_openai_client():
+    """Return the process-wide AsyncOpenAI client."""
+    global _openai_client
+    if _openai_client is None:
+        from openai import AsyncOpenAI
+        _openai_client = AsyncOpenAI()
+    return _openai_client
+
+
 @app.post("/api/voice")
 async def process_voice(audio: UploadFile = File(...)):
-    """Process uploaded audio file."""
+    """Process uploaded audio file.
+
+    webm, ogg and wav uploads are forwarded to Whisper without transcoding.
+    """
     
-    # Save uploaded audio
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as tmp:
-        content = await audio.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Audio too large. Max: {_MAX_AUDIO_BYTES} bytes.",
+    )
+    if audio.size is not None and audio.size > _MAX_AUDIO_BYTES:
+        raise too_large
     
-    try:
-        transcript = ""
-        
-        # Try Whisper if available
-        if os.getenv("OPENAI_API_KEY"):
-            try:
-                from openai import OpenAI
-                client = OpenAI()
-                
-                with open(tmp_path, "rb") as audio_file:
-                    result = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"
-                    )
-                transcript = result.text
-            except Exception as e:
-                transcript = f"[Whisper error: {e}]"
-        else:
-            transcript = "[No OPENAI_API_KEY - using demo mode]"
-        
-        # Parse intent (always works - rule-based)
-        intent = parse_intent_rules(transcript) if transcript and not transcript.startswith("[") else Intent(IntentType.UNKNOWN, 0.0)
-        
-        # Generate response
-        response = generate_response(intent)
-        
-        return {
-            "transcript": transcript,
-            "intent": {
-                "type": intent.type.value,
-                "confidence": intent.confidence,
-                "slots": intent.slots
-            },
-            "response": response
-        }
-    
-    finally:
-        # Cleanup
-        os.unlink(tmp_path)
+    # Keep the upload in memory; Whisper takes the bytes directly
+    chunks = []
+    size = 0
+    while chunk := await audio.read(_READ_CHUNK):
+        size += len(chunk)
+        if size > _MAX_AUDIO_BYTES:
+            raise too_large
+        chunks.append(chunk)
+    content = b"".join(chunks)
+    content_type = (audio.content_type or "").split(";", 1)[0].strip().lower()
+    if content_type not in _WHISPER_FILENAMES:
+        content_type = "audio/webm"
+    transcript = ""
+    
+    # Try Whisper if available
+    if os.getenv("OPENAI_API_KEY"):
+        try:
+            client = _get_openai_client()
+            result = await client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(_WHISPER_FILENAMES[content_type], content, content_type),
+                language="en"
+            )
+            transcript = result.text
+        except Exception as e:
+            transcript = f"[Whisper error: {e}]"
+    else:
+        transcript = "[No OPENAI_API_KEY - using demo mode]"
+    
+    # Parse intent (always works - rule-based)
+    intent = parse_intent_rules(transcript) if transcript and not transcript.startswith("[") else Intent(IntentType.UNKNOWN, 0.0)
+    
+    # Generate response
+    response = generate_response(intent)
+    
+    return {
+        "transcript": transcript,
+        "intent": {
+            "type": intent.type.value,
+            "confidence": intent.confidence,
+            "slots": intent.slots
+        },
+        "response": response
+    }
 
 
 @app.post("/api/text")
@@ -12,13 +12,25 @@ Provides:
   - AudioCapture: orchestrates chunk processing with energy calculation
 """
 
-import io
 import math
-import wave
+import struct
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
 
+__all__ = [
+    "AudioFormat",
+    "AudioConfig",
+    "AudioChunk",
+    "AudioBuffer",
+    "AudioCapture",
+    "WEBAUDIO_CONFIG",
+]
+
+
+# Canonical 44-byte RIFF/WAVE header for integer PCM
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
 
 class AudioFormat(Enum):
     """Audio encoding format."""
@@ -26,7 +38,7 @@ class AudioFormat(Enum):
     FLOAT32 = "float32"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Configuration for audio capture and buffering."""
     sample_rate: int = 16000
@@ -36,21 +48,36 @@ class AudioConfig:
     min_duration_s: float = 0.5
     max_duration_s: float = 30.0
     format: AudioFormat = AudioFormat.PCM16
+    # Derived sizes, computed once in __post_init__
+    _bytes_per_sample: int = field(init=False, repr=False, compare=False)
+    _bytes_per_second: int = field(init=False, repr=False, compare=False)
+    _chunk_size_samples: int = field(init=False, repr=False, compare=False)
+    _chunk_size_bytes: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._bytes_per_sample = self.bit_depth // 8
+        self._bytes_per_second = self.sample_rate * self._bytes_per_sample * self.channels
+        self._chunk_size_samples = int(self.sample_rate * self.chunk_duration_ms / 1000)
+        self._chunk_size_bytes = self._chunk_size_samples * self._bytes_per_sample
 
     @property
     def bytes_per_sample(self) -> int:
-        return self.bit_depth // 8
+        return self._bytes_per_sample
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self._bytes_per_second
 
     @property
     def chunk_size_samples(self) -> int:
-        return int(self.sample_rate * self.chunk_duration_ms / 1000)
+        return self._chunk_size_samples
 
     @property
     def chunk_size_bytes(self) -> int:
-        return self.chunk_size_samples * self.bytes_per_sample
+        return self._chunk_size_bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioChunk:
     """A timestamped fragment of raw PCM audio."""
     data: bytes
@@ -64,21 +91,21 @@ class AudioBuffer:
     Accumulates AudioChunks and produces WAV output.
 
     Tracks total duration and enforces min/max boundaries
-    defined by the associated AudioConfig.
+    defined by the associated AudioConfig. The byte count is kept as
+    chunks are added, so duration checks do not rescan the buffer.
     """
 
     def __init__(self, config: Optional[AudioConfig] = None):
         self.config = config or AudioConfig()
         self.chunks: List[AudioChunk] = []
+        self._total_bytes = 0
+        self._bytes_per_second = self.config.bytes_per_second
 
     @property
     def duration_s(self) -> float:
-        total_bytes = sum(len(c.data) for c in self.chunks)
-        if total_bytes == 0:
+        if self._total_bytes == 0:
             return 0.0
-        return total_bytes / (
-            self.config.sample_rate * self.config.bytes_per_sample * self.config.channels
-        )
+        return self._total_bytes / self._bytes_per_second
 
     @property
     def has_minimum(self) -> bool:
@@ -90,20 +117,27 @@ class AudioBuffer:
 
     def add_chunk(self, chunk: AudioChunk) -> None:
         self.chunks.append(chunk)
+        self._total_bytes += len(chunk.data)
 
     def clear(self) -> None:
         self.chunks.clear()
+        self._total_bytes = 0
 
     def to_wav_bytes(self) -> bytes:
-        """Return accumulated audio as an in-memory WAV file."""
-        raw = b"".join(c.data for c in self.chunks)
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(self.config.channels)
-            wf.setsampwidth(self.config.bytes_per_sample)
-            wf.setframerate(self.config.sample_rate)
-            wf.writeframes(raw)
-        return buf.getvalue()
+        """Return accumulated audio as an in-memory WAV file.
+
+        The header is packed directly and joined with the chunk payloads
+        in a single allocation.
+        """
+        cfg = self.config
+        data_size = self._total_bytes
+        header = _WAV_HEADER.pack(
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, cfg.channels, cfg.sample_rate,
+            self._bytes_per_second, cfg.channels * cfg.bytes_per_sample, cfg.bit_depth,
+            b"data", data_size,
+        )
+        return b"".join([header, *(c.data for c in self.chunks)])
 
 
 class AudioCapture:
@@ -158,18 +192,23 @@ class AudioCapture:
 
     @staticmethod
     def _compute_energy_db(raw_data: bytes) -> float:
-        """Compute RMS energy in dB (relative to int16 full-scale)."""
-        if len(raw_data) < 2:
-            return -100.0
-
-        import struct
+        """Compute RMS energy in dB (relative to int16 full-scale).
 
+        Uses numpy when available for the sum of squares; falls back to
+        struct unpacking otherwise.
+        """
         n_samples = len(raw_data) // 2
         if n_samples == 0:
             return -100.0
 
-        samples = struct.unpack(f"<{n_samples}h", raw_data[: n_samples * 2])
-        sum_sq = sum(s * s for s in samples)
+        try:
+            import numpy as np
+        except ImportError:
+            samples = struct.unpack(f"<{n_samples}h", raw_data[: n_samples * 2])
+            sum_sq = sum(s * s for s in samples)
+        else:
+            samples = np.frombuffer(raw_data, dtype="<i2", count=n_samples).astype(np.float64)
+            sum_sq = float(np.dot(samples, samples))
         rms = math.sqrt(sum_sq / n_samples)
 
         if rms > 0:
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from .intent import Intent, IntentType
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of command execution."""
     success: bool
@@ -50,6 +50,12 @@ class CommandExecutor:
         self.data = data_service
         self.ui = ui_service
         self._pending_intent: Optional[Intent] = None
+        self._dispatch = {
+            IntentType.VISUALIZE_PROPERTY: self._visualize,
+            IntentType.QUERY_VALUE: self._query,
+            IntentType.NAVIGATE: self._navigate,
+            IntentType.HELP: self._help,
+        }
     
     async def execute(self, intent: Intent) -> ExecutionResult:
         """Execute an intent."""
@@ -80,17 +86,11 @@ class CommandExecutor:
         if not handler_config:
             return ExecutionResult(success=False, error=f"No handler for {intent.type}")
         
+        handler = self._dispatch.get(intent.type)
+        if handler is None:
+            return ExecutionResult(success=True)
         try:
-            if intent.type == IntentType.VISUALIZE_PROPERTY:
-                return await self._visualize(intent)
-            elif intent.type == IntentType.QUERY_VALUE:
-                return await self._query(intent)
-            elif intent.type == IntentType.NAVIGATE:
-                return await self._navigate(intent)
-            elif intent.type == IntentType.HELP:
-                return await self._help(intent)
-            else:
-                return ExecutionResult(success=True)
+            return await handler(intent)
         except Exception as e:
             return ExecutionResult(success=False, error=str(e))
     
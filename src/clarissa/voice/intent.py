@@ -9,12 +9,22 @@ Supports multiple LLM backends:
 Priority: Rules → Claude → GPT-4 → Unknown
 """
 
+import logging
 import os
 import re
 import json
+import time
+import pickle
+import asyncio
+import threading
+from collections import OrderedDict
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Callable
+from dataclasses import dataclass, field, replace
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Sequence, AsyncIterator
+
+from .sync_loop import get_sync_loop
+
+logger = logging.getLogger(__name__)
 
 
 class IntentType(Enum):
@@ -49,7 +59,18 @@ class IntentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# LLM "intent" strings -> IntentType, without ValueError on unknown names
+_INTENT_BY_VALUE = {member.value: member for member in IntentType}
+
+# Intents that change the model or start runs; confirmed unless very confident
+_DANGEROUS_INTENTS = frozenset({
+    IntentType.MODIFY_PARAMETER,
+    IntentType.RUN_SIMULATION,
+    IntentType.RUN_SENSITIVITY,
+})
+
+
+@dataclass(slots=True)
 class Intent:
     """Parsed intent from voice command."""
     
@@ -63,12 +84,7 @@ class Intent:
     
     def needs_confirmation(self) -> bool:
         """Check if this intent requires user confirmation."""
-        dangerous_intents = {
-            IntentType.MODIFY_PARAMETER,
-            IntentType.RUN_SIMULATION,
-            IntentType.RUN_SENSITIVITY,
-        }
-        return self.type in dangerous_intents and self.confidence < 0.95
+        return self.type in _DANGEROUS_INTENTS and self.confidence < 0.95
 
 
 # Domain vocabulary for better recognition
@@ -110,6 +126,285 @@ Respond with ONLY valid JSON:
 {"intent": "<type>", "confidence": <0.0-1.0>, "slots": {...}}"""
 
 
+# Rule-parser vocabularies, built once rather than on every call.
+_CANCEL_WORDS = frozenset({"stop", "cancel", "never mind", "abort", "quit", "exit"})
+_CONFIRM_WORDS = frozenset({
+    "yes", "yeah", "yep", "confirm", "ok", "okay",
+    "do it", "go ahead", "proceed", "affirmative",
+})
+_UNDO_WORDS = frozenset({"undo", "go back", "revert", "undo that"})
+_CONTROL_INTENTS = {
+    word: intent_type
+    for words, intent_type in (
+        (_CANCEL_WORDS, IntentType.CANCEL),
+        (_CONFIRM_WORDS, IntentType.CONFIRM),
+        (_UNDO_WORDS, IntentType.UNDO),
+        (("help",), IntentType.HELP),
+    )
+    for word in words
+}
+_VIZ_TRIGGERS = ("show", "display", "visualize", "plot", "view", "see", "render", "draw")
+_QUERY_TRIGGERS = (
+    "what", "how much", "tell me", "get", "current", "value of", "show me the value",
+)
+_NAV_TRIGGERS = ("go to", "navigate", "open", "back to", "switch to")
+
+# Slot values for the rule parser as (keywords, value) rows in priority
+# order; the first row with a keyword in the utterance wins.
+_VIZ_PROPERTIES = (
+    (("perm",), "permeability"),
+    (("poro",), "porosity"),
+    (("saturation", " sw ", "water sat"), "water_saturation"),
+    (("pressure", "bhp"), "pressure"),
+    (("oil sat", " so "), "oil_saturation"),
+)
+_VIEW_TYPES = (
+    (("3d", "cube", "volume"), "3d"),
+    (("cross", "section", "slice", "xy"), "cross_section_xy"),
+    (("xz", "vertical"), "cross_section_xz"),
+    (("animat", "movie"), "animation"),
+)
+_QUERY_PROPERTIES = (
+    (("oil rate", "fopr", "oil production"), "oil_rate"),
+    (("water rate", "fwpr", "water production"), "water_rate"),
+    (("water cut", "fwct", "wct"), "water_cut"),
+    (("gas rate", "fgpr"), "gas_rate"),
+    (("pressure", "bhp", "fpr"), "pressure"),
+    (("cumulative", "total", "fopt", "cum"), "cumulative_oil"),
+    (("gor", "gas oil"), "gor"),
+)
+_NAV_TARGETS = (
+    (("result",), "results"),
+    (("sensitiv",), "sensitivity"),
+    (("model",), "model"),
+    (("export",), "export"),
+    (("grid",), "grid"),
+    (("well",), "wells"),
+    (("schedule",), "schedule"),
+)
+_EXPORT_FORMATS = ((("gif",), "gif"), (("png",), "png"), (("csv",), "csv"))
+_RUN_TRIGGERS = ("run sim", "start sim", "execute", "run the model")
+_EXPORT_TRIGGERS = ("export", "save", "download")
+
+# Every substring the rule parser tests for. _VOCABULARY_RE reports, at each
+# position, the longest keyword starting there (zero-width lookahead, so
+# overlapping keywords are all seen); the shorter keywords it starts with
+# are added from _VOCABULARY_PREFIXES. One scan thus yields exactly the set
+# of vocabulary keywords that occur in the text.
+_VOCABULARY = frozenset({
+    "help me",
+    *_VIZ_TRIGGERS, *_QUERY_TRIGGERS, *_NAV_TRIGGERS, *_RUN_TRIGGERS, *_EXPORT_TRIGGERS,
+    *(k for table in (_VIZ_PROPERTIES, _VIEW_TYPES, _QUERY_PROPERTIES, _NAV_TARGETS,
+                      _EXPORT_FORMATS)
+      for keywords, _ in table for k in keywords),
+})
+_VOCABULARY_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_VOCABULARY, key=len, reverse=True))
+    + "))"
+)
+_VOCABULARY_PREFIXES = {
+    k: frozenset(p for p in _VOCABULARY if k.startswith(p)) for k in _VOCABULARY
+}
+
+# Slot patterns, compiled once. Time patterns are tried in priority order:
+# an explicit "day N" / "time N" wins over "at N", which wins over "N days".
+_LAYER_RE = re.compile(r'layer\s*(\d+)')
+_TIME_RES = (
+    re.compile(r'(?:day|time|t\s*=?\s*)(\d+)'),
+    re.compile(r'at\s+(\d+)\s*(?:days?)?'),
+    re.compile(r'(\d+)\s*days?'),
+)
+_WELL_RE = re.compile(r'((?:prod|inj|well)[_\s]?\d+)')
+
+# JSON payload of an LLM reply: a fenced block, or a bare object in prose
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```|(\{.*\})', re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+
+def _first_slot(hits: set, table: tuple) -> Optional[str]:
+    """Return the value of the first ``table`` row with a keyword in ``hits``."""
+    for keywords, value in table:
+        if not hits.isdisjoint(keywords):
+            return value
+    return None
+
+
+def _vocabulary_hits(text_lower: str) -> set:
+    """Return the set of _VOCABULARY keywords contained in ``text_lower``."""
+    hits: set = set()
+    for m in _VOCABULARY_RE.finditer(text_lower):
+        hits |= _VOCABULARY_PREFIXES[m.group(1)]
+    return hits
+
+
+class SemanticIntentCache:
+    """
+    Nearest-neighbour cache of LLM-parsed intents over text embeddings.
+    
+    Paraphrases ("show me the perm", "display permeability") land close
+    together in embedding space, so an utterance whose cosine similarity
+    to a cached one reaches ``threshold`` reuses that intent instead of
+    another LLM round-trip. A hit is only served when its numbers and well
+    names also occur in the new text, and intents that modify the model or
+    start runs (see ``Intent.needs_confirmation``) are never cached.
+    
+    Usage:
+        cache = SemanticIntentCache(openai_embedder())
+        parser = IntentParser(semantic_cache=cache)
+    """
+    
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            embed: Maps text to an embedding vector (run in a worker thread)
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Oldest entries are dropped beyond this size
+            path: Optional pickle file the cache is loaded from and saved to
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = path
+        self._vectors = None  # np.ndarray [N, D] of unit rows
+        self._intents: List[Intent] = []
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                self._vectors, self._intents = pickle.load(f)
+    
+    def __len__(self) -> int:
+        return len(self._intents)
+    
+    async def get_or_parse(
+        self, text: str, parse: Callable[[str], Awaitable[Intent]],
+    ) -> Intent:
+        """Return a cached intent for a close paraphrase, else ``await parse(text)``."""
+        import numpy as np
+        
+        try:
+            v = np.asarray(await asyncio.to_thread(self.embed, text), dtype=np.float32)
+            v /= np.linalg.norm(v)
+        except Exception as e:
+            logger.debug("Embedding failed: %s", e)
+            return await parse(text)
+        
+        if self._vectors is not None:
+            sims = self._vectors @ v
+            i = int(sims.argmax())
+            hit = self._intents[i]
+            if (
+                sims[i] >= self.threshold
+                and hit.type not in _DANGEROUS_INTENTS
+                and _slots_in_text(hit.slots, text)
+            ):
+                return replace(
+                    hit, raw_text=text, slots=dict(hit.slots), parse_method="semantic_cache",
+                )
+        
+        intent = await parse(text)
+        if intent.type is not IntentType.UNKNOWN and intent.type not in _DANGEROUS_INTENTS:
+            row = v[np.newaxis, :]
+            drop = max(0, len(self._intents) + 1 - self.max_entries)
+            if self._vectors is None:
+                self._vectors = row
+            else:
+                self._vectors = np.vstack([self._vectors[drop:], row])
+            del self._intents[:drop]
+            self._intents.append(replace(intent, slots=dict(intent.slots)))
+        return intent
+    
+    def save(self) -> None:
+        """Write the cache to ``path`` (no-op without one)."""
+        if self.path:
+            with open(self.path, "wb") as f:
+                pickle.dump((self._vectors, self._intents), f)
+
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def _slots_in_text(slots: Dict[str, Any], text: str) -> bool:
+    """
+    True if every number and well name in ``slots`` also occurs in ``text``.
+    
+    Commands differing only in a value ("... to 200 mD" vs "... to 500 mD",
+    PROD1 vs PROD2) embed almost identically, so a semantic cache hit is
+    only safe when the cached slot values were actually said again.
+    """
+    numbers = {float(n) for n in _NUMBER_RE.findall(text)}
+    compact = re.sub(r"[^a-z0-9]", "", text.lower())
+    values = list(slots.values())
+    while values:
+        value = values.pop()
+        if isinstance(value, (list, tuple)):
+            values.extend(value)
+        elif isinstance(value, bool):
+            continue
+        elif isinstance(value, (int, float)):
+            if float(value) not in numbers:
+                return False
+        elif isinstance(value, str) and any(c.isdigit() for c in value):
+            name = re.sub(r"[^a-z0-9]", "", value.lower())
+            if not re.search(re.escape(name) + r"(?!\d)", compact):
+                return False
+    return True
+
+
+def openai_embedder(model: str = "text-embedding-3-small") -> Callable[[str], List[float]]:
+    """Embedding function for SemanticIntentCache backed by the OpenAI API."""
+    import openai
+    
+    client = openai.OpenAI()
+    
+    def embed(text: str) -> List[float]:
+        return client.embeddings.create(model=model, input=text).data[0].embedding
+    
+    return embed
+
+
+async def _read_json_reply(chunks: AsyncIterator[str]) -> str:
+    """
+    Collect a streamed LLM reply, stopping once its first JSON object closes.
+    
+    Braces are counted outside string literals, so the intent is available
+    as soon as the model emits the final ``}`` rather than when the stream
+    ends. Returns everything received if no object completes.
+    """
+    received: List[str] = []
+    depth = 0
+    start = -1
+    in_string = escaped = False
+    offset = 0
+    async for chunk in chunks:
+        received.append(chunk)
+        for i, ch in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == 0:
+                    start = offset + i
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    return "".join(received)[start:offset + i + 1]
+        offset += len(chunk)
+    return "".join(received)
+
+
 class IntentParser:
     """
     Multi-backend intent parser for CLARISSA.
@@ -122,12 +417,20 @@ class IntentParser:
     MEDIUM_CONFIDENCE = 0.70
     LOW_CONFIDENCE = 0.50
     
+    # Parsed-intent cache: rule results never expire, LLM results after TTL
+    CACHE_SIZE = 512
+    LLM_CACHE_TTL_S = 3600.0
+    
+    # Upper bound on one streamed LLM reply
+    LLM_TIMEOUT_S = 15.0
+    
     def __init__(
         self,
         prefer_claude: bool = True,
         enable_rules: bool = True,
         anthropic_model: str = "claude-sonnet-4-20250514",
         openai_model: str = "gpt-4o-mini",
+        semantic_cache: Optional[SemanticIntentCache] = None,
     ):
         """
         Initialize the intent parser.
@@ -137,16 +440,30 @@ class IntentParser:
             enable_rules: Enable rule-based parsing (recommended)
             anthropic_model: Claude model to use
             openai_model: OpenAI model to use
+            semantic_cache: Optional paraphrase cache in front of the LLM backends
         """
         self.prefer_claude = prefer_claude
         self.enable_rules = enable_rules
         self.anthropic_model = anthropic_model
         self.openai_model = openai_model
+        self.semantic_cache = semantic_cache
+        
+        # SDK clients, created on first use and reused within one event loop
+        self._anthropic_client = None
+        self._anthropic_loop = None
+        self._openai_client = None
+        self._openai_loop = None
         
         # Check available backends
         self.anthropic_available = bool(os.getenv('ANTHROPIC_API_KEY'))
         self.openai_available = bool(os.getenv('OPENAI_API_KEY'))
         
+        # Normalized text -> (intent, expiry on the monotonic clock)
+        self._cache: "OrderedDict[str, tuple[Intent, float]]" = OrderedDict()
+        # parse_sync reads it on the caller's thread while LLM results are
+        # stored from the background loop's thread
+        self._cache_lock = threading.Lock()
+        
     def get_available_backends(self) -> List[str]:
         """Return list of available parsing backends."""
         backends = []
@@ -167,38 +484,92 @@ class IntentParser:
         2. Claude (CLARISSA native)
         3. OpenAI GPT-4 (fallback)
         
+        Results other than UNKNOWN are cached by lower-cased, stripped text
+        (LRU of CACHE_SIZE; LLM results expire after LLM_CACHE_TTL_S).
+        
         Args:
             text: Transcribed voice command
             
         Returns:
             Parsed Intent object
         """
-        # Try rule-based first
+        key = text.lower().strip()
+        result = self._parse_fast(text, key)
+        if result is not None:
+            return result
+        return await self._parse_remote(text, key)
+    
+    def _parse_fast(self, text: str, key: str) -> Optional[Intent]:
+        """Cache and rule lookups for ``text`` (normalized as ``key``); no event loop."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._cache.move_to_end(key)
+                else:
+                    del self._cache[key]
+                    entry = None
+        if entry is not None:
+            return replace(entry[0], raw_text=text, slots=dict(entry[0].slots))
+        
         if self.enable_rules:
-            result = self._parse_with_rules(text)
+            result = self._parse_with_rules(text, key)
             if result is not None:
+                self._remember(key, result, float("inf"))
                 return result
-        
+        return None
+    
+    async def _parse_remote(self, text: str, key: str) -> Intent:
+        """LLM backends, behind the semantic cache when one is set."""
+        if self.semantic_cache is not None:
+            result = await self.semantic_cache.get_or_parse(text, self._parse_with_llm)
+        else:
+            result = await self._parse_with_llm(text)
+        if result.type is not IntentType.UNKNOWN:
+            self._remember(key, result, self.LLM_CACHE_TTL_S)
+        return result
+    
+    def _remember(self, key: str, result: Intent, ttl_s: float) -> None:
+        """Store ``result`` in the LRU cache for ``ttl_s`` seconds."""
+        entry = (replace(result, slots=dict(result.slots)), time.monotonic() + ttl_s)
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def parse_sync(self, text: str) -> Intent:
+        """Synchronous version of parse(); rule hits never touch an event loop."""
+        key = text.lower().strip()
+        result = self._parse_fast(text, key)
+        if result is not None:
+            return result
+        return asyncio.run_coroutine_threadsafe(
+            self._parse_remote(text, key), get_sync_loop(),
+        ).result()
+    
+    async def _parse_with_llm(self, text: str) -> Intent:
+        """Try the LLM backends in order, falling back to UNKNOWN."""
         # Try Claude
         if self.anthropic_available and self.prefer_claude:
             try:
                 return await self._parse_with_claude(text)
             except Exception as e:
-                print(f"Claude parsing failed: {e}")
+                logger.debug("Claude parsing failed: %s", e)
         
         # Try OpenAI
         if self.openai_available:
             try:
                 return await self._parse_with_openai(text)
             except Exception as e:
-                print(f"OpenAI parsing failed: {e}")
+                logger.debug("OpenAI parsing failed: %s", e)
         
         # Try Claude as last resort if not preferred but available
         if self.anthropic_available and not self.prefer_claude:
             try:
                 return await self._parse_with_claude(text)
             except Exception as e:
-                print(f"Claude fallback failed: {e}")
+                logger.debug("Claude fallback failed: %s", e)
         
         # No backend available or all failed
         return Intent(
@@ -210,87 +581,62 @@ class IntentParser:
             clarification_prompt="I couldn't understand that. Could you rephrase?"
         )
     
-    def parse_sync(self, text: str) -> Intent:
-        """Synchronous version of parse()."""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(self.parse(text))
-    
-    def _parse_with_rules(self, text: str) -> Optional[Intent]:
+    def _parse_with_rules(self, text: str, text_lower: Optional[str] = None) -> Optional[Intent]:
         """
         Rule-based intent parsing - works WITHOUT any API key.
         
         Handles common reservoir simulation commands with regex patterns.
+        ``text_lower`` is the lower-cased, stripped text if the caller has it.
         """
-        text_lower = text.lower().strip()
+        if text_lower is None:
+            text_lower = text.lower().strip()
         slots: Dict[str, Any] = {}
         
         # === HIGH PRIORITY: Control commands ===
         
+        # Exact cancel / confirm / undo / help utterances
+        control = _CONTROL_INTENTS.get(text_lower)
+        if control is not None:
+            return Intent(control, 1.0, {}, text, parse_method="rules")
+        
         # Cancel
-        cancel_patterns = ["stop", "cancel", "never mind", "abort", "quit", "exit"]
-        if text_lower in cancel_patterns or text_lower.startswith("cancel"):
+        if text_lower.startswith("cancel"):
             return Intent(IntentType.CANCEL, 1.0, {}, text, parse_method="rules")
         
-        # Confirm
-        confirm_patterns = ["yes", "yeah", "yep", "confirm", "ok", "okay", 
-                          "do it", "go ahead", "proceed", "affirmative"]
-        if text_lower in confirm_patterns:
-            return Intent(IntentType.CONFIRM, 1.0, {}, text, parse_method="rules")
+        # Every vocabulary keyword in the utterance, found in one scan
+        hits = _vocabulary_hits(text_lower)
         
         # Help
-        if text_lower == "help" or text_lower.startswith("what can") or \
-           text_lower.startswith("how do i") or "help me" in text_lower:
+        if text_lower.startswith("what can") or \
+           text_lower.startswith("how do i") or "help me" in hits:
             return Intent(IntentType.HELP, 1.0, {}, text, parse_method="rules")
         
-        # Undo
-        if text_lower in ["undo", "go back", "revert", "undo that"]:
-            return Intent(IntentType.UNDO, 1.0, {}, text, parse_method="rules")
-        
         # === VISUALIZATION ===
         
-        viz_triggers = ["show", "display", "visualize", "plot", "view", 
-                       "see", "render", "draw"]
-        is_viz = any(trigger in text_lower for trigger in viz_triggers)
+        is_viz = not hits.isdisjoint(_VIZ_TRIGGERS)
         
         if is_viz:
             # Property extraction
-            if "perm" in text_lower:
-                slots["property"] = "permeability"
-            elif "poro" in text_lower:
-                slots["property"] = "porosity"
-            elif any(x in text_lower for x in ["saturation", " sw ", "water sat"]):
-                slots["property"] = "water_saturation"
-            elif any(x in text_lower for x in ["pressure", "bhp"]):
-                slots["property"] = "pressure"
-            elif "oil sat" in text_lower or " so " in text_lower:
-                slots["property"] = "oil_saturation"
+            prop = _first_slot(hits, _VIZ_PROPERTIES)
+            if prop:
+                slots["property"] = prop
             
             # Layer extraction
-            layer_match = re.search(r'layer\s*(\d+)', text_lower)
+            layer_match = _LAYER_RE.search(text_lower)
             if layer_match:
                 slots["layer"] = int(layer_match.group(1))
             
             # Time extraction
-            time_patterns = [
-                r'(?:day|time|t\s*=?\s*)(\d+)',
-                r'at\s+(\d+)\s*(?:days?)?',
-                r'(\d+)\s*days?'
-            ]
-            for pattern in time_patterns:
-                time_match = re.search(pattern, text_lower)
+            for pattern in _TIME_RES:
+                time_match = pattern.search(text_lower)
                 if time_match:
                     slots["time_days"] = int(time_match.group(1))
                     break
             
             # View type
-            if "3d" in text_lower or "cube" in text_lower or "volume" in text_lower:
-                slots["view_type"] = "3d"
-            elif any(x in text_lower for x in ["cross", "section", "slice", "xy"]):
-                slots["view_type"] = "cross_section_xy"
-            elif any(x in text_lower for x in ["xz", "vertical"]):
-                slots["view_type"] = "cross_section_xz"
-            elif "animat" in text_lower or "movie" in text_lower:
-                slots["view_type"] = "animation"
+            view_type = _first_slot(hits, _VIEW_TYPES)
+            if view_type:
+                slots["view_type"] = view_type
             
             # Default property if only layer specified
             if "property" not in slots and "layer" not in slots:
@@ -302,28 +648,15 @@ class IntentParser:
         
         # === QUERIES ===
         
-        query_triggers = ["what", "how much", "tell me", "get", "current", 
-                         "value of", "show me the value"]
-        is_query = any(trigger in text_lower for trigger in query_triggers)
+        is_query = not hits.isdisjoint(_QUERY_TRIGGERS)
         
         if is_query:
-            if any(x in text_lower for x in ["oil rate", "fopr", "oil production"]):
-                slots["property"] = "oil_rate"
-            elif any(x in text_lower for x in ["water rate", "fwpr", "water production"]):
-                slots["property"] = "water_rate"
-            elif any(x in text_lower for x in ["water cut", "fwct", "wct"]):
-                slots["property"] = "water_cut"
-            elif any(x in text_lower for x in ["gas rate", "fgpr"]):
-                slots["property"] = "gas_rate"
-            elif any(x in text_lower for x in ["pressure", "bhp", "fpr"]):
-                slots["property"] = "pressure"
-            elif any(x in text_lower for x in ["cumulative", "total", "fopt", "cum"]):
-                slots["property"] = "cumulative_oil"
-            elif "gor" in text_lower or "gas oil" in text_lower:
-                slots["property"] = "gor"
+            prop = _first_slot(hits, _QUERY_PROPERTIES)
+            if prop:
+                slots["property"] = prop
             
             # Well extraction
-            well_match = re.search(r'((?:prod|inj|well)[_\s]?\d+)', text_lower)
+            well_match = _WELL_RE.search(text_lower)
             if well_match:
                 slots["well"] = well_match.group(1).upper().replace(" ", "")
             
@@ -333,24 +666,12 @@ class IntentParser:
         
         # === NAVIGATION ===
         
-        nav_triggers = ["go to", "navigate", "open", "back to", "switch to"]
-        is_nav = any(trigger in text_lower for trigger in nav_triggers)
+        is_nav = not hits.isdisjoint(_NAV_TRIGGERS)
         
         if is_nav:
-            if "result" in text_lower:
-                slots["target"] = "results"
-            elif "sensitiv" in text_lower:
-                slots["target"] = "sensitivity"
-            elif "model" in text_lower:
-                slots["target"] = "model"
-            elif "export" in text_lower:
-                slots["target"] = "export"
-            elif "grid" in text_lower:
-                slots["target"] = "grid"
-            elif "well" in text_lower:
-                slots["target"] = "wells"
-            elif "schedule" in text_lower:
-                slots["target"] = "schedule"
+            target = _first_slot(hits, _NAV_TARGETS)
+            if target:
+                slots["target"] = target
             
             if slots:
                 return Intent(IntentType.NAVIGATE, 0.90, slots, 
@@ -358,90 +679,103 @@ class IntentParser:
         
         # === RUN SIMULATION ===
         
-        if any(x in text_lower for x in ["run sim", "start sim", "execute", "run the model"]):
+        if not hits.isdisjoint(_RUN_TRIGGERS):
             return Intent(IntentType.RUN_SIMULATION, 0.85, {}, text, parse_method="rules")
         
         # === EXPORT ===
         
-        if any(x in text_lower for x in ["export", "save", "download"]):
-            if "gif" in text_lower:
-                slots["format"] = "gif"
-            elif "png" in text_lower:
-                slots["format"] = "png"
-            elif "csv" in text_lower:
-                slots["format"] = "csv"
+        if not hits.isdisjoint(_EXPORT_TRIGGERS):
+            export_format = _first_slot(hits, _EXPORT_FORMATS)
+            if export_format:
+                slots["format"] = export_format
             return Intent(IntentType.EXPORT_RESULTS, 0.85, slots, text, parse_method="rules")
         
         # No rule matched
         return None
     
+    def _get_anthropic(self):
+        """Return the shared Anthropic client, creating it on first use.
+        
+        Pooled connections belong to the event loop that opened them, so a
+        call from a different loop (e.g. parse_sync after asyncio.run(parse))
+        gets a fresh client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._anthropic_client is None or self._anthropic_loop is not loop:
+            import anthropic
+            self._anthropic_client = anthropic.AsyncAnthropic()
+            self._anthropic_loop = loop
+        return self._anthropic_client
+    
+    def _get_openai(self):
+        """Return the shared OpenAI client for the running loop (see _get_anthropic)."""
+        loop = asyncio.get_running_loop()
+        if self._openai_client is None or self._openai_loop is not loop:
+            import openai
+            self._openai_client = openai.AsyncOpenAI()
+            self._openai_loop = loop
+        return self._openai_client
+    
     async def _parse_with_claude(self, text: str) -> Intent:
         """Parse intent using Claude (Anthropic)."""
-        import anthropic
-        
-        client = anthropic.Anthropic()
+        client = self._get_anthropic()
         
         prompt = f"{INTENT_SYSTEM_PROMPT}\n\nUser said: \"{text}\"\n\nJSON response:"
         
-        response = client.messages.create(
-            model=self.anthropic_model,
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        async def reply():
+            async with client.messages.stream(
+                model=self.anthropic_model,
+                max_tokens=300,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                return await _read_json_reply(stream.text_stream)
         
-        result_text = response.content[0].text.strip()
-        return self._parse_llm_response(result_text, text, "claude")
+        # The timeout covers sending the request as well as reading the reply
+        result_text = await asyncio.wait_for(reply(), self.LLM_TIMEOUT_S)
+        
+        return self._parse_llm_response(result_text.strip(), text, "claude")
     
     async def _parse_with_openai(self, text: str) -> Intent:
         """Parse intent using GPT-4 (OpenAI)."""
-        import openai
-        
-        client = openai.OpenAI()
-        
-        response = client.chat.completions.create(
-            model=self.openai_model,
-            messages=[
-                {"role": "system", "content": INTENT_SYSTEM_PROMPT},
-                {"role": "user", "content": f'User said: "{text}"\n\nJSON response:'}
-            ],
-            temperature=0.1,
-            max_tokens=300
-        )
+        client = self._get_openai()
+        
+        async def reply():
+            stream = await client.chat.completions.create(
+                model=self.openai_model,
+                messages=[
+                    {"role": "system", "content": INTENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": f'User said: "{text}"\n\nJSON response:'}
+                ],
+                temperature=0.1,
+                max_tokens=300,
+                stream=True,
+            )
+            
+            async def deltas():
+                async for chunk in stream:
+                    if chunk.choices:
+                        yield chunk.choices[0].delta.content or ""
+            
+            try:
+                return await _read_json_reply(deltas())
+            finally:
+                await stream.close()
         
-        result_text = response.choices[0].message.content.strip()
-        return self._parse_llm_response(result_text, text, "openai")
+        result_text = await asyncio.wait_for(reply(), self.LLM_TIMEOUT_S)
+        
+        return self._parse_llm_response(result_text.strip(), text, "openai")
     
     def _parse_llm_response(self, response: str, original_text: str, method: str) -> Intent:
         """Parse JSON response from LLM."""
-        # Clean up markdown code blocks
-        if "```" in response:
-            response = response.split("```")[1]
-            if response.startswith("json"):
-                response = response[4:]
-            response = response.strip()
+        # Take the body of a ```/```json fence, else the outermost {...}
+        m = _JSON_BLOCK_RE.search(response)
+        if m:
+            response = m.group(1) if m.group(1) is not None else m.group(2)
         
         try:
-            data = json.loads(response)
-            
-            intent_str = data.get("intent", "unknown")
-            try:
-                intent_type = IntentType(intent_str)
-            except ValueError:
-                intent_type = IntentType.UNKNOWN
-            
-            confidence = float(data.get("confidence", 0.8))
-            slots = data.get("slots", {})
-            
-            return Intent(
-                type=intent_type,
-                confidence=confidence,
-                slots=slots,
-                raw_text=original_text,
-                parse_method=method
-            )
-            
+            return self._intent_from_data(json.loads(response), original_text, method)
         except json.JSONDecodeError as e:
-            print(f"JSON parse error: {e}")
+            logger.debug("JSON parse error: %s", e)
             return Intent(
                 type=IntentType.UNKNOWN,
                 confidence=0.0,
@@ -450,6 +784,98 @@ class IntentParser:
                 clarification_needed=True,
                 clarification_prompt="I had trouble understanding. Could you rephrase?"
             )
+    
+    def _intent_from_data(self, data: Dict[str, Any], original_text: str, method: str) -> Intent:
+        """Build an Intent from one decoded LLM intent object."""
+        intent_str = data.get("intent", "unknown")
+        intent_type = (
+            _INTENT_BY_VALUE.get(intent_str, IntentType.UNKNOWN)
+            if isinstance(intent_str, str) else IntentType.UNKNOWN
+        )
+        
+        confidence = float(data.get("confidence", 0.8))
+        slots = data.get("slots", {})
+        
+        return Intent(
+            type=intent_type,
+            confidence=confidence,
+            slots=slots,
+            raw_text=original_text,
+            parse_method=method
+        )
+    
+    async def parse_batch(self, texts: List[str]) -> List[Intent]:
+        """
+        Parse several queued commands at once.
+        
+        Cache and rule hits are answered locally; the remaining commands
+        go to the LLM together in a single request, so the system prompt
+        and connection setup are paid once.
+        
+        Args:
+            texts: Transcribed voice commands, in order
+            
+        Returns:
+            One Intent per command, in the same order
+        """
+        keys = [t.lower().strip() for t in texts]
+        results: List[Optional[Intent]] = [self._parse_fast(t, k) for t, k in zip(texts, keys)]
+        pending = [i for i, r in enumerate(results) if r is None]
+        if len(pending) == 1:
+            i = pending[0]
+            results[i] = await self._parse_remote(texts[i], keys[i])
+        elif pending:
+            batch = await self._parse_batch_with_llm([texts[i] for i in pending])
+            for i, intent in zip(pending, batch):
+                results[i] = intent
+                if intent.type is not IntentType.UNKNOWN:
+                    self._remember(keys[i], intent, self.LLM_CACHE_TTL_S)
+        return results
+    
+    async def _parse_batch_with_llm(self, texts: List[str]) -> List[Intent]:
+        """One LLM request for several commands; per-command fallback on failure."""
+        listing = "\n".join(f"{n}. {t}" for n, t in enumerate(texts, 1))
+        request = (
+            f"Commands:\n{listing}\n\n"
+            "Return a JSON array with one object per command, in order."
+        )
+        try:
+            if self.anthropic_available and (self.prefer_claude or not self.openai_available):
+                method = "claude"
+                response = await self._get_anthropic().messages.create(
+                    model=self.anthropic_model,
+                    max_tokens=300 * len(texts),
+                    messages=[{"role": "user", "content": f"{INTENT_SYSTEM_PROMPT}\n\n{request}"}]
+                )
+                reply = response.content[0].text
+            elif self.openai_available:
+                method = "openai"
+                response = await self._get_openai().chat.completions.create(
+                    model=self.openai_model,
+                    messages=[
+                        {"role": "system", "content": INTENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": request}
+                    ],
+                    temperature=0.1,
+                    max_tokens=300 * len(texts)
+                )
+                reply = response.choices[0].message.content
+            else:
+                reply = None
+            
+            if reply is not None:
+                m = _JSON_ARRAY_RE.search(reply)
+                items = json.loads(m.group(0)) if m else None
+                if (
+                    isinstance(items, list) and len(items) == len(texts)
+                    and all(isinstance(d, dict) for d in items)
+                ):
+                    return [self._intent_from_data(d, t, method) for d, t in zip(items, texts)]
+                logger.debug("Batch reply did not match %d commands", len(texts))
+        except Exception as e:
+            logger.debug("Batch parsing failed: %s", e)
+        
+        return [await self._parse_remote(t, t.lower().strip()) for t in texts]
 
 
 # Convenience function for quick parsing
@@ -4,13 +4,14 @@ Response generation module for CLARISSA voice interface.
 Generates natural language responses and confirmation prompts.
 """
 
+import string
 from dataclasses import dataclass
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, Tuple
 from .intent import Intent, IntentType
 from .execute import ExecutionResult
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Generated response for user."""
     
@@ -64,6 +65,50 @@ RESPONSE_TEMPLATES = {
 }
 
 
+# Template variables, computed only when a template uses them:
+# name -> getter(generator, intent, result)
+_VARIABLES: Dict[str, Callable[["ResponseGenerator", Intent, ExecutionResult], Any]] = {
+    "property": lambda g, i, r: i.slots.get("property", "data"),
+    "layer_text": lambda g, i, r: (
+        f" at layer {i.slots['layer']}" if i.slots.get("layer") else ""
+    ),
+    "time_text": lambda g, i, r: (
+        f" at day {i.slots['time_days']}" if i.slots.get("time_days") else ""
+    ),
+    "target": lambda g, i, r: i.slots.get("target", ""),
+    "format": lambda g, i, r: i.slots.get("format", "file"),
+    "description": lambda g, i, r: r.action_description,
+    "error": lambda g, i, r: r.error or "Unknown error",
+    "action": lambda g, i, r: g._describe_action(i),
+}
+
+
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[Callable]], ...]]:
+    """Split a template into (literal, getter) parts once.
+
+    Returns None if it references an unknown variable, which generate()
+    answers with its fallback text as str.format's KeyError did.
+    """
+    parts = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        if name is None:
+            parts.append((literal, None))
+        elif name in _VARIABLES and not spec and not conversion:
+            parts.append((literal, _VARIABLES[name]))
+        else:
+            return None
+    return tuple(parts)
+
+
+_DEFAULT_SUCCESS = _compile_template("{description}")
+_DEFAULT_ERROR = _compile_template("An error occurred. {error}")
+_COMPILED_TEMPLATES = {
+    key: {kind: _compile_template(t) for kind, t in templates.items()}
+    for key, templates in RESPONSE_TEMPLATES.items()
+    if isinstance(templates, dict)
+}
+
+
 class ResponseGenerator:
     """
     Generates natural language responses for voice interface.
@@ -94,37 +139,19 @@ class ResponseGenerator:
         Returns:
             Response text
         """
-        templates = RESPONSE_TEMPLATES.get(intent.type, RESPONSE_TEMPLATES["unknown"])
+        templates = _COMPILED_TEMPLATES.get(intent.type, _COMPILED_TEMPLATES["unknown"])
         
         if result.success:
-            template = templates.get("success", "{description}")
+            parts = templates.get("success", _DEFAULT_SUCCESS)
         else:
-            template = templates.get("error", "An error occurred. {error}")
-        
-        # Build template variables
-        variables = {
-            "property": intent.slots.get("property", "data"),
-            "layer_text": "",
-            "time_text": "",
-            "target": intent.slots.get("target", ""),
-            "format": intent.slots.get("format", "file"),
-            "description": result.action_description,
-            "error": result.error or "Unknown error",
-            "action": self._describe_action(intent),
-        }
-        
-        # Add layer text if present
-        if intent.slots.get("layer"):
-            variables["layer_text"] = f" at layer {intent.slots['layer']}"
-        
-        # Add time text if present
-        if intent.slots.get("time_days"):
-            variables["time_text"] = f" at day {intent.slots['time_days']}"
+            parts = templates.get("error", _DEFAULT_ERROR)
         
-        try:
-            return template.format(**variables)
-        except KeyError:
+        if parts is None:
             return result.action_description or "Done."
+        return "".join(
+            literal if getter is None else literal + str(getter(self, intent, result))
+            for literal, getter in parts
+        )
     
     def generate_confirmation_prompt(self, intent: Intent) -> str:
         """
@@ -0,0 +1,38 @@
+"""
+Background event loop for the synchronous voice wrappers.
+
+IntentParser.parse_sync and the transcribe_sync methods submit their
+coroutines to one loop running on a daemon thread, started on first use,
+so sync callers neither build a loop per call nor block a loop they are
+already running in. Keeping one loop also keeps loop-bound HTTP client
+pools alive between sync calls.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_sync_loop(
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop,
+) -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background loop, starting it if needed.
+
+    Args:
+        loop_factory: Creates the loop; only used by the call that starts it
+    """
+    global _loop
+    loop = _loop
+    if loop is None:
+        with _loop_lock:
+            if _loop is None:
+                _loop = loop_factory()
+                threading.Thread(
+                    target=_loop.run_forever, name="voice-sync-loop", daemon=True,
+                ).start()
+            loop = _loop
+    return loop
@@ -16,11 +16,14 @@ import os
 import io
 import time
 import logging
-from typing import Optional, BinaryIO, Union
+import struct
+from typing import AsyncIterator, Dict, List, Optional, BinaryIO, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
-from functools import wraps
+from functools import lru_cache, partial, wraps
+
+from .sync_loop import get_sync_loop
 
 logger = logging.getLogger(__name__)
 
@@ -92,10 +95,105 @@ SPE, comparative solution project, benchmark model,
 history match, forecast, sensitivity, uncertainty quantification
 """
 
+# The vocabulary as sent to Whisper: line breaks and indentation collapsed
+# to single spaces, which cost prompt tokens without adding context
+_DOMAIN_PROMPT = " ".join(DOMAIN_VOCABULARY.split())
+
+# Prompts sent with a caller hint, built once per distinct hint
+_PROMPT_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _effective_prompt(prompt: Optional[str]) -> str:
+    """Caller hint followed by the domain vocabulary (or the vocabulary alone)."""
+    if prompt:
+        return f"{prompt}\n\n{_DOMAIN_PROMPT}"
+    return _DOMAIN_PROMPT
+
+
 # Cost per minute for Whisper API (as of 2024)
 WHISPER_COST_PER_MINUTE = 0.006
 
 
+# WAV header for streamed 16 kHz 16-bit mono PCM. The total length is not
+# known when the header is sent, so both size fields hold the maximum, as
+# streaming encoders write them.
+_STREAM_WAV_HEADER = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 0xFFFFFFFF, b"WAVE",
+    b"fmt ", 16, 1, 1, 16000, 32000, 2, 16,
+    b"data", 0xFFFFFFFF,
+)
+
+
+async def _multipart_stream(
+    boundary: str,
+    fields: Dict[str, str],
+    filename: str,
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    """multipart/form-data body whose file part is forwarded chunk by chunk."""
+    for name, value in fields.items():
+        yield (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+    yield (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+        f'filename="{filename}"\r\nContent-Type: audio/wav\r\n\r\n'
+    ).encode()
+    async for chunk in chunks:
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+# Sample rate of PCM passed to the streaming transcribers
+_STREAM_SAMPLE_RATE = 16000
+
+# Words starting this long before the committed point are taken as
+# repeats of committed words when the model re-reads the trimmed window
+_COMMIT_OVERLAP_S = 0.1
+
+# A timed word: (start_s, end_s, text)
+_Word = Tuple[float, float, str]
+
+
+def _agreed_prefix(previous: List[_Word], current: List[_Word]) -> int:
+    """Number of leading words two consecutive hypotheses agree on."""
+    agreed = 0
+    for a, b in zip(previous, current):
+        if a[2].strip(".,!?").lower() != b[2].strip(".,!?").lower():
+            break
+        agreed += 1
+    return agreed
+
+
+# Read size when streaming an audio file from disk into an upload
+_FILE_CHUNK_SIZE = 256 * 1024
+
+
+async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+    """Read ``path`` in chunks on a worker thread, so disk reads do not block the loop."""
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, _FILE_CHUNK_SIZE):
+            yield chunk
+    finally:
+        f.close()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """A uvloop loop when uvloop is installed, else a default asyncio loop.
+
+    Passed to get_sync_loop() by the transcribe_sync wrappers.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """Decorator for retrying with exponential backoff."""
     def decorator(func):
@@ -140,8 +238,21 @@ class WhisperTranscriber:
         print(f"Text: {result.text}")
         print(f"Latency: {result.latency_ms}ms")
         print(f"Cost: ${result.cost_usd:.4f}")
+    
+    One HTTP client is kept per transcriber so keep-alive connections are
+    reused across calls; close it with ``await transcriber.aclose()`` or use
+    the transcriber as an async context manager. ``transport="aiohttp"``
+    sends requests through an aiohttp session instead of httpx (requires
+    ``pip install aiohttp``).
     """
     
+    API_URL = "https://api.openai.com/v1/audio/transcriptions"
+    TRANSPORTS = ("httpx", "aiohttp")
+    
+    # Connection pool limits for the shared HTTP client
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 100
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -149,13 +260,19 @@ class WhisperTranscriber:
         language: str = "en",
         timeout_s: float = 30.0,
         max_retries: int = 3,
+        transport: str = "httpx",
     ):
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Unknown transport {transport!r}, expected one of {self.TRANSPORTS}")
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
         self.language = language
         self.timeout_s = timeout_s
         self.max_retries = max_retries
+        self.transport = transport
         self.metrics = TranscriptionMetrics()
+        self._client = None
+        self._client_loop = None
         
         if not self.api_key:
             raise ValueError(
@@ -163,6 +280,111 @@ class WhisperTranscriber:
                 "Set it as environment variable or pass to constructor."
             )
     
+    def _get_client(self):
+        """Return the shared HTTP client for the transport, creating it on first use.
+        
+        Pooled connections belong to the event loop that opened them, so a
+        call from a different loop (e.g. transcribe_sync after async use)
+        gets a fresh client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if self.transport == "aiohttp":
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "aiohttp not installed. "
+                    "Install with: pip install aiohttp"
+                )
+            self._client = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_s),
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS),
+            )
+        else:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_s,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=self.MAX_CONNECTIONS,
+                ),
+                headers=headers,
+            )
+        self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            if self.transport == "aiohttp":
+                await self._client.close()
+            else:
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    async def _post_httpx(self, filename: str, audio, fields: dict):
+        """POST the upload with httpx; returns (status, Retry-After, JSON or error text).
+        
+        ``audio`` is a file object or an async iterator of bytes. httpx only
+        streams multipart files from file objects, so an iterator is sent
+        as a hand-built multipart body.
+        """
+        import httpx
+        
+        if hasattr(audio, "__aiter__"):
+            boundary = os.urandom(16).hex()
+            request = {
+                "content": _multipart_stream(boundary, fields, filename, audio),
+                "headers": {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            }
+        else:
+            request = {
+                "files": {
+                    "file": (filename, audio, "audio/wav"),
+                },
+                "data": fields,
+            }
+        try:
+            response = await self._get_client().post(self.API_URL, **request)
+        except httpx.TimeoutException:
+            raise TranscriptionTimeout(f"Transcription timed out after {self.timeout_s}s")
+        
+        if response.status_code == 200:
+            return 200, None, response.json()
+        return response.status_code, response.headers.get("Retry-After"), response.text
+    
+    async def _post_aiohttp(self, filename: str, audio, fields: dict):
+        """POST the upload with aiohttp; returns (status, Retry-After, JSON or error text).
+        
+        aiohttp streams ``audio`` itself, whether a file object or an async
+        iterator of bytes.
+        """
+        import aiohttp
+        
+        form = aiohttp.FormData()
+        form.add_field("file", audio, filename=filename, content_type="audio/wav")
+        for name, value in fields.items():
+            form.add_field(name, value)
+        try:
+            async with self._get_client().post(self.API_URL, data=form) as response:
+                if response.status == 200:
+                    return 200, None, await response.json()
+                return response.status, response.headers.get("Retry-After"), await response.text()
+        except asyncio.TimeoutError:
+            raise TranscriptionTimeout(f"Transcription timed out after {self.timeout_s}s")
+    
+    async def __aenter__(self) -> "WhisperTranscriber":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
     @retry_with_backoff(max_retries=3)
     async def transcribe(
         self,
@@ -181,70 +403,150 @@ class WhisperTranscriber:
         Returns:
             TranscriptionResult with text, metrics, and cost
         """
-        import httpx
-        
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Prepare prompt with domain vocabulary
-        effective_prompt = DOMAIN_VOCABULARY
-        if prompt:
-            effective_prompt = f"{prompt}\n\n{DOMAIN_VOCABULARY}"
-        
-        # Prepare audio data
+        # Prepare audio data and its size (for the duration estimate)
         if isinstance(audio_data, bytes):
             audio_file = io.BytesIO(audio_data)
+            file_size = len(audio_data)
         else:
             audio_file = audio_data
-        
-        # Estimate audio duration from file size (rough: 16kHz, 16bit, mono)
-        audio_file.seek(0, 2)  # Seek to end
-        file_size = audio_file.tell()
-        audio_file.seek(0)  # Reset to start
+            audio_file.seek(0, 2)  # Seek to end
+            file_size = audio_file.tell()
+            audio_file.seek(0)  # Reset to start
         
         # Rough estimate: 32000 bytes per second for 16kHz 16bit mono
         audio_duration_s = file_size / 32000
         
+        status, retry_after, body = await self._send(filename, audio_file, prompt)
+        return self._complete(status, retry_after, body, start_ns, audio_duration_s)
+    
+    @retry_with_backoff(max_retries=3)
+    async def transcribe_path(
+        self,
+        audio_path: str,
+        prompt: Optional[str] = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio file on disk without reading it into memory.
+        
+        The file is read in chunks off the event loop and streamed into the
+        upload, so long recordings (up to the API's 25 MB limit) are never
+        held whole. Each retry reopens the file.
+        
+        Args:
+            audio_path: Path to the audio file, e.g. one recorded for
+                LocalWhisperTranscriber
+            prompt: Optional prompt to guide transcription (domain vocab added)
+        
+        Returns:
+            TranscriptionResult with text, metrics, and cost
+        """
+        start_ns = time.perf_counter_ns()
+        # Rough estimate: 32000 bytes per second for 16kHz 16bit mono
+        audio_duration_s = os.path.getsize(audio_path) / 32000
+        
+        status, retry_after, body = await self._send(
+            os.path.basename(audio_path), _file_chunks(audio_path), prompt,
+        )
+        return self._complete(status, retry_after, body, start_ns, audio_duration_s)
+    
+    async def transcribe_files(
+        self,
+        audio_paths: List[str],
+        prompt: Optional[str] = None,
+        max_concurrency: int = 4,
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe many files on disk, a few requests at a time.
+        
+        For bulk, offline work such as recorded sessions. Up to
+        ``max_concurrency`` uploads share the pooled client at once; each
+        file goes through transcribe_path, with its retries.
+        
+        Returns:
+            One TranscriptionResult per path, in input order
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def one(path: str) -> TranscriptionResult:
+            async with limit:
+                return await self.transcribe_path(path, prompt)
+        
+        return list(await asyncio.gather(*(one(path) for path in audio_paths)))
+    
+    async def transcribe_stream(
+        self,
+        pcm_chunks: AsyncIterator[bytes],
+        prompt: Optional[str] = None,
+        filename: str = "audio.wav",
+    ) -> TranscriptionResult:
+        """
+        Transcribe 16 kHz 16-bit mono PCM while it is still being recorded.
+        
+        The upload starts with a WAV header and forwards each chunk as it
+        arrives, so sending overlaps capture instead of following it. The
+        chunks are consumed as they are sent, so unlike transcribe() a
+        failed request is not retried.
+        
+        Args:
+            pcm_chunks: Async iterator of raw PCM chunks, e.g. from the VAD
+            prompt: Optional prompt to guide transcription (domain vocab added)
+            filename: Filename hint for the API
+        
+        Returns:
+            TranscriptionResult with text, metrics, and cost
+        """
+        start_ns = time.perf_counter_ns()
+        pcm_bytes = 0
+        
+        async def wav_stream() -> AsyncIterator[bytes]:
+            nonlocal pcm_bytes
+            yield _STREAM_WAV_HEADER
+            async for chunk in pcm_chunks:
+                pcm_bytes += len(chunk)
+                yield chunk
+        
+        status, retry_after, body = await self._send(filename, wav_stream(), prompt)
+        return self._complete(status, retry_after, body, start_ns, pcm_bytes / 32000)
+    
+    async def _send(self, filename: str, audio, prompt: Optional[str]):
+        """POST audio with the form fields over the configured transport."""
+        fields = {
+            "model": self.model,
+            "language": self.language,
+            "prompt": _effective_prompt(prompt),
+            "response_format": "json",
+        }
+        post = self._post_aiohttp if self.transport == "aiohttp" else self._post_httpx
         try:
-            # Make API request
-            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/audio/transcriptions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                    },
-                    files={
-                        "file": (filename, audio_file, "audio/wav"),
-                    },
-                    data={
-                        "model": self.model,
-                        "language": self.language,
-                        "prompt": effective_prompt,
-                        "response_format": "json",
-                    },
-                )
-            
-            # Handle response
-            if response.status_code == 429:
-                retry_after = float(response.headers.get("Retry-After", 60))
-                self.metrics.errors += 1
-                raise RateLimitError(retry_after)
-            
-            if response.status_code != 200:
-                self.metrics.errors += 1
-                raise TranscriptionError(
-                    f"API error {response.status_code}: {response.text}"
-                )
-            
-            result_json = response.json()
-            text = result_json.get("text", "").strip()
-            
-        except httpx.TimeoutException:
+            return await post(filename, audio, fields)
+        except TranscriptionTimeout:
             self.metrics.errors += 1
-            raise TranscriptionTimeout(f"Transcription timed out after {self.timeout_s}s")
+            raise
+    
+    def _complete(
+        self,
+        status: int,
+        retry_after: Optional[str],
+        body,
+        start_ns: int,
+        audio_duration_s: float,
+    ) -> TranscriptionResult:
+        """Turn an API response into a TranscriptionResult and update metrics."""
+        # Handle response
+        if status == 429:
+            self.metrics.errors += 1
+            raise RateLimitError(float(retry_after or 60))
+        
+        if status != 200:
+            self.metrics.errors += 1
+            raise TranscriptionError(f"API error {status}: {body}")
+        
+        text = body.get("text", "").strip()
         
         # Calculate metrics
-        end_time = time.time()
-        latency_ms = int((end_time - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         cost_usd = (audio_duration_s / 60) * WHISPER_COST_PER_MINUTE
         
         # Update metrics
@@ -274,7 +576,9 @@ class WhisperTranscriber:
         prompt: Optional[str] = None,
     ) -> TranscriptionResult:
         """Synchronous wrapper for transcribe()."""
-        return asyncio.run(self.transcribe(audio_data, prompt))
+        return asyncio.run_coroutine_threadsafe(
+            self.transcribe(audio_data, prompt), get_sync_loop(_new_event_loop),
+        ).result()
     
     def get_metrics(self) -> TranscriptionMetrics:
         """Get current transcription metrics."""
@@ -301,6 +605,15 @@ class LocalWhisperTranscriber:
         - small: 244 MB, ~2 GB VRAM
         - medium: 769 MB, ~5 GB VRAM (recommended for offline)
         - large-v3: 1.5 GB, ~10 GB VRAM
+    
+    ``compute_type="auto"`` loads int8 weights: ``int8_float16`` on CUDA and
+    ``int8`` on CPU (using every CPU core). This halves memory traffic against
+    float16 at a WER cost typically under 1% for medium and large models;
+    pass ``compute_type="float16"`` for the unquantized model.
+    
+    With ``batched=True`` segments are decoded ``batch_size`` at a time
+    through faster-whisper's BatchedInferencePipeline (faster-whisper >= 1.1);
+    older versions fall back to sequential decoding.
     """
     
     def __init__(
@@ -309,12 +622,18 @@ class LocalWhisperTranscriber:
         device: str = "auto",
         compute_type: str = "auto",
         download_root: Optional[str] = None,
+        batched: bool = True,
+        batch_size: int = 16,
     ):
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.download_root = download_root
+        self.batched = batched
+        self.batch_size = batch_size
         self._model = None
+        self._pipeline = None
+        self._prompt_tokens: Dict[str, List[int]] = {}
         self.metrics = TranscriptionMetrics()
     
     def _load_model(self):
@@ -328,7 +647,11 @@ class LocalWhisperTranscriber:
                     "Install with: pip install faster-whisper"
                 )
             
-            logger.info(f"Loading Whisper {self.model_size} model...")
+            on_cuda = self._uses_cuda()
+            if self.compute_type == "auto":
+                self.compute_type = "int8_float16" if on_cuda else "int8"
+            
+            logger.info(f"Loading Whisper {self.model_size} model ({self.compute_type})...")
             start = time.time()
             
             self._model = WhisperModel(
@@ -336,12 +659,52 @@ class LocalWhisperTranscriber:
                 device=self.device,
                 compute_type=self.compute_type,
                 download_root=self.download_root,
+                cpu_threads=0 if on_cuda else (os.cpu_count() or 0),
             )
             
+            if self.batched:
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                except ImportError:
+                    logger.info(
+                        "BatchedInferencePipeline not available in this "
+                        "faster-whisper version; decoding sequentially"
+                    )
+                else:
+                    self._pipeline = BatchedInferencePipeline(model=self._model)
+            
             logger.info(f"Model loaded in {time.time() - start:.1f}s")
         
         return self._model
     
+    def _uses_cuda(self) -> bool:
+        """Whether the model will run on a CUDA device."""
+        if self.device != "auto":
+            return self.device == "cuda"
+        try:
+            import ctranslate2
+        except ImportError:
+            return False
+        return ctranslate2.get_cuda_device_count() > 0
+    
+    def _encode_prompt(self, model, prompt: str) -> Union[str, List[int]]:
+        """Token ids for ``prompt``, encoded once per distinct prompt.
+        
+        faster-whisper accepts the initial prompt as token ids, which skips
+        re-tokenizing the domain vocabulary on every call. The encoding
+        matches what faster-whisper does for a string prompt. Models without
+        ``hf_tokenizer`` get the string unchanged.
+        """
+        tokens = self._prompt_tokens.get(prompt)
+        if tokens is None:
+            tokenizer = getattr(model, "hf_tokenizer", None)
+            if tokenizer is None:
+                return prompt
+            tokens = tokenizer.encode(" " + prompt.strip(), add_special_tokens=False).ids
+            if len(self._prompt_tokens) < _PROMPT_CACHE_SIZE:
+                self._prompt_tokens[prompt] = tokens
+        return tokens
+    
     async def transcribe(
         self,
         audio_path: str,
@@ -359,17 +722,23 @@ class LocalWhisperTranscriber:
         Returns:
             TranscriptionResult
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         model = self._load_model()
         
         # Use domain vocabulary as initial prompt
-        effective_prompt = initial_prompt or DOMAIN_VOCABULARY
+        effective_prompt = self._encode_prompt(model, initial_prompt or _DOMAIN_PROMPT)
+        
+        # Batched decoding when the pipeline is available
+        if self._pipeline is not None:
+            run = partial(self._pipeline.transcribe, batch_size=self.batch_size)
+        else:
+            run = model.transcribe
         
         # Run transcription (in thread pool to not block)
         loop = asyncio.get_event_loop()
         segments, info = await loop.run_in_executor(
             None,
-            lambda: model.transcribe(
+            lambda: run(
                 audio_path,
                 language=language,
                 initial_prompt=effective_prompt,
@@ -384,8 +753,7 @@ class LocalWhisperTranscriber:
         text = " ".join(text_parts).strip()
         
         # Calculate metrics
-        end_time = time.time()
-        latency_ms = int((end_time - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Update metrics
         self.metrics.total_requests += 1
@@ -405,13 +773,109 @@ class LocalWhisperTranscriber:
             model=f"whisper-{self.model_size}",
         )
     
+    async def transcribe_stream(
+        self,
+        audio_queue: "asyncio.Queue[Optional[bytes]]",
+        language: str = "en",
+        initial_prompt: Optional[str] = None,
+        max_buffer_s: float = 20.0,
+    ) -> AsyncIterator[str]:
+        """
+        Transcribe 16 kHz 16-bit mono PCM from a queue, yielding confirmed text.
+        
+        Each round transcribes only the audio after the last committed word.
+        A word is committed once two consecutive rounds agree on it
+        (LocalAgreement-2), and the audio up to its end is dropped, so the
+        window (and the cost of a round) stays bounded by ``max_buffer_s``.
+        Put ``None`` on the queue to end the stream; the last hypothesis is
+        then committed as is.
+        
+        Args:
+            audio_queue: Raw PCM chunks, ``None`` to finish
+            language: Language code
+            initial_prompt: Optional prompt for context
+            max_buffer_s: Longest audio window transcribed in one round
+        
+        Yields:
+            Newly committed words, space-joined
+        """
+        import numpy as np
+        
+        model = self._load_model()
+        prompt = self._encode_prompt(model, initial_prompt or _DOMAIN_PROMPT)
+        loop = asyncio.get_running_loop()
+        max_samples = int(max_buffer_s * _STREAM_SAMPLE_RATE)
+        
+        buffer = np.zeros(0, dtype=np.float32)
+        buffer_start_s = 0.0  # stream time of buffer[0]
+        committed_s = 0.0  # stream time where the last committed word ends
+        pending: List[_Word] = []  # last round's uncommitted words
+        done = False
+        while not done:
+            # Take everything queued so far into this round
+            chunks = [await audio_queue.get()]
+            while not audio_queue.empty():
+                chunks.append(audio_queue.get_nowait())
+            if None in chunks:
+                done = True
+                chunks = chunks[:chunks.index(None)]
+            if chunks:
+                pcm = np.frombuffer(b"".join(chunks), dtype=np.int16)
+                buffer = np.concatenate((buffer, pcm.astype(np.float32) / 32768.0))
+            if buffer.size == 0:
+                continue
+            
+            start_ns = time.perf_counter_ns()
+            words = await loop.run_in_executor(
+                None, self._transcribe_words, model, buffer, language, prompt,
+            )
+            self.metrics.total_requests += 1
+            self.metrics.total_latency_ms += (time.perf_counter_ns() - start_ns) // 1_000_000
+            
+            hypothesis = [
+                (buffer_start_s + start, buffer_start_s + end, word)
+                for start, end, word in words
+                if buffer_start_s + start > committed_s - _COMMIT_OVERLAP_S
+            ]
+            agreed = len(hypothesis) if done else _agreed_prefix(pending, hypothesis)
+            committed, pending = hypothesis[:agreed], hypothesis[agreed:]
+            
+            # Drop committed audio, then cap the window at max_buffer_s
+            cut = 0
+            if committed:
+                yield " ".join(word for _, _, word in committed)
+                committed_s = committed[-1][1]
+                cut = int((committed_s - buffer_start_s) * _STREAM_SAMPLE_RATE)
+            cut = min(max(cut, buffer.size - max_samples), buffer.size)
+            if cut > 0:
+                buffer = buffer[cut:]
+                buffer_start_s += cut / _STREAM_SAMPLE_RATE
+                pending = [word for word in pending if word[1] > buffer_start_s]
+    
+    @staticmethod
+    def _transcribe_words(model, audio, language: str, prompt) -> List[_Word]:
+        """(start_s, end_s, text) for each word the model finds in ``audio``."""
+        segments, _ = model.transcribe(
+            audio,
+            language=language,
+            initial_prompt=prompt,
+            word_timestamps=True,
+        )
+        return [
+            (word.start, word.end, word.word.strip())
+            for segment in segments
+            for word in (segment.words or ())
+        ]
+    
     def transcribe_sync(
         self,
         audio_path: str,
         language: str = "en",
     ) -> TranscriptionResult:
         """Synchronous wrapper for transcribe()."""
-        return asyncio.run(self.transcribe(audio_path, language))
+        return asyncio.run_coroutine_threadsafe(
+            self.transcribe(audio_path, language), get_sync_loop(_new_event_loop),
+        ).result()
 
 
 class TranscriberFactory:
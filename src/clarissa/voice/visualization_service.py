@@ -166,25 +166,33 @@ class VisualizationService:
                 self.x = np.arange(self.nx) * self.dx
                 self.y = np.arange(self.ny) * self.dy
                 self.z = np.arange(self.nz) * self.dz
+                self._coords = None
+            
+            def _flat_coords(self):
+                """Flattened cell-centre (x, y, -depth), built on first use."""
+                if self._coords is None:
+                    # copy=False yields broadcast views; ravel() is the only copy.
+                    X, Y, Z = np.meshgrid(
+                        self.x + self.dx/2, self.y + self.dy/2, self.z + self.dz/2,
+                        indexing='ij', copy=False
+                    )
+                    self._coords = (X.ravel(), Y.ravel(), -Z.ravel())
+                return self._coords
             
             def plot_property_3d(self, prop_3d, title, colorscale='Viridis', 
                                  opacity=0.6, show_wells=True):
-                X, Y, Z = np.meshgrid(
-                    self.x + self.dx/2,
-                    self.y + self.dy/2,
-                    self.z + self.dz/2,
-                    indexing='ij'
-                )
-                
-                x_flat, y_flat, z_flat = X.flatten(), Y.flatten(), Z.flatten()
-                values = prop_3d.flatten()
-                mask = values > np.percentile(values, 5)
+                # Mask first and index the 1D axes, so coordinates are only
+                # materialized for the voxels that are actually plotted.
+                values = prop_3d.ravel()
+                idx = np.flatnonzero(values > np.percentile(values, 5))
+                i, j, k = np.unravel_index(idx, prop_3d.shape)
                 
                 fig = go.Figure()
                 fig.add_trace(go.Scatter3d(
-                    x=x_flat[mask], y=y_flat[mask], z=-z_flat[mask],
+                    x=self.x[i] + self.dx/2, y=self.y[j] + self.dy/2,
+                    z=-(self.z[k] + self.dz/2),
                     mode='markers',
-                    marker=dict(size=4, color=values[mask], colorscale=colorscale,
+                    marker=dict(size=4, color=values[idx], colorscale=colorscale,
                                opacity=opacity, colorbar=dict(title='')),
                 ))
                 
@@ -225,18 +233,14 @@ class VisualizationService:
                 return fig
             
             def create_saturation_animation(self, saturation_over_time, times):
-                X, Y, Z = np.meshgrid(
-                    self.x + self.dx/2, self.y + self.dy/2, self.z + self.dz/2,
-                    indexing='ij'
-                )
-                x_flat, y_flat, z_flat = X.flatten(), Y.flatten(), Z.flatten()
+                x_flat, y_flat, z_flat = self._flat_coords()
                 
                 frames = []
                 for i, (sat, time) in enumerate(zip(saturation_over_time, times)):
-                    values = sat.flatten()
+                    values = sat.ravel()
                     frames.append(go.Frame(
                         data=[go.Scatter3d(
-                            x=x_flat, y=y_flat, z=-z_flat, mode='markers',
+                            x=x_flat, y=y_flat, z=z_flat, mode='markers',
                             marker=dict(size=4, color=values, colorscale='RdYlBu_r',
                                        cmin=0, cmax=1, opacity=0.7),
                         )],
@@ -245,8 +249,8 @@ class VisualizationService:
                 
                 fig = go.Figure(
                     data=[go.Scatter3d(
-                        x=x_flat, y=y_flat, z=-z_flat, mode='markers',
-                        marker=dict(size=4, color=saturation_over_time[0].flatten(),
+                        x=x_flat, y=y_flat, z=z_flat, mode='markers',
+                        marker=dict(size=4, color=saturation_over_time[0].ravel(),
                                    colorscale='RdYlBu_r', cmin=0, cmax=1, opacity=0.7,
                                    colorbar=dict(title='Sw')),
                     )],
@@ -28,6 +28,7 @@ from clarissa.sim_engine.comparison import (
     WellMetrics,
     compare,
     _compare_arrays,
+    _compare_arrays_py,
     _compare_wells,
     _match_timesteps,
     _classify_quality,
@@ -458,6 +459,26 @@ class TestArrayMetrics:
         assert m.mean_a == pytest.approx(20.0)
         assert m.mean_b == pytest.approx(21.0)
 
+    @pytest.mark.parametrize("a, b, max_idx, count", [
+        ([150.0, 172.5, 201.0, 188.25, 163.0], [149.0, 175.0, 198.5, 188.25, 170.0], 4, 5),
+        ([1.0, float("nan"), 3.0], [1.0, 2.0, 5.0], 2, 2),
+        ([float("nan"), 1.0, 3.0], [2.0, 1.0, float("inf")], 1, 1),
+    ])
+    def test_python_fallback_matches(self, a, b, max_idx, count):
+        """The numpy path and the pure-Python fallback agree, skipping non-finite cells."""
+        fast = _compare_arrays(a, b, "p")
+        slow = _compare_arrays_py(a, b, "p", len(a))
+        assert fast.max_error_index == slow.max_error_index == max_idx
+        assert fast.count == slow.count == count
+        for attr in ("nrmse", "mae", "max_abs_error", "r_squared", "mean_a", "mean_b"):
+            assert getattr(fast, attr) == pytest.approx(getattr(slow, attr))
+            assert math.isfinite(getattr(fast, attr))
+
+    def test_all_cells_non_finite(self):
+        nan = float("nan")
+        assert _compare_arrays([nan, nan], [1.0, 2.0], "p").count == 0
+        assert _compare_arrays_py([nan, nan], [1.0, 2.0], "p", 2).count == 0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 7. Well Comparison
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 
 from clarissa.sim_engine.eclipse_reader import (
+    _build_timesteps,
     read_eclipse_output,
     read_restart,
     read_summary,
@@ -307,6 +308,12 @@ class TestSummaryReader:
         assert expected.issubset(set(data["keys"]))
 
 
+    def test_summary_matrix_rows_match_vectors(self, synthetic_case):
+        data = read_summary(synthetic_case + ".SMSPEC")
+        assert data["matrix"].shape == (len(data["keys"]), 12)
+        for row, key in enumerate(data["keys"]):
+            np.testing.assert_array_equal(data["matrix"][row], data["vectors"][key])
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 2. Restart Reader Tests
 # ═══════════════════════════════════════════════════════════════════════════
@@ -382,6 +389,23 @@ class TestEclipseToUnifiedResult:
         mean_p = sum(result.timesteps[0].cells.pressure) / 300
         assert 250 < mean_p < 400  # Reasonable bar range
 
+    def test_pressure_matrix_shape(self, synthetic_case, spe1_request):
+        result = read_eclipse_output(synthetic_case, spe1_request)
+        assert result.pressure_matrix.shape == (len(result.timesteps), 300)
+        np.testing.assert_allclose(
+            result.pressure_matrix[-1], result.timesteps[-1].cells.pressure
+        )
+
+    def test_pressure_matrix_not_serialized(self, synthetic_case, spe1_request):
+        result = read_eclipse_output(synthetic_case, spe1_request)
+        assert "pressure_matrix" not in result.model_dump()
+
+    def test_results_with_pressure_matrix_compare_equal(self, synthetic_case, spe1_request):
+        result = read_eclipse_output(synthetic_case, spe1_request)
+        assert result.pressure_matrix is not None
+        assert result == result.model_copy(deep=True)
+        assert result != result.model_copy(update={"title": "other"})
+
     def test_saturation_water_present(self, synthetic_case, spe1_request):
         result = read_eclipse_output(synthetic_case, spe1_request)
         ts = result.timesteps[0]
@@ -524,6 +548,20 @@ class TestReaderEdgeCases:
             assert len(result.timesteps) == 3
             assert result.timesteps[0].cells.pressure is not None
 
+    def test_empty_pressure_records(self):
+        """Empty PRESSURE records give empty cell pressures, not an error."""
+        empty = {"PRESSURE": np.array([], dtype=np.float32)}
+        timesteps, matrix = _build_timesteps(None, [empty, empty], False, None)
+        assert matrix.shape == (2, 0)
+        assert [ts.cells.pressure for ts in timesteps] == [[], []]
+
+    def test_case_prefix_does_not_match_sibling(self):
+        """Base name must match exactly, not as a prefix of another case."""
+        with tempfile.TemporaryDirectory() as tmp:
+            _write_full_synthetic(tmp, case_name="SPE1_SYNTHETIC", n_steps=2)
+            result = read_eclipse_output(os.path.join(tmp, "SPE1"))
+            assert result.status == SimStatus.FAILED
+
     def test_single_timestep(self):
         with tempfile.TemporaryDirectory() as tmp:
             case = _write_full_synthetic(tmp, n_steps=1)
@@ -251,6 +251,14 @@ class TestUnifiedResult:
         assert r2.job_id == r.job_id
         assert len(r2.timesteps) == 2
 
+    def test_json_bytes_matches_model_dump_json(self):
+        r = self._make_result()
+        data = r.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert data == r.model_dump_json().encode()
+        r2 = UnifiedResult.model_validate_json(data)
+        assert r2.timesteps[1].cells.pressure == [195.0] * 100
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SimulatorBackend ABC Tests
@@ -354,6 +362,16 @@ class TestBackendRegistry:
         names = reg.list_names("simulator")
         assert "mock" in names
 
+    def test_backend_names_set_tracks_direct_registration(self, monkeypatch):
+        from clarissa.sim_engine.backends import registry
+
+        monkeypatch.setattr(registry, "_registry", AdapterRegistry())
+        assert registry.backend_names_set() == frozenset()
+        # Bypasses register_backend, as SimEngine.register does
+        registry.get_registry().register(MockBackend())
+        assert registry.backend_names_set() == frozenset({"mock"})
+        assert registry.list_backends() == ["mock"]
+
     def test_not_found(self):
         from clarissa.pal import AdapterRegistry
         reg = AdapterRegistry()
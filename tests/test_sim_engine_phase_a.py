@@ -596,6 +596,111 @@ class TestSimAPI:
         assert resp.status_code == 404
 
 
+    def test_job_updated_at_formatted_on_read(self, simple_request):
+        """updated_at is derived from the monotonic stamp when read."""
+        import time
+        from datetime import datetime, timezone
+
+        from clarissa.sim_engine.sim_api import JobState
+
+        job = JobState(job_id="sim-ts", request=simple_request)
+        assert job.updated_at == ""
+
+        job.updated_at_ns = time.monotonic_ns()
+        stamp = datetime.fromisoformat(job.updated_at)
+        assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 5
+
+    def test_job_store_evicts_oldest_finished(self, simple_request, monkeypatch):
+        """Past the cap, the oldest finished jobs go first; running ones stay."""
+        from collections import OrderedDict
+
+        from clarissa.sim_engine import sim_api
+
+        monkeypatch.setattr(sim_api, "_jobs", OrderedDict())
+        monkeypatch.setattr(sim_api, "_MAX_STORED_JOBS", 2)
+        statuses = [SimStatus.RUNNING, SimStatus.COMPLETED, SimStatus.FAILED]
+        for n, status in enumerate(statuses):
+            sim_api._store_job(sim_api.JobState(
+                job_id=f"sim-{n}", request=simple_request, status=status,
+            ))
+
+        assert list(sim_api._jobs) == ["sim-0", "sim-2"]
+
+    def test_result_endpoint_serializes_unified_result(self, client, simple_request):
+        """GET /sim/{id}/result returns the UnifiedResult JSON."""
+        from clarissa.sim_engine import sim_api
+
+        result = UnifiedResult(
+            job_id="sim-result",
+            request=simple_request,
+            metadata=SimMetadata(backend="mock"),
+        )
+        sim_api._store_job(sim_api.JobState(
+            job_id="sim-result", request=simple_request,
+            status=SimStatus.COMPLETED, result=result,
+        ))
+        try:
+            resp = client.get("/sim/sim-result/result")
+        finally:
+            sim_api._jobs.pop("sim-result", None)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == result.model_dump(mode="json")
+
+    def test_scratch_slot_recycled_empty(self, tmp_path, monkeypatch):
+        """A released work dir comes back from the pool empty."""
+        import queue
+
+        from clarissa.sim_engine import sim_api
+
+        monkeypatch.setattr(sim_api, "_scratch_root", str(tmp_path))
+        monkeypatch.setattr(sim_api, "_scratch_slots", queue.SimpleQueue())
+        sim_api._init_scratch_pool(1)
+
+        slot = sim_api._checkout_scratch()
+        (Path(slot) / "results.mat").write_bytes(b"x")
+        sim_api._release_scratch(slot)
+        sim_api._scratch_cleaner.submit(lambda: None).result()
+
+        assert sim_api._checkout_scratch() == slot
+        assert os.listdir(slot) == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == [Path(slot).name]
+
+    def test_scratch_root_removed_on_shutdown(self, tmp_path, monkeypatch):
+        """Shutdown deletes the scratch root and empties the slot pool."""
+        import queue
+
+        from clarissa.sim_engine import sim_api
+
+        root = tmp_path / "scratch"
+        root.mkdir()
+        monkeypatch.setattr(sim_api, "_scratch_root", str(root))
+        monkeypatch.setattr(sim_api, "_scratch_slots", queue.SimpleQueue())
+        sim_api._init_scratch_pool(2)
+
+        sim_api._remove_scratch_root()
+
+        assert not root.exists()
+        assert sim_api._scratch_root is None
+        assert sim_api._scratch_slots.empty()
+
+    def test_shutdown_closes_backends(self, monkeypatch):
+        """Backends with a close() method are closed when the app shuts down."""
+        from clarissa.pal import AdapterRegistry
+        from clarissa.sim_engine import sim_api
+        from clarissa.sim_engine.backends import registry
+        from tests.test_sim_engine import MockBackend
+
+        monkeypatch.setattr(registry, "_registry", AdapterRegistry())
+        backend = MockBackend()
+        backend.close = MagicMock()
+        registry.register_backend(backend)
+
+        sim_api._close_backends()
+
+        backend.close.assert_called_once_with()
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Integration: Mock Backend end-to-end
 # ═══════════════════════════════════════════════════════════════════════════
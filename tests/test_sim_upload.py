@@ -314,8 +314,9 @@ class TestUploadEncoding:
 class TestUploadCapacity:
     """Job queue capacity checks."""
 
-    def test_capacity_limit_message(self, client, minimal_deck_bytes):
+    def test_capacity_limit_message(self, client, minimal_deck_bytes, monkeypatch):
         """When jobs are full, 429 returned with clear message."""
+        from clarissa.sim_engine import sim_api
         from clarissa.sim_engine.sim_api import _jobs, _MAX_JOBS
         from clarissa.sim_engine.models import SimStatus, SimRequest
 
@@ -334,6 +335,8 @@ class TestUploadCapacity:
 
         original = dict(_jobs)
         _jobs.update(fake_jobs)
+        # The worker keeps the running count; mirror the fake RUNNING jobs.
+        monkeypatch.setattr(sim_api, "_running_count", _MAX_JOBS)
         try:
             resp = client.post(
                 "/sim/upload?simulator=opm",
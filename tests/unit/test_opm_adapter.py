@@ -0,0 +1,107 @@
+"""Tests for OPMFlowAdapter that do not need Docker.
+
+Docker calls are replaced with a fake ``subprocess.run``; the real
+container round-trip is covered in tests/integration/test_opm_flow.py.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from clarissa.simulators.opm import OPMFlowAdapter
+
+
+@pytest.fixture
+def deck(tmp_path) -> Path:
+    deck_file = tmp_path / "CASE.DATA"
+    deck_file.write_text("RUNSPEC\nEND\n")
+    return deck_file
+
+
+class FakeDocker:
+    """Records docker commands; `flow` writes a PRT into the output mount."""
+
+    def __init__(self):
+        self.calls = []
+        self.output_root = None
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd)
+        if cmd[:2] == ["docker", "run"] and "-d" in cmd:
+            mount = cmd[cmd.index("-v", cmd.index("-v") + 1) + 1]
+            self.output_root = Path(mount.split(":")[0])
+            return subprocess.CompletedProcess(cmd, 0, stdout="cid123\n", stderr="")
+        if cmd[:2] == ["docker", "exec"]:
+            out_dir = cmd[-1].split("=", 1)[1].strip("/").split("/", 1)[1]
+            prt = self.output_root / out_dir / "CASE.PRT"
+            prt.write_text("Simulation complete\n")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+
+class TestPersistentContainer:
+    """persistent=True starts one container and execs every case into it."""
+
+    def test_cases_share_one_container(self, deck):
+        adapter = OPMFlowAdapter(image="opm:test", persistent=True)
+        fake = FakeDocker()
+        with patch("subprocess.run", fake):
+            first = adapter.run(str(deck))
+            second = adapter.run(str(deck))
+            adapter.close()
+
+        commands = [c[:2] for c in fake.calls if c[1] != "info"]
+        assert commands == [
+            ["docker", "run"], ["docker", "exec"], ["docker", "exec"], ["docker", "rm"],
+        ]
+        assert first["converged"] is True
+        assert second["converged"] is True
+        assert not fake.output_root.exists()
+
+
+class TestDockerCheckCache:
+    """docker info is probed once per TTL, and re-probed after a failure."""
+
+    def test_success_is_cached(self):
+        adapter = OPMFlowAdapter()
+        fake = FakeDocker()
+        with patch("subprocess.run", fake):
+            assert adapter._docker_available() is True
+            assert adapter._docker_available() is True
+        assert len(fake.calls) == 1
+
+    def test_failure_is_not_cached(self):
+        adapter = OPMFlowAdapter()
+        with patch("subprocess.run", side_effect=FileNotFoundError) as probe:
+            assert adapter._docker_available() is False
+            assert adapter._docker_available() is False
+        assert probe.call_count == 2
+
+
+class TestPrtScan:
+    """PRT parsing in a single streamed pass."""
+
+    def test_parse_results_from_prt(self, tmp_path, deck):
+        (tmp_path / "CASE.PRT").write_text(
+            "Timestep chopped\n"
+            "Error: well PROD1 shut\n"
+            "Linear solve did not converge\n"
+            "Timestep chopped\n"
+            "Simulation complete\n"
+        )
+        result = OPMFlowAdapter()._parse_results(
+            deck, tmp_path, subprocess.CompletedProcess([], 0),
+        )
+        assert result["converged"] is False
+        assert result["errors"] == ["Error: well PROD1 shut", "LINEAR_SOLVE_FAILURE"]
+        assert result["metrics"]["timestep_chops"] == 2
+
+    def test_artifacts_collected_in_order(self, tmp_path, deck):
+        for name in ("CASE.UNRST", "CASE.PRT", "CASE.EGRID", "OTHER.INIT", "CASE.log"):
+            (tmp_path / name).write_text("Simulation complete\n")
+        result = OPMFlowAdapter()._parse_results(
+            deck, tmp_path, subprocess.CompletedProcess([], 0),
+        )
+        assert list(result["artifacts"]) == ["PRT", "EGRID", "UNRST"]
+        assert result["artifacts"]["PRT"] == str(tmp_path / "CASE.PRT")
@@ -0,0 +1,377 @@
+"""
+Tests for clarissa.voice.intent.IntentParser.
+
+No API keys are needed: rules run as-is, LLM backends are stubbed.
+"""
+
+import asyncio
+
+import pytest
+
+from clarissa.voice.intent import (
+    IntentParser,
+    IntentType,
+    SemanticIntentCache,
+    _vocabulary_hits,
+)
+
+
+@pytest.fixture
+def parser():
+    return IntentParser()
+
+
+def test_vocabulary_hits_include_overlapping_keywords():
+    """Keywords sharing a start or overlapping each other are all reported."""
+    assert _vocabulary_hits("what is the water cut") == {"what", "water cut"}
+    assert _vocabulary_hits("show me the value") == {"show", "show me the value"}
+    assert _vocabulary_hits("run the model") == {"run the model", "model"}
+
+
+@pytest.mark.parametrize("text, intent_type, slots", [
+    ("show permeability at layer 3", IntentType.VISUALIZE_PROPERTY,
+     {"property": "permeability", "layer": 3}),
+    ("plot oil sat cross section at 200 days", IntentType.VISUALIZE_PROPERTY,
+     {"property": "oil_saturation", "time_days": 200, "view_type": "cross_section_xy"}),
+    ("what is the water cut for prod 2", IntentType.QUERY_VALUE,
+     {"property": "water_cut", "well": "PROD2"}),
+    ("go to the schedule", IntentType.NAVIGATE, {"target": "schedule"}),
+    ("export as csv", IntentType.EXPORT_RESULTS, {"format": "csv"}),
+])
+def test_rule_intents(parser, text, intent_type, slots):
+    intent = parser._parse_with_rules(text)
+    assert intent.type == intent_type
+    assert intent.slots == slots
+    assert intent.parse_method == "rules"
+
+
+def test_unmatched_text_falls_through(parser):
+    assert parser._parse_with_rules("lorem ipsum") is None
+
+
+class TestParseCache:
+    """parse() caches non-UNKNOWN results by normalized text."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_utterance_served_from_cache(self, parser, monkeypatch):
+        calls = []
+        parse_rules = parser._parse_with_rules
+        monkeypatch.setattr(
+            parser, "_parse_with_rules",
+            lambda text, key: calls.append((text, key)) or parse_rules(text, key),
+        )
+        first = await parser.parse("Show permeability")
+        second = await parser.parse("  show PERMEABILITY ")
+        assert calls == [("Show permeability", "show permeability")]
+        assert second.slots == first.slots
+        assert second.raw_text == "  show PERMEABILITY "
+        second.slots["layer"] = 1
+        assert "layer" not in (await parser.parse("show permeability")).slots
+
+    @pytest.mark.asyncio
+    async def test_llm_results_expire(self, parser, monkeypatch):
+        parser.enable_rules = False
+        parser.anthropic_available = True
+        calls = []
+
+        async def fake_claude(text):
+            calls.append(text)
+            return parser._parse_llm_response(
+                '{"intent": "help", "confidence": 0.9}', text, "claude",
+            )
+
+        monkeypatch.setattr(parser, "_parse_with_claude", fake_claude)
+        await parser.parse("what now")
+        await parser.parse("what now")
+        assert len(calls) == 1
+        monkeypatch.setattr(parser, "LLM_CACHE_TTL_S", -1.0)
+        parser._cache.clear()
+        await parser.parse("what now")
+        await parser.parse("what now")
+        assert len(calls) == 3
+
+    def test_cache_shared_across_threads(self, parser, monkeypatch):
+        """Concurrent lookups and evictions from several threads do not raise."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(parser, "CACHE_SIZE", 4)
+        monkeypatch.setattr(parser, "LLM_CACHE_TTL_S", 0.0)
+        intent = parser._parse_with_rules("yes")
+
+        def work(n):
+            for i in range(500):
+                key = f"k{(n + i) % 8}"
+                parser._remember(key, intent, parser.LLM_CACHE_TTL_S)
+                parser._parse_fast(key, key)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(work, range(4)))
+        assert len(parser._cache) <= 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_not_cached(self, parser):
+        parser.anthropic_available = parser.openai_available = False
+        await parser.parse("lorem ipsum")
+        assert parser._cache == {}
+
+
+class TestSemanticCache:
+    """Paraphrases close in embedding space reuse the cached LLM intent."""
+
+    VECTORS = {
+        "please bring up perm": [1.0, 0.0, 0.0],
+        "could you bring up perm": [0.99, 0.05, 0.0],
+        "something unrelated": [0.0, 0.0, 1.0],
+    }
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_hits_cache(self, tmp_path):
+        cache = SemanticIntentCache(self.VECTORS.get, path=str(tmp_path / "cache.pkl"))
+        parser = IntentParser(semantic_cache=cache)
+        parser.anthropic_available = True
+        calls = []
+
+        async def fake_claude(text):
+            calls.append(text)
+            return parser._parse_llm_response(
+                '{"intent": "visualize_property", "confidence": 0.9,'
+                ' "slots": {"property": "permeability"}}',
+                text, "claude",
+            )
+
+        parser._parse_with_claude = fake_claude
+        first = await parser.parse("please bring up perm")
+        second = await parser.parse("could you bring up perm")
+        await parser.parse("something unrelated")
+
+        assert calls == ["please bring up perm", "something unrelated"]
+        assert first.parse_method == "claude"
+        assert second.parse_method == "semantic_cache"
+        assert second.slots == {"property": "permeability"}
+        assert second.raw_text == "could you bring up perm"
+
+        cache.save()
+        reloaded = SemanticIntentCache(self.VECTORS.get, path=cache.path)
+        assert len(reloaded) == 2
+
+    @pytest.mark.asyncio
+    async def test_different_number_is_a_miss(self):
+        vectors = {
+            "bring up perm in layer 3": [1.0, 0.0],
+            "bring up perm in layer 5": [0.999, 0.01],
+        }
+        parser = IntentParser(semantic_cache=SemanticIntentCache(vectors.get))
+        parser.anthropic_available = True
+        calls = []
+
+        async def fake_claude(text):
+            calls.append(text)
+            return parser._parse_llm_response(
+                '{"intent": "visualize_property", "confidence": 0.9,'
+                ' "slots": {"property": "permeability", "layer": %s}}' % text[-1],
+                text, "claude",
+            )
+
+        parser._parse_with_claude = fake_claude
+        await parser.parse("bring up perm in layer 3")
+        second = await parser.parse("bring up perm in layer 5")
+        assert calls == ["bring up perm in layer 3", "bring up perm in layer 5"]
+        assert second.slots["layer"] == 5
+
+    @pytest.mark.asyncio
+    async def test_dangerous_intents_not_cached(self):
+        cache = SemanticIntentCache(lambda text: [1.0, 0.0])
+        parser = IntentParser(semantic_cache=cache)
+        parser.anthropic_available = True
+
+        async def fake_claude(text):
+            return parser._parse_llm_response(
+                '{"intent": "run_simulation", "confidence": 0.99}', text, "claude",
+            )
+
+        parser._parse_with_claude = fake_claude
+        await parser.parse("kick off the run")
+        assert len(cache) == 0
+
+
+def test_parse_sync_inside_running_loop(parser):
+    """LLM misses from parse_sync run on one background loop, even inside a coroutine."""
+    from clarissa.voice import intent as intent_module
+    from clarissa.voice.sync_loop import get_sync_loop
+
+    loops = []
+
+    async def fake_llm(text):
+        loops.append(asyncio.get_running_loop())
+        return intent_module.Intent(IntentType.HELP, 0.9, raw_text=text, parse_method="claude")
+
+    parser._parse_with_llm = fake_llm
+
+    async def call():
+        return parser.parse_sync("lorem ipsum")
+
+    assert asyncio.run(call()).type == IntentType.HELP
+    assert parser.parse_sync("dolor sit amet").type == IntentType.HELP
+    assert len(loops) == 2
+    assert loops[0] is loops[1] is get_sync_loop()
+
+
+def test_parse_sync_rule_hit_skips_event_loop(monkeypatch):
+    """Rule hits are answered synchronously without the background loop."""
+    from clarissa.voice import intent as intent_module
+
+    def no_loop():
+        raise AssertionError("event loop used for a rule hit")
+
+    monkeypatch.setattr(intent_module, "get_sync_loop", no_loop)
+    parser = IntentParser()
+    assert parser.parse_sync("cancel").type == IntentType.CANCEL
+    assert parser.parse_sync("what is the oil rate").slots == {"property": "oil_rate"}
+
+
+@pytest.mark.parametrize("reply", [
+    '{"intent": "undo"}',
+    '```json\n{"intent": "undo", "slots": {}}\n```',
+    'Sure:\n```\n{"intent": "undo"}\n```\nAnything else?',
+    'Here it is: {"intent": "undo"}',
+])
+def test_llm_reply_json_extraction(parser, reply):
+    intent = parser._parse_llm_response(reply, "undo that", "claude")
+    assert intent.type == IntentType.UNDO
+    assert intent.parse_method == "claude"
+
+
+def _fake_anthropic(monkeypatch, reply='{"intent": "help", "confidence": 0.9}', connect_s=0.0):
+    """Install a stub ``anthropic`` module; returns the list of created clients."""
+    import sys
+    import types
+
+    clients = []
+
+    class Stream:
+        def __init__(self):
+            self.sent = []
+
+        async def __aenter__(self):
+            await asyncio.sleep(connect_s)
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        @property
+        async def text_stream(self):
+            for i in range(0, len(reply), 4):
+                self.sent.append(reply[i:i + 4])
+                yield reply[i:i + 4]
+
+    class Messages:
+        def __init__(self):
+            self.streams = []
+
+        def stream(self, **kwargs):
+            self.streams.append(Stream())
+            return self.streams[-1]
+
+    class AsyncAnthropic:
+        def __init__(self):
+            self.messages = Messages()
+            clients.append(self)
+
+    module = types.ModuleType("anthropic")
+    module.AsyncAnthropic = AsyncAnthropic
+    monkeypatch.setitem(sys.modules, "anthropic", module)
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_llm_client_created_once(parser, monkeypatch):
+    clients = _fake_anthropic(monkeypatch)
+    assert (await parser._parse_with_claude("first")).type == IntentType.HELP
+    assert (await parser._parse_with_claude("second")).type == IntentType.HELP
+    assert len(clients) == 1
+
+
+def test_llm_client_rebuilt_for_new_loop(parser, monkeypatch):
+    """A client from a finished loop is not reused by a later one."""
+    clients = _fake_anthropic(monkeypatch)
+    asyncio.run(parser._parse_with_claude("first"))
+    asyncio.run(parser._parse_with_claude("second"))
+    assert len(clients) == 2
+
+
+@pytest.mark.parametrize("value", ['"teleport"', "null", '["help"]'])
+def test_llm_reply_unknown_intent_name(parser, value):
+    intent = parser._parse_llm_response('{"intent": %s}' % value, "x", "openai")
+    assert intent.type == IntentType.UNKNOWN
+
+
+@pytest.mark.asyncio
+async def test_llm_stream_stops_at_end_of_json(parser, monkeypatch):
+    """The reply is parsed once its JSON object closes; trailing text is not read."""
+    reply = (
+        'Sure.\n```json\n{"intent": "help", "slots": {"note": "a } in \\" text"}}\n```'
+        + "x" * 40
+    )
+    clients = _fake_anthropic(monkeypatch, reply)
+    intent = await parser._parse_with_claude("help please")
+    assert intent.type == IntentType.HELP
+    assert intent.slots == {"note": 'a } in " text'}
+    sent = "".join(clients[0].messages.streams[0].sent)
+    assert len(sent) < len(reply) - 30
+
+
+@pytest.mark.asyncio
+async def test_llm_timeout_covers_request(parser, monkeypatch):
+    """A request that never gets a response times out too, not only a slow stream."""
+    _fake_anthropic(monkeypatch, connect_s=10.0)
+    monkeypatch.setattr(parser, "LLM_TIMEOUT_S", 0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        await parser._parse_with_claude("help please")
+
+
+class TestParseBatch:
+    """parse_batch sends only rule misses, together, to the LLM."""
+
+    @staticmethod
+    def _client(reply, requests):
+        import types
+
+        async def create(**kwargs):
+            requests.append(kwargs["messages"][-1]["content"])
+            return types.SimpleNamespace(content=[types.SimpleNamespace(text=reply)])
+
+        return types.SimpleNamespace(messages=types.SimpleNamespace(create=create))
+
+    @pytest.mark.asyncio
+    async def test_misses_share_one_request(self, parser):
+        requests = []
+        parser.anthropic_available = True
+        parser._anthropic_client = self._client(
+            '```json\n[{"intent": "run_sensitivity"}, {"intent": "undo"}]\n```', requests,
+        )
+        parser._anthropic_loop = asyncio.get_running_loop()
+        intents = await parser.parse_batch(["vary porosity", "yes", "take that back"])
+
+        assert [i.type for i in intents] == [
+            IntentType.RUN_SENSITIVITY, IntentType.CONFIRM, IntentType.UNDO,
+        ]
+        assert len(requests) == 1
+        assert "1. vary porosity\n2. take that back" in requests[0]
+        assert intents[2].raw_text == "take that back"
+
+    @pytest.mark.asyncio
+    async def test_mismatched_reply_falls_back_per_command(self, parser, monkeypatch):
+        parser.anthropic_available = True
+        parser._anthropic_client = self._client('[{"intent": "undo"}]', [])
+        parser._anthropic_loop = asyncio.get_running_loop()
+        single = []
+
+        async def fake_remote(text, key):
+            single.append(text)
+            return parser._intent_from_data({"intent": "help"}, text, "claude")
+
+        monkeypatch.setattr(parser, "_parse_remote", fake_remote)
+        intents = await parser.parse_batch(["vary porosity", "take that back"])
+        assert single == ["vary porosity", "take that back"]
+        assert all(i.type == IntentType.HELP for i in intents)
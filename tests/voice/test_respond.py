@@ -387,5 +387,25 @@ class TestDynamicSlotInsertion:
             assert target in response
 
 
+
+class TestCompiledTemplates:
+    """The real ResponseGenerator, with templates compiled at import."""
+
+    def test_visualize_uses_only_needed_variables(self):
+        from clarissa.voice import execute, intent, respond
+
+        parsed = intent.Intent(
+            intent.IntentType.VISUALIZE_PROPERTY, 0.95, {"property": "porosity", "layer": 2},
+        )
+        result = execute.ExecutionResult(success=True)
+        text = respond.ResponseGenerator().generate(parsed, result)
+        assert text == "Showing porosity at layer 2."
+
+    def test_unknown_variable_is_not_compiled(self):
+        from clarissa.voice import respond
+
+        assert respond._compile_template("Value: {missing}") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -21,6 +21,8 @@ from clarissa.voice.transcribe import (
     TranscriptionTimeout,
     DOMAIN_VOCABULARY,
     WHISPER_COST_PER_MINUTE,
+    _DOMAIN_PROMPT,
+    _STREAM_WAV_HEADER,
 )
 
 
@@ -139,6 +141,244 @@ class TestWhisperTranscriber:
         
         assert exc_info.value.retry_after == 30.0
 
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self):
+        """One pooled client serves every call until aclose()."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"text": "ok"}
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+            
+            async with WhisperTranscriber(api_key="test-key") as transcriber:
+                await transcriber.transcribe(b'\x00' * 3200)
+                await transcriber.transcribe(b'\x00' * 3200)
+        
+        assert mock_client.call_count == 1
+        assert mock_instance.post.await_count == 2
+        mock_instance.aclose.assert_awaited_once()
+        assert transcriber._client is None
+
+    @pytest.mark.asyncio
+    async def test_aiohttp_transport(self, monkeypatch):
+        """transport="aiohttp" posts the same form fields through one session."""
+        import sys
+        import types
+        
+        sessions = []
+        
+        class Response:
+            status = 200
+            headers = {}
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc):
+                return False
+            
+            async def json(self):
+                return {"text": " via aiohttp "}
+        
+        class FormData:
+            def __init__(self):
+                self.fields = {}
+            
+            def add_field(self, name, value, **kwargs):
+                self.fields[name] = value
+        
+        class ClientSession:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+                self.posts = []
+                self.closed = False
+                sessions.append(self)
+            
+            def post(self, url, data):
+                self.posts.append((url, data.fields))
+                return Response()
+            
+            async def close(self):
+                self.closed = True
+        
+        module = types.ModuleType("aiohttp")
+        module.ClientSession = ClientSession
+        module.FormData = FormData
+        module.ClientTimeout = lambda total: total
+        module.TCPConnector = lambda limit: limit
+        monkeypatch.setitem(sys.modules, "aiohttp", module)
+        
+        async with WhisperTranscriber(api_key="test-key", transport="aiohttp") as transcriber:
+            result = await transcriber.transcribe(b'\x00' * 3200, prompt="PROD1")
+            await transcriber.transcribe(b'\x00' * 3200)
+        
+        assert result.text == "via aiohttp"
+        assert len(sessions) == 1 and sessions[0].closed
+        assert sessions[0].kwargs["headers"] == {"Authorization": "Bearer test-key"}
+        url, fields = sessions[0].posts[0]
+        assert url == WhisperTranscriber.API_URL
+        assert fields["model"] == "whisper-1"
+        assert fields["prompt"].startswith("PROD1\n\n")
+
+    def test_unknown_transport_raises(self):
+        with pytest.raises(ValueError, match="Unknown transport"):
+            WhisperTranscriber(api_key="test-key", transport="grpc")
+
+    def test_transcribe_sync_reuses_loop_and_client(self):
+        """Sync calls share one background loop, so the client pool survives."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"text": "ok"}
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+            
+            transcriber = WhisperTranscriber(api_key="test-key")
+            assert transcriber.transcribe_sync(b'\x00' * 3200).text == "ok"
+            assert transcriber.transcribe_sync(b'\x00' * 3200).text == "ok"
+        
+        assert mock_client.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_transcribe_stream_uploads_chunks_as_multipart(self):
+        """Streamed PCM is sent after a WAV header inside a multipart body."""
+        import email
+
+        import httpx
+        
+        received = {}
+        
+        async def handler(request):
+            received["type"] = request.headers["Content-Type"]
+            received["body"] = await request.aread()
+            return httpx.Response(200, json={"text": " streamed "})
+        
+        async def pcm():
+            yield b"\x01\x02" * 8000
+            yield b"\x03\x04" * 8000
+        
+        transcriber = WhisperTranscriber(api_key="test-key")
+        transcriber._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        transcriber._client_loop = asyncio.get_running_loop()
+        result = await transcriber.transcribe_stream(pcm(), prompt="INJ1")
+        await transcriber.aclose()
+        
+        assert result.text == "streamed"
+        assert result.duration_ms == 1000
+        message = email.message_from_bytes(
+            b"Content-Type: " + received["type"].encode() + b"\r\n\r\n" + received["body"]
+        )
+        parts = {
+            part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+            for part in message.get_payload()
+        }
+        assert parts["model"] == b"whisper-1"
+        assert parts["prompt"].startswith(b"INJ1\n\n")
+        assert parts["file"] == _STREAM_WAV_HEADER + b"\x01\x02" * 8000 + b"\x03\x04" * 8000
+
+    def test_sync_loop_uses_uvloop_when_installed(self, monkeypatch):
+        import sys
+        import types
+        
+        from clarissa.voice import transcribe as transcribe_module
+        
+        uvloop = types.ModuleType("uvloop")
+        uvloop.new_event_loop = Mock(side_effect=asyncio.new_event_loop)
+        monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+        transcribe_module._new_event_loop().close()
+        uvloop.new_event_loop.assert_called_once_with()
+        
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        loop = transcribe_module._new_event_loop()
+        assert isinstance(loop, asyncio.AbstractEventLoop)
+        loop.close()
+
+    def test_sync_loop_shared_with_intent_parser(self):
+        """transcribe_sync and parse_sync share one background loop."""
+        from clarissa.voice.sync_loop import get_sync_loop
+        
+        factory = Mock(side_effect=asyncio.new_event_loop)
+        loop = get_sync_loop(factory)
+        assert get_sync_loop() is loop
+        assert factory.call_count <= 1
+        assert loop.is_running()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_path_streams_file(self, tmp_path, monkeypatch):
+        """A file on disk is streamed (chunked) into the upload under its own name."""
+        import httpx
+        
+        from clarissa.voice import transcribe as transcribe_module
+        
+        monkeypatch.setattr(transcribe_module, "_FILE_CHUNK_SIZE", 1000)
+        audio = tmp_path / "take1.wav"
+        audio.write_bytes(bytes(range(256)) * 250)
+        received = {}
+        
+        async def handler(request):
+            received["headers"] = request.headers
+            received["body"] = await request.aread()
+            return httpx.Response(200, json={"text": "from disk"})
+        
+        transcriber = WhisperTranscriber(api_key="test-key")
+        transcriber._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        transcriber._client_loop = asyncio.get_running_loop()
+        result = await transcriber.transcribe_path(str(audio))
+        await transcriber.aclose()
+        
+        body = received["body"]
+        assert result.text == "from disk"
+        assert result.duration_ms == 2000
+        assert received["headers"]["Transfer-Encoding"] == "chunked"
+        assert b'filename="take1.wav"' in body
+        assert audio.read_bytes() in body
+
+    @pytest.mark.asyncio
+    async def test_transcribe_files_bounded_and_ordered(self, monkeypatch):
+        transcriber = WhisperTranscriber(api_key="test-key")
+        active = []
+        peak = []
+        
+        async def fake_path(path, prompt=None):
+            active.append(path)
+            peak.append(len(active))
+            await asyncio.sleep(0.001 * (5 - int(path)))
+            active.remove(path)
+            return TranscriptionResult(text=f"file {path}")
+        
+        monkeypatch.setattr(transcriber, "transcribe_path", fake_path)
+        results = await transcriber.transcribe_files(list("012345"), max_concurrency=2)
+        
+        assert [r.text for r in results] == [f"file {i}" for i in range(6)]
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_duration_from_bytes_or_file(self):
+        """Bytes are sized by len(); file objects are sized and rewound."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"text": "ok"}
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+            
+            transcriber = WhisperTranscriber(api_key="test-key")
+            from_bytes = await transcriber.transcribe(b'\x00' * 48000)
+            buffer = io.BytesIO(b'\x00' * 16000)
+            buffer.read()
+            from_file = await transcriber.transcribe(buffer)
+        
+        assert from_bytes.duration_ms == 1500
+        assert from_file.duration_ms == 500
+        assert buffer.tell() == 0
+
     def test_metrics_tracking(self):
         transcriber = WhisperTranscriber(api_key="test-key")
         
@@ -183,6 +423,131 @@ class TestLocalWhisperTranscriber:
             with pytest.raises(ImportError, match="faster-whisper not installed"):
                 transcriber._load_model()
 
+    @pytest.mark.asyncio
+    async def test_prompt_tokenized_once(self):
+        """The domain prompt is encoded once and passed to the model as ids."""
+        model = Mock()
+        model.hf_tokenizer.encode.return_value = Mock(ids=[11, 22, 33])
+        model.transcribe.return_value = (
+            [Mock(text=" show pressure")], Mock(language="en", language_probability=0.9),
+        )
+        transcriber = LocalWhisperTranscriber()
+        transcriber._model = model
+        
+        result = await transcriber.transcribe("a.wav")
+        await transcriber.transcribe("b.wav")
+        
+        assert result.text == "show pressure"
+        model.hf_tokenizer.encode.assert_called_once_with(
+            " " + _DOMAIN_PROMPT, add_special_tokens=False,
+        )
+        assert model.transcribe.call_args.kwargs["initial_prompt"] == [11, 22, 33]
+
+
+    @pytest.mark.asyncio
+    async def test_batched_pipeline_used_when_available(self, monkeypatch):
+        """The model is wrapped in BatchedInferencePipeline and decoded in batches."""
+        import sys
+        import types
+        
+        info = Mock(language="en", language_probability=0.9)
+        pipeline = Mock()
+        pipeline.transcribe.return_value = ([Mock(text=" hi")], info)
+        module = types.ModuleType("faster_whisper")
+        module.WhisperModel = Mock(return_value=Mock(hf_tokenizer=None))
+        module.BatchedInferencePipeline = Mock(return_value=pipeline)
+        monkeypatch.setitem(sys.modules, "faster_whisper", module)
+        
+        transcriber = LocalWhisperTranscriber(model_size="tiny", batch_size=4)
+        result = await transcriber.transcribe("a.wav")
+        
+        assert result.text == "hi"
+        module.BatchedInferencePipeline.assert_called_once_with(model=transcriber._model)
+        assert pipeline.transcribe.call_args.kwargs["batch_size"] == 4
+        
+        del module.BatchedInferencePipeline
+        sequential = LocalWhisperTranscriber(model_size="tiny")
+        sequential._load_model()
+        assert sequential._pipeline is None
+
+
+    @pytest.mark.parametrize("device, cuda_devices, compute_type, cpu_threads", [
+        ("auto", 1, "int8_float16", 0),
+        ("auto", 0, "int8", os.cpu_count()),
+        ("cpu", 1, "int8", os.cpu_count()),
+    ])
+    def test_auto_compute_type_is_int8(
+        self, monkeypatch, device, cuda_devices, compute_type, cpu_threads,
+    ):
+        import sys
+        import types
+        
+        whisper = types.ModuleType("faster_whisper")
+        whisper.WhisperModel = Mock()
+        ctranslate2 = types.ModuleType("ctranslate2")
+        ctranslate2.get_cuda_device_count = lambda: cuda_devices
+        monkeypatch.setitem(sys.modules, "faster_whisper", whisper)
+        monkeypatch.setitem(sys.modules, "ctranslate2", ctranslate2)
+        
+        transcriber = LocalWhisperTranscriber(device=device, batched=False)
+        transcriber._load_model()
+        
+        kwargs = whisper.WhisperModel.call_args.kwargs
+        assert kwargs["compute_type"] == transcriber.compute_type == compute_type
+        assert kwargs["cpu_threads"] == cpu_threads
+
+
+    @pytest.mark.asyncio
+    async def test_transcribe_stream_commits_agreed_words_and_trims(self):
+        """Words are committed once two rounds agree; the window stays bounded."""
+        import numpy as np
+        
+        # Word i spans (0.4 * i + 0.1, 0.4 * (i + 1)) s, in 10 ms ticks;
+        # one second of silence follows the last
+        script = [(40 * i + 10, 40 * (i + 1), f"w{i}") for i in range(20)]
+        total_s = script[-1][1] / 100 + 1.0
+        windows = []
+        
+        class Model:
+            hf_tokenizer = None
+            
+            def transcribe(self, audio, **kwargs):
+                # Each sample holds its stream time in 10 ms ticks
+                start = round(float(audio[0]) * 32768)
+                length = audio.size // 160
+                windows.append(length / 100)
+                words = []
+                for word_start, word_end, text in script:
+                    if start < word_end <= start + length:
+                        # Words near the edge of the window change every round
+                        if word_end > start + length - 30:
+                            text += f"~{len(windows)}"
+                        words.append(Mock(
+                            start=(word_start - start) / 100,
+                            end=(word_end - start) / 100,
+                            word=" " + text,
+                        ))
+                return [Mock(words=words)], Mock()
+        
+        ticks = (np.arange(int(total_s * 16000)) // 160).astype(np.int16).tobytes()
+        queue = asyncio.Queue(maxsize=1)
+        
+        async def record():
+            for i in range(0, len(ticks), 8000):
+                await queue.put(ticks[i:i + 8000])
+            await queue.put(None)
+        
+        transcriber = LocalWhisperTranscriber()
+        transcriber._model = Model()
+        recorder = asyncio.create_task(record())
+        committed = [text async for text in transcriber.transcribe_stream(queue, max_buffer_s=3.0)]
+        await recorder
+        
+        assert " ".join(committed).split() == [word for _, _, word in script]
+        assert len(committed) > 5
+        assert max(windows) <= 3.0
+        assert transcriber.metrics.total_requests == len(windows)
+
 
 class TestTranscriberFactory:
     """Tests for TranscriberFactory."""
@@ -225,6 +590,10 @@ class TestDomainVocabulary:
     def test_vocabulary_is_not_empty(self):
         assert len(DOMAIN_VOCABULARY) > 100
 
+    def test_prompt_form_collapses_whitespace(self):
+        assert _DOMAIN_PROMPT.split() == DOMAIN_VOCABULARY.split()
+        assert "\n" not in _DOMAIN_PROMPT and "  " not in _DOMAIN_PROMPT
+
 
 class TestCostCalculation:
     """Tests for cost calculation."""
@@ -43,6 +43,10 @@ class TestAudioConfig:
         assert config.chunk_size_samples == 1600
         assert config.chunk_size_bytes == 3200  # 1600 * 2 bytes
 
+    def test_bytes_per_second(self):
+        config = AudioConfig(sample_rate=8000, channels=2, bit_depth=16)
+        assert config.bytes_per_second == 32000
+
 
 class TestAudioBuffer:
     """Tests for AudioBuffer."""
@@ -162,6 +166,20 @@ class TestAudioCapture:
         chunk = capture.process_chunk(loud, 100)
         assert chunk.energy_db > -20
 
+    def test_energy_full_scale_ignores_trailing_byte(self):
+        # ±16384 square wave is exactly -6.02 dB FS; a dangling odd byte is dropped
+        square = np.array([16384, -16384] * 800, dtype="<i2").tobytes() + b"\x7f"
+        energy = AudioCapture._compute_energy_db(square)
+        assert energy == pytest.approx(20 * np.log10(0.5))
+
+    def test_energy_without_numpy_matches(self, monkeypatch):
+        import sys
+
+        data = np.random.default_rng(0).integers(-32768, 32767, 1601, dtype="<i2").tobytes()
+        expected = AudioCapture._compute_energy_db(data)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        assert AudioCapture._compute_energy_db(data) == pytest.approx(expected, abs=1e-9)
+
     def test_should_transcribe(self):
         config = AudioConfig(min_duration_s=0.5, max_duration_s=1.0)
         capture = AudioCapture(config=config)
@@ -248,6 +266,42 @@ class TestVoiceActivityDetector:
         assert result.energy_db > -40
         # Note: is_speech depends on smoothing, may not trigger immediately
 
+    @pytest.mark.parametrize("onnxruntime_installed", [True, False])
+    def test_onnx_model_preferred(self, monkeypatch, onnxruntime_installed):
+        """The Silero ONNX export is loaded whenever ONNX Runtime is importable."""
+        import sys
+        import types
+
+        loads = []
+        torch = types.ModuleType("torch")
+        torch.hub = types.SimpleNamespace(
+            load=lambda **kwargs: loads.append(kwargs) or (object(), [None]),
+        )
+        monkeypatch.setitem(sys.modules, "torch", torch)
+        monkeypatch.setitem(
+            sys.modules, "onnxruntime",
+            types.ModuleType("onnxruntime") if onnxruntime_installed else None,
+        )
+
+        VoiceActivityDetector()._load_model()
+        assert loads[0]["onnx"] is onnxruntime_installed
+
+    def test_peak_gate_skips_model_on_silence(self):
+        """Near-silent chunks never reach the model."""
+        vad = VoiceActivityDetector()
+        vad._model = object()
+        vad._model_loaded = True
+        calls = []
+        vad._run_model = lambda samples: calls.append(len(samples)) or 0.9
+
+        quiet = np.full(1600, -150, dtype=np.int16).tobytes()
+        assert vad.process_chunk(quiet, 0).probability == 0.0
+        assert calls == []
+
+        clipped = np.full(1600, -32768, dtype=np.int16).tobytes()
+        assert vad.process_chunk(clipped, 30).probability == 0.9
+        assert calls == [1600]
+
     def test_smoothing(self):
         """Test that smoothing prevents rapid state changes."""
         config = VADConfig(min_speech_duration_ms=100, min_silence_duration_ms=200)
@@ -261,6 +315,74 @@ class TestVoiceActivityDetector:
         result = vad.process_chunk(loud, 0)
         assert result.is_speech is False  # Not yet, due to smoothing
 
+    def test_model_input_scaled_in_reused_buffer(self):
+        """Model input is the int16 frame scaled to [-1, 1) in one scratch array."""
+        vad = VoiceActivityDetector()
+        vad._model = object()
+        vad._model_loaded = True
+        seen = []
+        vad._run_model = lambda samples: seen.append((samples, samples.copy())) or 0.9
+
+        first = np.full(480, -32768, dtype=np.int16)
+        second = np.arange(480, dtype=np.int16) * 64
+        vad.process_chunks([first.tobytes(), second.tobytes()], [0, 30])
+
+        assert seen[0][0].base is seen[1][0].base
+        np.testing.assert_array_equal(seen[0][1], np.full(480, -1.0, dtype=np.float32))
+        np.testing.assert_array_equal(seen[1][1], second.astype(np.float32) / 32768.0)
+
+    def test_process_chunks_matches_single_chunks(self):
+        """Batched processing gives the same results, in order, as one chunk at a time."""
+        rng = np.random.default_rng(7)
+        chunks = [
+            (rng.standard_normal(480) * scale).astype(np.int16).tobytes()
+            for scale in (0, 50, 8000, 8000, 12000, 0, 9000, 100, 0, 0)
+        ]
+        timestamps = [i * 30 for i in range(len(chunks))]
+        config = VADConfig(min_speech_duration_ms=30, min_silence_duration_ms=60)
+
+        def detector():
+            vad = VoiceActivityDetector(config)
+            vad._model = object()
+            vad._model_loaded = True
+            vad._run_model = lambda samples: min(1.0, float(np.abs(samples).mean()) * 10)
+            return vad
+
+        single = detector()
+        expected = [single.process_chunk(c, t) for c, t in zip(chunks, timestamps)]
+        batched = detector().process_chunks(chunks, timestamps)
+
+        assert [r.is_speech for r in batched] == [r.is_speech for r in expected]
+        assert [r.probability for r in batched] == [r.probability for r in expected]
+        assert [r.energy_db for r in batched] == pytest.approx([r.energy_db for r in expected])
+
+    @pytest.mark.parametrize("energy_db, probability", [
+        (-60.0, 0.1), (-50.0, 0.1), (-45.0, 0.6), (-40.0, 0.9), (-20.0, 0.9),
+    ])
+    def test_energy_fallback_probability(self, energy_db, probability):
+        assert VoiceActivityDetector()._energy_vad(energy_db) == pytest.approx(probability)
+
+    def test_energy_exact_for_full_scale(self):
+        """Integer sums of squares give exact dB values, per chunk or batched."""
+        vad = VoiceActivityDetector()
+        frames = np.array([[-32768] * 480, [16384, -16384] * 240, [0] * 480], dtype=np.int16)
+
+        assert vad._calculate_energy(frames[0]) == 0.0
+        assert vad._calculate_energies(frames) == [
+            0.0, 20 * np.log10(0.5), -100.0,
+        ]
+        assert [vad._calculate_energy(f) for f in frames] == vad._calculate_energies(frames)
+
+    def test_pre_buffer_keeps_padding_window(self):
+        """Only the last 2 * speech_pad_ms of frames are kept; the tail is returned."""
+        vad = VoiceActivityDetector(VADConfig(speech_pad_ms=300, frame_duration_ms=30))
+        for i in range(25):
+            vad._update_pre_buffer(bytes([i]), i * 30)
+        
+        assert len(vad._pre_buffer) == 20
+        assert vad._pre_buffer[0] == (bytes([5]), 150)
+        assert vad.get_pre_speech_audio() == bytes(range(15, 25))
+
     def test_reset(self):
         vad = VoiceActivityDetector()
         vad._is_speaking = True
@@ -297,6 +419,16 @@ class TestSimpleVAD:
         # Should detect as speech due to energy
         assert confidence > 0.3
 
+    def test_zero_crossing_rate_sets_confidence(self):
+        """Loud audio is speech; ZCR in (0.1, 0.5) raises confidence to 0.9."""
+        vad = SimpleVAD()
+        # Four samples per half period: one sign change every four samples
+        moderate = np.tile([20000, 20000, 20000, 20000, -20000, -20000, -20000, -20000], 200)
+        alternating = np.tile([32767, -32768], 800)
+        
+        assert vad.is_speech(moderate.astype(np.int16).tobytes()) == (True, 0.9)
+        assert vad.is_speech(alternating.astype(np.int16).tobytes()) == (True, 0.6)
+
 
 class TestIntegration:
     """Integration tests for voice pipeline."""
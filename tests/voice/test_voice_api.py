@@ -0,0 +1,88 @@
+"""
+Tests for the CLARISSA Voice API upload endpoint.
+
+Whisper is not called: either OPENAI_API_KEY is unset (demo mode) or the
+request is rejected before transcription.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """FastAPI test client for the voice API, without an OpenAI key."""
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        pytest.skip("fastapi[testclient] not available")
+
+    from clarissa.voice import api
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return TestClient(api.app)
+
+
+def test_demo_mode_without_key(client):
+    """Small upload without an API key returns the demo-mode transcript."""
+    resp = client.post("/api/voice", files={"audio": ("a.webm", b"\x00" * 10, "audio/webm")})
+    assert resp.status_code == 200
+    assert resp.json()["intent"]["type"] == "unknown"
+
+
+def test_oversized_audio_rejected(client, monkeypatch):
+    """Uploads over the cap are rejected with 413 without reading the file."""
+    from starlette.datastructures import UploadFile
+
+    from clarissa.voice import api
+
+    async def no_read(self, size=-1):
+        raise AssertionError("oversized upload was read")
+
+    monkeypatch.setattr(api, "_MAX_AUDIO_BYTES", 100 * 1024)
+    monkeypatch.setattr(UploadFile, "read", no_read)
+    resp = client.post(
+        "/api/voice", files={"audio": ("a.webm", b"\x00" * (200 * 1024), "audio/webm")},
+    )
+    assert resp.status_code == 413
+
+
+def test_index_serves_cached_html(client):
+    """The UI page is served from the copy read at import."""
+    from clarissa.voice import api
+    resp = client.get("/")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/html")
+    assert resp.content == api._INDEX_HTML
+
+
+@pytest.mark.parametrize("upload_type, sent", [
+    ("audio/ogg", ("audio.ogg", "audio/ogg")),
+    ("audio/webm;codecs=opus", ("audio.webm", "audio/webm")),
+    ("application/octet-stream", ("audio.webm", "audio/webm")),
+])
+def test_upload_forwarded_without_transcoding(client, monkeypatch, upload_type, sent):
+    """Whisper receives the uploaded bytes under a name matching their container."""
+    from clarissa.voice import api
+    received = {}
+
+    class Transcriptions:
+        async def create(self, **kwargs):
+            received.update(kwargs)
+            return type("Result", (), {"text": "help"})()
+
+    class Client:
+        class audio:
+            transcriptions = Transcriptions()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(api, "_openai_client", Client())
+    resp = client.post("/api/voice", files={"audio": ("clip", b"OggS", upload_type)})
+    assert resp.status_code == 200
+    assert received["file"] == (sent[0], b"OggS", sent[1])
+
+
+def test_rule_parser_slots_from_single_scan():
+    """Keywords, layer and time are all picked up by the one keyword scan."""
+    from clarissa.voice.api import IntentType, parse_intent_rules
+    intent = parse_intent_rules("Plot water saturation in layer 4 at day 120, then layer 9")
+    assert intent.type == IntentType.VISUALIZE_PROPERTY
+    assert intent.slots == {"property": "water_saturation", "layer": 4, "time_days": 120}